@@ -3,14 +3,37 @@
 Quick access helper functions
 """
 
-try:
-    from calmjs.parse.factory import ParserUnparserFactory
-except ImportError as e:  # pragma: no cover
-    exc = e
 
-    def import_error(*a, **kw):
-        raise exc
+class _LazyParserUnparser(object):
+    """
+    Defer the construction of the parser/unparser object, along with the
+    import of the parser and unparser modules it is built from, until it
+    is first called or has its attributes accessed, such that modules
+    like sourcemap and vlq may be imported without that startup cost.
+    """
 
-    es5 = import_error
-else:
-    es5 = ParserUnparserFactory('es5', 'pretty_print', 'minify_print')
+    def __init__(self, module_name, *unparser_names):
+        self._args = (module_name,) + unparser_names
+        self._target = None
+
+    def _resolve(self):
+        # a concurrent first access may build this twice, which is
+        # harmless as the results are equivalent.
+        if self._target is None:
+            from calmjs.parse.factory import ParserUnparserFactory
+            self._target = ParserUnparserFactory(*self._args)
+        return self._target
+
+    def __call__(self, *a, **kw):
+        return self._resolve()(*a, **kw)
+
+    def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        return getattr(self._resolve(), attr)
+
+    def __dir__(self):
+        return dir(self._resolve())
+
+
+es5 = _LazyParserUnparser('es5', 'pretty_print', 'minify_print')
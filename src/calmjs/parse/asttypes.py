@@ -26,6 +26,7 @@ from __future__ import unicode_literals
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
+from array import array
 from collections import defaultdict
 from ply.lex import LexToken
 from calmjs.parse.utils import str
@@ -34,6 +35,39 @@ from calmjs.parse.utils import repr_compat
 # This should be nodetypes; asttypes means type of AST, and defining a
 # type for the entire tree is not the scope of what's being defined here
 
+# The positions recorded in the token map of the nodes are packed into a
+# single integer, with this many bits for each of lexpos, lineno and
+# colno.
+POS_BITS = 32
+POS_MASK = (1 << POS_BITS) - 1
+
+
+def pack_pos(lexpos, lineno, colno):
+    """
+    Pack the lexpos, lineno and colno into a single integer.
+    """
+
+    return (lexpos << POS_BITS | lineno) << POS_BITS | colno
+
+
+def unpack_pos(value):
+    """
+    Unpack the integer produced by pack_pos into the (lexpos, lineno,
+    colno) tuple.
+    """
+
+    return (
+        value >> (POS_BITS * 2), value >> POS_BITS & POS_MASK,
+        value & POS_MASK,
+    )
+
+
+# The token map of a node is a flat tuple of the token strings alternated
+# with their packed positions, in the order they were found, with the
+# empty tuple shared by all nodes without any tokens; a dict of token
+# strings to a list of position tuples may also be assigned.
+EMPTY_TOKEN_MAP = ()
+
 
 class Node(object):
     lexpos = lineno = colno = None
@@ -42,13 +76,21 @@ class Node(object):
 
     def __init__(self, children=None):
         self._children_list = [] if children is None else children
-        self._token_map = {}
+        self._token_map = EMPTY_TOKEN_MAP
 
     def getpos(self, s, idx):
         token_map = getattr(self, '_token_map', NotImplemented)
         if token_map is NotImplemented:
             return (None, None, None)
 
+        if isinstance(token_map, tuple):
+            for i in range(0, len(token_map), 2):
+                if token_map[i] == s:
+                    if not idx:
+                        return unpack_pos(token_map[i + 1])
+                    idx -= 1
+            return (0, 0, 0)
+
         token_list = token_map.get(s, [])
         if idx < len(token_list):
             return token_list[idx]
@@ -75,7 +117,7 @@ class Node(object):
         node.
         """
 
-        self._token_map = defaultdict(list)
+        token_map = []
 
         # only do so if the lexer has comments enabled, and that the
         # production at the index actually has a token provided (which
@@ -87,10 +129,14 @@ class Node(object):
         for i, token in enumerate(p):
             if not isinstance(token, str):
                 continue
-            self._token_map[token].append(self.findpos(p, i))
+            token_map.append(token)
+            token_map.append(pack_pos(*self.findpos(p, i)))
 
         for token, i in additional:
-            self._token_map[token].append(self.findpos(p, i))
+            token_map.append(token)
+            token_map.append(pack_pos(*self.findpos(p, i)))
+
+        self._token_map = tuple(token_map)
 
         # the very ugly debugger invocation for locating the special
         # cases that are required
@@ -128,7 +174,7 @@ class Node(object):
             # short-circuit the setpos only
             pos = (token.lexpos, token.lineno, token.colno)
             comment.lexpos, comment.lineno, comment.colno = pos
-            comment._token_map = {token.value: [pos]}
+            comment._token_map = (token.value, pack_pos(*pos))
             comments.append(comment)
 
         if comments:
@@ -148,6 +194,95 @@ class Node(object):
     def children(self):
         return getattr(self, '_children_list', [])
 
+    def __reduce__(self):
+        # the entire tree from this node will be flattened so that the
+        # pickling will neither recurse nor be limited by its depth.
+        return (_rebuild_tree, _reduce_tree(self))
+
+    def __copy__(self):
+        # as __reduce__ is reserved for the entire tree, provide the
+        # standard shallow copy here.
+        result = type(self).__new__(type(self))
+        result.__dict__.update(self.__dict__)
+        return result
+
+
+def _reduce_tree(root):
+    """
+    Flatten the tree starting from the root node into a tuple of the
+    shapes, kinds and values, where the root node will be the first.
+
+    The shapes is a list of the distinct combinations of node class,
+    attribute names and the attribute types (0 for plain values, 1 for
+    a node and 2 for a list of nodes), kinds is an array of the index
+    to the shape of every node, and values is a flat list of all the
+    attribute values of every node, with the nodes being referenced by
+    their index (-1 for None inside a list of nodes).
+    """
+
+    shapes = []
+    shape_ids = {}
+    kinds = array('H')
+    values = []
+    node_ids = {}
+    nodes = []
+
+    def index(node):
+        idx = node_ids.get(id(node))
+        if idx is None:
+            idx = node_ids[id(node)] = len(nodes)
+            nodes.append(node)
+        return idx
+
+    index(root)
+    # nodes will be appended while iterating
+    for node in nodes:
+        keys = []
+        codes = []
+        for key, value in vars(node).items():
+            keys.append(key)
+            if isinstance(value, Node):
+                codes.append(1)
+                values.append(index(value))
+            elif (isinstance(value, list) and value and all(
+                    v is None or isinstance(v, Node) for v in value)):
+                codes.append(2)
+                values.append([-1 if v is None else index(v) for v in value])
+            else:
+                codes.append(0)
+                values.append(
+                    dict(value) if isinstance(value, defaultdict) else value)
+
+        shape = (type(node), tuple(keys), tuple(codes))
+        shape_id = shape_ids.get(shape)
+        if shape_id is None:
+            shape_id = shape_ids[shape] = len(shapes)
+            shapes.append(shape)
+        kinds.append(shape_id)
+
+    return shapes, kinds, values
+
+
+def _rebuild_tree(shapes, kinds, values):
+    """
+    Rebuild the tree from the values produced by _reduce_tree, returning
+    the root node.
+    """
+
+    nodes = [shapes[kind][0].__new__(shapes[kind][0]) for kind in kinds]
+    values = iter(values)
+    for node, kind in zip(nodes, kinds):
+        state = node.__dict__
+        _, keys, codes = shapes[kind]
+        for key, code, value in zip(keys, codes, values):
+            if code == 1:
+                value = nodes[value]
+            elif code == 2:
+                value = [None if i < 0 else nodes[i] for i in value]
+            state[key] = value
+
+    return nodes[0]
+
 
 class Program(Node):
     pass
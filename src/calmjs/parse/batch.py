@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers for parsing a batch of source files across multiple processes.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from functools import partial
+
+from calmjs.parse.exceptions import ECMASyntaxError
+from calmjs.parse.io import read
+from calmjs.parse.parsers import es5
+
+ParseResult = namedtuple('ParseResult', ['path', 'node', 'error'])
+
+
+def parse_path(parser, path, encoding='utf8'):
+    """
+    Parse the file at the provided path with the parser, returning a
+    ParseResult.  Syntax errors will be returned as the error of the
+    result, decorated with the path, instead of being raised.
+    """
+
+    try:
+        node = read(parser, partial(open, path, encoding=encoding))
+    except ECMASyntaxError as e:
+        return ParseResult(path, None, e)
+    return ParseResult(path, node, None)
+
+
+def parse_paths(parser, paths, encoding='utf8'):
+    """
+    The task executed by the worker processes.  Given that the default
+    parser functions acquire their Parser instances from the pool in
+    their module, every worker process will keep a warm Parser instance
+    for reuse across all the tasks assigned to it.
+    """
+
+    return [parse_path(parser, path, encoding) for path in paths]
+
+
+def parse_files(
+        paths, workers=None, parser=None, with_comments=False,
+        ordered=True, chunksize=1, encoding='utf8', executor=None):
+    """
+    Parse the files at the provided paths across a pool of processes,
+    returning a generator that yields a ParseResult for each of the
+    paths.
+
+    Arguments
+
+    paths
+        An iterable of paths to the source files.
+    workers
+        The maximum number of worker processes to use; defaults to the
+        number of processors on the machine.
+    parser
+        The parser function, which must be picklable such that it can be
+        sent to the worker processes.  Defaults to the ES5 parse
+        function.
+    with_comments
+        Passed to the default parser function; ignored if a parser was
+        provided.
+    ordered
+        If True, the results will be yielded in the same order as the
+        paths provided, otherwise they will be yielded in the order of
+        their completion.  Default is True.
+    chunksize
+        The number of paths to send to a worker process for each task.
+        Default is 1.
+    encoding
+        The encoding of the source files.  Default is utf8.
+    executor
+        An existing concurrent.futures.Executor to submit the tasks to,
+        which will not be shut down once done.  If not provided, a
+        ProcessPoolExecutor with the specified workers will be created
+        for the duration of the batch.
+
+    Each ParseResult has the path, the resulting node and the error as
+    its attributes.  Syntax errors encountered for any of the files will
+    not abort the batch; they will be provided as the error attribute of
+    the result, with the message decorated with the path like how the
+    read function in the io module does.
+    """
+
+    if parser is None:
+        parser = partial(es5.parse, with_comments=with_comments)
+    paths = list(paths)
+    chunks = [
+        paths[idx:idx + chunksize]
+        for idx in range(0, len(paths), chunksize)
+    ]
+    owned = executor is None
+    if owned:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    futures = [
+        executor.submit(parse_paths, parser, chunk, encoding)
+        for chunk in chunks
+    ]
+    try:
+        for future in (futures if ordered else as_completed(futures)):
+            for result in future.result():
+                yield result
+    finally:
+        for future in futures:
+            future.cancel()
+        if owned:
+            executor.shutdown()
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""
+Caches for the trees produced by the parsers.
+"""
+
+import logging
+import os
+import pickle
+from collections import namedtuple
+from collections import OrderedDict
+from hashlib import sha256
+from tempfile import mkstemp
+from threading import Lock
+from time import time
+
+from calmjs.parse.utils import generate_tab_names
+
+logger = logging.getLogger(__name__)
+
+CacheStats = namedtuple('CacheStats', [
+    'hits', 'misses', 'evictions', 'entries', 'bytes'])
+
+
+def get_version(_version='unknown'):
+    """
+    Return the version of the installed calmjs.parse distribution.
+    """
+
+    try:
+        from importlib import metadata
+    except ImportError:  # pragma: no cover
+        try:
+            from pkg_resources import get_distribution
+            return get_distribution('calmjs.parse').version
+        except Exception:
+            return _version
+    try:
+        return metadata.version('calmjs.parse')
+    except Exception:  # pragma: no cover
+        return _version
+
+
+class DiskCache(object):
+    """
+    A persistent, content addressed cache for the trees produced by a
+    parse function, where each tree is stored as a pickle inside the
+    provided directory.  The key for every entry is derived from the
+    source text, the with_comments flag, the version of calmjs.parse and
+    the names of the generated lextab and yacctab modules for the
+    grammar of the parse function, such that the entries produced by a
+    different version of calmjs.parse or ply will not be used.
+
+    Entries are written atomically, so that multiple processes may use
+    the same directory at the same time.  Whenever the size of all the
+    entries in the directory exceeds the maximum size, the least
+    recently used entries will be evicted until the total size is under
+    three quarters of the maximum size.  The cache is best-effort; any
+    failure to store an entry is logged and the parsed tree returned.
+
+    Instances are callable with the same signature as the parse
+    function, and a new tree will be returned on every invocation.
+
+    >>> from calmjs.parse.cache import DiskCache
+    >>> cache = DiskCache(path)  # doctest: +SKIP
+    >>> program = cache(u'var a = 1;')  # doctest: +SKIP
+    """
+
+    suffix = '.ast'
+    # the age in seconds after which a temporary file is assumed to be
+    # left behind by a writer that did not complete.
+    stale_age = 60 * 60
+
+    def __init__(
+            self, path, parse=None, max_size=256 * 1024 * 1024,
+            tab_names=None):
+        """
+        Arguments
+
+        path
+            The directory to store the entries in; will be created if
+            it does not already exist.
+        parse
+            The parse function; defaults to the ES5 parse function.
+        max_size
+            The maximum size in bytes for all the entries.  Defaults to
+            256 MiB.
+        tab_names
+            The names of the lextab and yacctab modules for the grammar
+            used by the parse function, as returned by generate_tab_names;
+            defaults to the ones for calmjs.parse.parsers.es5.
+        """
+
+        if parse is None:
+            from calmjs.parse.parsers.es5 import parse
+        if tab_names is None:
+            tab_names = generate_tab_names('calmjs.parse.parsers.es5')
+        self.path = path
+        self.parse = parse
+        self.max_size = max_size
+        self.tab_names = tuple(tab_names)
+        self.version = get_version()
+        self._size = None
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    def key(self, source, with_comments=False):
+        """
+        Return the key for the provided source text.
+        """
+
+        digest = sha256(('%s\0%s\0%s\0%d\0%d\0' % (
+            (self.version,) + self.tab_names + (
+                pickle.HIGHEST_PROTOCOL, bool(with_comments))
+        )).encode('utf8'))
+        digest.update(source.encode('utf8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def _entries(self):
+        # return a list of (mtime, size, path) for every entry.
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith(self.suffix):
+                continue
+            path = os.path.join(self.path, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # removed by something else
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _sweep(self):
+        # remove the stale temporary files.
+        threshold = time() - self.stale_age
+        for name in os.listdir(self.path):
+            if not (name.startswith('.') and name.endswith('.tmp')):
+                continue
+            path = os.path.join(self.path, name)
+            try:
+                if os.stat(path).st_mtime >= threshold:
+                    continue
+            except OSError:
+                continue
+            self._remove(path)
+
+    @property
+    def size(self):
+        """
+        The total size of all the entries, as last tracked.
+        """
+
+        if self._size is None:
+            self._size = sum(entry[1] for entry in self._entries())
+        return self._size
+
+    def evict(self, target=None):
+        """
+        Evict the least recently used entries until the total size is
+        under the target size; defaults to three quarters of the maximum
+        size.  The stale temporary files are also removed.
+        """
+
+        self._sweep()
+        if target is None:
+            target = self.max_size * 3 // 4
+        entries = sorted(self._entries())
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            self._remove(path)
+            size -= entry_size
+        self._size = size
+
+    def clear(self):
+        """
+        Remove all the entries.
+        """
+
+        self.evict(0)
+
+    def _remove(self, path):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    def load(self, key):
+        """
+        Return the tree stored for the key, or None if not available.
+        """
+
+        path = os.path.join(self.path, key + self.suffix)
+        try:
+            with open(path, 'rb') as fd:
+                node = pickle.load(fd)
+        except (IOError, OSError):
+            return None
+        except Exception:
+            # treat any corrupted entry as missing.
+            self._remove(path)
+            return None
+
+        try:
+            # mark as recently used for the eviction.
+            os.utime(path, None)
+        except OSError:
+            pass
+        return node
+
+    def store(self, key, node):
+        """
+        Store the tree for the key.
+        """
+
+        fd, tmp_path = mkstemp(prefix='.', suffix='.tmp', dir=self.path)
+        try:
+            with os.fdopen(fd, 'wb') as stream:
+                pickle.dump(node, stream, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, os.path.join(self.path, key + self.suffix))
+        except Exception:
+            self._remove(tmp_path)
+            raise
+
+        # other processes may be writing to the same directory, so the
+        # size is always tallied again before deciding whether to evict.
+        self._size = None
+        if self.size > self.max_size:
+            self.evict()
+
+    def __call__(self, source, with_comments=False):
+        if not isinstance(source, str):
+            # let the parse function deal with the invalid type.
+            return self.parse(source, with_comments=with_comments)
+
+        key = self.key(source, with_comments)
+        node = self.load(key)
+        if node is None:
+            node = self.parse(source, with_comments=with_comments)
+            try:
+                self.store(key, node)
+            except Exception:
+                logger.warning(
+                    'failed to store the tree into the cache at %r',
+                    self.path, exc_info=True)
+        return node
+
+
+class MemoryCache(object):
+    """
+    A bounded, in-memory least recently used cache for the trees
+    produced by a parse function, keyed by the source text and the
+    with_comments flag.
+
+    Unlike the DiskCache, the same tree will be returned for the same
+    source text, so the trees returned must be treated as read-only;
+    this is intended for use by the unparser functions which do not
+    modify the trees they are provided with.
+
+    The hits, misses and evictions are tracked, along with the total
+    size in bytes of the source text (when encoded as utf8) for the
+    entries currently held, which is proportional to the memory used
+    by their trees.  Instances may be safely shared across threads.
+
+    >>> from calmjs.parse.cache import MemoryCache
+    >>> from calmjs.parse.parsers.es5 import parse
+    >>> cache = MemoryCache(parse, size=2)
+    >>> cache(u'var a;') is cache(u'var a;')
+    True
+    >>> cache.stats()
+    CacheStats(hits=1, misses=1, evictions=0, entries=1, bytes=6)
+    """
+
+    def __init__(self, parse, size=128):
+        """
+        Arguments
+
+        parse
+            The parse function.
+        size
+            The maximum number of trees to keep.  Defaults to 128.
+        """
+
+        self.parse = parse
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._lock = Lock()
+
+    def stats(self):
+        """
+        Return the statistics as a CacheStats tuple.
+        """
+
+        with self._lock:
+            return CacheStats(
+                self.hits, self.misses, self.evictions, len(self.entries),
+                self.bytes,
+            )
+
+    def clear(self):
+        """
+        Remove all the entries and reset the statistics.
+        """
+
+        with self._lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = self.bytes = 0
+
+    def __call__(self, source, with_comments=False):
+        key = (source, bool(with_comments))
+        with self._lock:
+            try:
+                node = self.entries[key][0]
+            except (KeyError, TypeError):
+                # TypeError for unhashable source, which the parse
+                # function will report.
+                self.misses += 1
+            else:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return node
+
+        # parse outside of the lock, such that other threads are not
+        # blocked; if the same source is being parsed by another thread
+        # the last one stored wins.
+        node = self.parse(source, with_comments=with_comments)
+        size = len(source.encode('utf8', 'surrogatepass'))
+        with self._lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self.entries[key] = (node, size)
+            self.bytes += size
+            while len(self.entries) > self.size:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+        return node
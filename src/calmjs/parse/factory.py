@@ -11,6 +11,16 @@ from calmjs.parse import asttypes
 PKGNAME = 'calmjs.parse'  # should derive this.
 
 
+def resolve(name):
+    """
+    Return the object referenced by the fully qualified name, which is
+    the dotted module path followed by the attribute name.
+    """
+
+    module_name, attr = name.rsplit('.', 1)
+    return getattr(import_module(module_name), attr)
+
+
 class SRFactory(object):
     """
     A factory that will generate a new subclass that has the specified
@@ -18,9 +28,13 @@ class SRFactory(object):
     nodes that a given AST might have, tagging the custom str/repr
     on the class definition itself will only happen once, saving the
     cost of having to allocate all those references per object.
+
+    If the fully qualified name of where the factory instance will be
+    made available is provided, the generated classes (along with their
+    instances) may be pickled by reference through that name.
     """
 
-    def __init__(self, module, str_, repr_):
+    def __init__(self, module, str_, repr_, name=None):
         # recreate the class definitions
         def __str__(self):
             return str_(self)
@@ -28,16 +42,32 @@ class SRFactory(object):
         def __repr__(self):
             return repr_(self)
 
-        self.module = module
-        self.classes = {c.__name__: c for c in (
-            type(cls.__name__, (cls,), {
+        def attrs(cls):
+            result = {
                 '__repr__': __repr__,
                 '__str__': __str__,
-            }) for cls in (
+            }
+            if name:
+                module_name, attr = name.rsplit('.', 1)
+                result['__module__'] = module_name
+                result['__qualname__'] = attr + '.' + cls.__name__
+            return result
+
+        self.module = module
+        self.name = name
+        self.classes = {c.__name__: c for c in (
+            type(cls.__name__, (cls,), attrs(cls)) for cls in (
                 v for v in vars(module).values() if isinstance(v, type)
             )
         )}
 
+    def __reduce__(self):
+        if not self.name:
+            raise TypeError(
+                "cannot pickle '%s' instance without a name" %
+                type(self).__name__)
+        return (resolve, (self.name,))
+
     def __getattr__(self, attr):
         if attr not in self.classes:
             raise AttributeError('%s "%s" has no attribute %r' % (
@@ -52,16 +82,23 @@ class SRFactory(object):
 AstTypesFactory = partial(SRFactory, asttypes)
 
 
-def RawParserUnparserFactory(parser_name, parse_callable, *unparse_callables):
+def RawParserUnparserFactory(
+        parser_name, parse_callable, *unparse_callables, cache_size=None):
     """
     Produces a callable object that also has callable attributes that
     passes its first argument to the parent callable.
+
+    If a cache_size is provided, the trees produced for the unparse
+    callables will be kept in a MemoryCache of that size, which will
+    be available as the cache attribute on the object, such that the
+    same source text will only be parsed once when it is unparsed in
+    multiple ways.  The object itself will always return a new tree.
     """
 
     def build_unparse(f):
         @wraps(f)
         def unparse(self, source, *a, **kw):
-            node = parse_callable(
+            node = (parse_callable if self.cache is None else self.cache)(
                 source,
                 with_comments=kw.pop('with_comments', False),
             )
@@ -85,15 +122,22 @@ def RawParserUnparserFactory(parser_name, parse_callable, *unparse_callables):
     callables = {f.__name__: build_unparse(f) for f in unparse_callables}
     callables['__call__'] = build_parse(parse_callable)
     callables['__module__'] = PKGNAME
-    return type(parser_name, (object,), callables)()
+    callables['cache'] = None
+    result = type(parser_name, (object,), callables)()
+    if cache_size:
+        from calmjs.parse.cache import MemoryCache
+        result.cache = MemoryCache(parse_callable, cache_size)
+    return result
 
 
-def ParserUnparserFactory(module_name, *unparser_names):
+def ParserUnparserFactory(module_name, *unparser_names, cache_size=None):
     """
-    Produce a new parser/unparser object from the names provided.
+    Produce a new parser/unparser object from the names provided, with
+    an optional cache_size for the trees used by the unparsers.
     """
 
     parse_callable = import_module(PKGNAME + '.parsers.' + module_name).parse
     unparser_module = import_module(PKGNAME + '.unparsers.' + module_name)
     return RawParserUnparserFactory(module_name, parse_callable, *[
-        getattr(unparser_module, name) for name in unparser_names])
+        getattr(unparser_module, name) for name in unparser_names
+    ], cache_size=cache_size)
@@ -0,0 +1,513 @@
+# -*- coding: utf-8 -*-
+"""
+A flat, column oriented store for the trees produced by the parsers.
+"""
+
+from array import array
+from bisect import bisect_right
+
+from calmjs.parse.asttypes import Node
+from calmjs.parse.asttypes import pack_pos
+from calmjs.parse.asttypes import unpack_pos
+
+# the codes for how the attributes of the nodes are stored in fields.
+PLAIN = 0
+NODE = 1
+NODES = 2
+TOKENS = 3
+
+# the attributes that have their own columns.
+POSITIONS = ('lexpos', 'lineno', 'colno')
+
+# the names of all the array columns.
+COLUMNS = (
+    'kind', 'parent', 'first_child', 'next_sibling', 'field_start',
+    'fields', 'token_value', 'lexpos', 'token_lexpos',
+)
+# the columns for the positions which are only present when they cannot
+# be derived from lines.
+LINE_COLUMNS = ('lineno', 'colno', 'token_lineno', 'token_colno')
+
+
+class FlatTree(object):
+    """
+    A tree of nodes stored as a set of arrays of integers indexed by the
+    node id, with the root node having the id 0.  The columns are:
+
+    kind
+        The index into shapes for the node, where each shape is a tuple
+        of the node class, the names of the attributes and the codes for
+        how they are stored.
+    parent, first_child, next_sibling
+        The structure of the tree as produced by the children method of
+        every node (skipping any None), with -1 for no such node.
+    field_start, fields
+        The encoded attributes of every node, which start at the offset
+        in fields at field_start; nodes are stored as their ids, lists
+        of nodes as the offset and length of their ids in fields, token
+        maps as the offset and length into the token columns, and
+        everything else as the index into values.
+    token_value
+        The tokens of the token maps of every node, as the index of the
+        string into values.
+    lexpos, token_lexpos
+        The lexpos of every node and token, with -1 for None.
+
+    The values list holds every distinct value for the attributes that
+    are not nodes (e.g. the strings for identifiers).
+
+    The lineno and colno for the nodes and tokens are derived from the
+    lexpos using lines, which holds the lexpos of the start of every
+    line.  Should the positions of the tree be inconsistent with each
+    other, the lines will be None and the positions will be stored as
+    the lineno, colno, token_lineno and token_colno columns instead.
+
+    Instances should be created using the flatten function.  Pickling
+    an instance will simply copy the arrays.  Individual nodes may be
+    accessed as a FlatNode through the node method; the original Node
+    may be rebuilt using the to_node method.
+    """
+
+    def __init__(self, shapes, values, columns):
+        self.shapes = shapes
+        self.values = values
+        for name in COLUMNS:
+            setattr(self, name, columns[name])
+        self.lines = columns.get('lines')
+        for name in LINE_COLUMNS:
+            setattr(self, name, columns.get(name))
+
+    def __reduce__(self):
+        names = COLUMNS + (
+            ('lines',) if self.lines is not None else LINE_COLUMNS)
+        return (type(self), (self.shapes, self.values, {
+            name: getattr(self, name) for name in names}))
+
+    def __len__(self):
+        return len(self.kind)
+
+    def _position(self, lexpos, lineno, colno, idx):
+        pos = lexpos[idx]
+        if self.lines is None:
+            return tuple(
+                None if value < 0 else value
+                for value in (pos, lineno[idx], colno[idx])
+            )
+        if pos < 0:
+            return (None, None, None)
+        line = bisect_right(self.lines, pos)
+        return (pos, line, pos - self.lines[line - 1] + 1)
+
+    def position(self, index):
+        """
+        Return the (lexpos, lineno, colno) for the node id.
+        """
+
+        return self._position(self.lexpos, self.lineno, self.colno, index)
+
+    def token_position(self, offset):
+        """
+        Return the (lexpos, lineno, colno) for the token at the offset.
+        """
+
+        return self._position(
+            self.token_lexpos, self.token_lineno, self.token_colno, offset)
+
+    def node(self, index=0):
+        """
+        Return the FlatNode for the node id.
+        """
+
+        return FlatNode(self, index)
+
+    def node_type(self, index):
+        """
+        Return the class of the node at the node id.
+        """
+
+        return self.shapes[self.kind[index]][0]
+
+    def children(self, index):
+        """
+        Return the list of ids of the children of the node id.
+        """
+
+        result = []
+        next_sibling = self.next_sibling
+        child = self.first_child[index]
+        while child >= 0:
+            result.append(child)
+            child = next_sibling[child]
+        return result
+
+    def walk(self, index=0):
+        """
+        Yield the ids of every descendant of the node id in the same
+        order as the walk function in the walkers module, without any
+        recursion.
+        """
+
+        first_child = self.first_child
+        next_sibling = self.next_sibling
+        parent = self.parent
+        current = first_child[index]
+        while current >= 0:
+            yield current
+            if first_child[current] >= 0:
+                current = first_child[current]
+                continue
+            while next_sibling[current] < 0:
+                current = parent[current]
+                if current == index:
+                    return
+            current = next_sibling[current]
+
+    def _decode(self, code, offset):
+        fields = self.fields
+        if code == PLAIN:
+            return self.values[fields[offset]], 1
+        elif code == NODE:
+            return fields[offset], 1
+        elif code == NODES:
+            start = fields[offset]
+            return fields[start:start + fields[offset + 1]].tolist(), 2
+        else:
+            start = fields[offset]
+            return range(start, start + fields[offset + 1]), 2
+
+    def attrs(self, index):
+        """
+        Return a list of (name, code, value) for the attributes of the
+        node id, where the values for nodes are their ids, lists of
+        nodes as a list of ids (with -1 for None), and token maps as the
+        range of their offsets in the token columns.
+        """
+
+        _, keys, codes = self.shapes[self.kind[index]]
+        offset = self.field_start[index]
+        result = []
+        for key, code in zip(keys, codes):
+            value, size = self._decode(code, offset)
+            offset += size
+            result.append((key, code, value))
+        return result
+
+    def getpos(self, index, s, idx):
+        """
+        Equivalent to the Node.getpos method for the node id.
+        """
+
+        for key, code, value in self.attrs(index):
+            if code == TOKENS:
+                break
+        else:
+            return (0, 0, 0)
+        values = self.values
+        for offset in value:
+            if values[self.token_value[offset]] == s:
+                if not idx:
+                    return self.token_position(offset)
+                idx -= 1
+        return (0, 0, 0)
+
+    def to_node(self, index=0):
+        """
+        Rebuild the Node for the node id, along with all the nodes that
+        it references.
+        """
+
+        nodes = {}
+        pending = [index]
+
+        def get(idx):
+            if idx < 0:
+                return None
+            if idx not in nodes:
+                cls = self.node_type(idx)
+                nodes[idx] = cls.__new__(cls)
+                pending.append(idx)
+            return nodes[idx]
+
+        get(index)
+        pending.pop()
+        pending.append(index)
+        while pending:
+            idx = pending.pop()
+            state = nodes[idx].__dict__
+            for key, code, value in self.attrs(idx):
+                if code == NODE:
+                    value = get(value)
+                elif code == NODES:
+                    value = [get(i) for i in value]
+                elif code == TOKENS:
+                    tokens = []
+                    for offset in value:
+                        tokens.append(self.values[self.token_value[offset]])
+                        tokens.append(pack_pos(*self.token_position(offset)))
+                    value = tuple(tokens)
+                state[key] = value
+            for key, value in zip(POSITIONS, self.position(idx)):
+                if value is not None:
+                    state[key] = value
+        return nodes[index]
+
+
+class FlatNode(object):
+    """
+    A light view of a node inside a FlatTree, which provides read-only
+    access to the attributes of the node it was built from, with any
+    nodes referenced also provided as views.
+    """
+
+    __slots__ = ('tree', 'index')
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    def _view(self, index):
+        return None if index < 0 else FlatNode(self.tree, index)
+
+    @property
+    def node_type(self):
+        return self.tree.node_type(self.index)
+
+    @property
+    def parent(self):
+        return self._view(self.tree.parent[self.index])
+
+    @property
+    def lexpos(self):
+        return self.tree.position(self.index)[0]
+
+    @property
+    def lineno(self):
+        return self.tree.position(self.index)[1]
+
+    @property
+    def colno(self):
+        return self.tree.position(self.index)[2]
+
+    def __getattr__(self, attr):
+        for key, code, value in self.tree.attrs(self.index):
+            if key != attr:
+                continue
+            if code == NODE:
+                return self._view(value)
+            elif code == NODES:
+                return [self._view(idx) for idx in value]
+            elif code == TOKENS:
+                break
+            return value
+        raise AttributeError('%r has no attribute %r' % (self, attr))
+
+    def children(self):
+        return [self._view(idx) for idx in self.tree.children(self.index)]
+
+    def __iter__(self):
+        return iter(self.children())
+
+    def getpos(self, s, idx):
+        return self.tree.getpos(self.index, s, idx)
+
+    def to_node(self):
+        return self.tree.to_node(self.index)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, FlatNode) and self.tree is other.tree and
+            self.index == other.index
+        )
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((id(self.tree), self.index))
+
+    def __repr__(self):
+        return '<%s %s #%d>' % (
+            type(self).__name__, self.node_type.__name__, self.index)
+
+
+def flatten(root):
+    """
+    Store the tree starting from the root node into a new FlatTree.
+    The ids are assigned in the same order as the walk function in the
+    walkers module, followed by any nodes that are only referenced by
+    the attributes.  Every node may only appear once inside the tree,
+    as otherwise a ValueError will be raised.
+
+    >>> from calmjs.parse import es5
+    >>> from calmjs.parse.flat import flatten
+    >>> tree = flatten(es5(u'var a = 1;'))
+    >>> len(tree)
+    5
+    >>> node = tree.node(0).children()[0].children()[0]
+    >>> node
+    <FlatNode VarDecl #2>
+    >>> print(node.identifier.value)
+    a
+    """
+
+    shapes = []
+    shape_ids = {}
+    values = []
+    value_ids = {}
+    columns = {name: array('H' if name == 'kind' else 'i') for name in COLUMNS}
+    kind = columns['kind']
+    parent = columns['parent']
+    first_child = columns['first_child']
+    next_sibling = columns['next_sibling']
+    field_start = columns['field_start']
+    fields = columns['fields']
+    token_value = columns['token_value']
+    # the lineno and colno for the nodes and the tokens, which will be
+    # discarded if they can be derived from the lines.
+    lines = {}
+    line_columns = {name: array('i') for name in LINE_COLUMNS}
+    node_positions = (
+        columns['lexpos'], line_columns['lineno'], line_columns['colno'])
+    token_positions = (
+        columns['token_lexpos'], line_columns['token_lineno'],
+        line_columns['token_colno'])
+    node_ids = {}
+    nodes = []
+
+    def index(node):
+        idx = node_ids.get(id(node))
+        if idx is not None:
+            return idx
+        # assign the ids for every node of the subtree in preorder,
+        # such that the ids of a subtree will be contiguous.
+        idx = len(nodes)
+        last_child = {}
+        stack = [(node, -1)]
+        while stack:
+            current, parent_idx = stack.pop()
+            if id(current) in node_ids:
+                raise ValueError(
+                    'node %r appears more than once in the tree' % current)
+            current_idx = node_ids[id(current)] = len(nodes)
+            nodes.append(current)
+            parent.append(parent_idx)
+            first_child.append(-1)
+            next_sibling.append(-1)
+            if parent_idx >= 0:
+                if parent_idx in last_child:
+                    next_sibling[last_child[parent_idx]] = current_idx
+                else:
+                    first_child[parent_idx] = current_idx
+                last_child[parent_idx] = current_idx
+            stack.extend(
+                (child, current_idx) for child in reversed(current.children())
+                if child is not None
+            )
+        return idx
+
+    def value_id(value):
+        try:
+            key = (type(value), value)
+            idx = value_ids.get(key)
+        except TypeError:
+            # unhashable values are simply stored.
+            key = idx = None
+        if idx is None:
+            idx = len(values)
+            values.append(value)
+            if key is not None:
+                value_ids[key] = idx
+        return idx
+
+    def add_position(columns, pos):
+        for column, value in zip(columns, pos):
+            column.append(-1 if value is None else value)
+        lexpos, lineno, colno = pos
+        if lexpos is None and lineno is None and colno is None:
+            return
+        if None in pos:
+            # not derivable.
+            lines[None] = None
+            return
+        start = lexpos - colno + 1
+        if lines.setdefault(lineno, start) != start:
+            lines[None] = None
+
+    index(root)
+    # nodes only referenced by the attributes (e.g. comments) will be
+    # appended while iterating.
+    for idx, node in enumerate(nodes):
+        keys = []
+        codes = []
+        # the fields for the lists of nodes are appended after the
+        # fields of the node itself.
+        lists = []
+        field_start.append(len(fields))
+        state = vars(node)
+        for key, value in state.items():
+            if key in POSITIONS:
+                continue
+            keys.append(key)
+            if isinstance(value, Node):
+                codes.append(NODE)
+                fields.append(index(value))
+            elif isinstance(value, list) and all(
+                    v is None or isinstance(v, Node) for v in value):
+                codes.append(NODES)
+                lists.append((len(fields), value))
+                fields.extend((0, len(value)))
+            elif key == '_token_map' and isinstance(value, tuple):
+                codes.append(TOKENS)
+                fields.extend((len(token_value), len(value) // 2))
+                for token, pos in zip(value[::2], value[1::2]):
+                    token_value.append(value_id(token))
+                    add_position(token_positions, unpack_pos(pos))
+            else:
+                codes.append(PLAIN)
+                fields.append(value_id(value))
+        for offset, value in lists:
+            fields[offset] = len(fields)
+            fields.extend(-1 if v is None else index(v) for v in value)
+
+        add_position(node_positions, (node.lexpos, node.lineno, node.colno))
+
+        shape = (type(node), tuple(keys), tuple(codes))
+        shape_id = shape_ids.get(shape)
+        if shape_id is None:
+            shape_id = shape_ids[shape] = len(shapes)
+            shapes.append(shape)
+        kind.append(shape_id)
+
+    tree = FlatTree(shapes, values, columns)
+    if None not in lines and _derive_lines(tree, lines, line_columns):
+        return tree
+    for name in LINE_COLUMNS:
+        setattr(tree, name, line_columns[name])
+    return tree
+
+
+def _derive_lines(tree, lines, line_columns):
+    # fill in the lines from the starts found for every lineno, where
+    # the lines without a start will use the start of the following
+    # line such that they will never be found; then ensure that every
+    # position may be derived from the lines.
+    if lines and min(lines) < 1:
+        return False
+    starts = array('i', [-1]) * max(lines or [0])
+    following = None
+    for lineno in range(len(starts), 0, -1):
+        following = lines.get(lineno, following)
+        starts[lineno - 1] = following
+    tree.lines = starts
+    for lexpos, lineno, colno in (
+            ('lexpos', 'lineno', 'colno'),
+            ('token_lexpos', 'token_lineno', 'token_colno')):
+        lexpos = getattr(tree, lexpos)
+        lineno = line_columns[lineno]
+        colno = line_columns[colno]
+        for idx, pos in enumerate(lexpos):
+            if pos >= 0 and tree._position(
+                    lexpos, None, None, idx) != (pos, lineno[idx], colno[idx]):
+                tree.lines = None
+                return False
+    return True
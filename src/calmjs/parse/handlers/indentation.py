@@ -34,6 +34,13 @@ class Indentator(object):
             provided by the dispatcher.
         """
         self.indent_str = indent_str
+        self.reset()
+
+    def reset(self):
+        """
+        Reset the indentation level, for the reuse of this instance.
+        """
+
         self._level = 0
 
     def layout_handler_indent(self, dispatcher, node, before, after, prev):
@@ -96,5 +103,7 @@ def indent(indent_str=None):
             OpenBlock: layout_handler_openbrace,
             CloseBlock: layout_handler_closebrace,
             EndStatement: layout_handler_semicolon,
-        }}
+        }, 'reset_hooks': [
+            inst.reset,
+        ]}
     return indentation_rule
@@ -396,13 +396,23 @@ class Obfuscator(object):
             empty tuple.
         """
 
+        self.obfuscate_globals = obfuscate_globals
+        self.shadow_funcname = shadow_funcname
+        self.reserved_keywords = reserved_keywords
+        # the dispatcher used by the walk, and the one it was built for.
+        self._dispatchers = (None, None)
+        self.reset()
+
+    def reset(self):
+        """
+        Reset the scopes and the identifiers that were tracked, for the
+        reuse of this instance.
+        """
+
         # this is a mapping of Identifier nodes to the scope
         self.identifiers = {}
         self.scopes = {}
         self.stack = []
-        self.obfuscate_globals = obfuscate_globals
-        self.shadow_funcname = shadow_funcname
-        self.reserved_keywords = reserved_keywords
         # global scope is in the ether somewhere so it isn't exactly
         # bounded to any specific node that gets passed in.
         self.global_scope = Scope(None)
@@ -476,6 +486,9 @@ class Obfuscator(object):
         details that are required.
         """
 
+        if self._dispatchers[0] is dispatcher:
+            return list(walk(self._dispatchers[1], node))
+
         deferrable_handlers = {
             Declare: self.declare,
             Resolve: self.register_reference,
@@ -500,6 +513,7 @@ class Obfuscator(object):
             layout_handlers=layout_handlers,
             deferrable_handlers=deferrable_handlers,
         )
+        self._dispatchers = (dispatcher, local_dispatcher)
         return list(walk(local_dispatcher, node))
 
     def finalize(self):
@@ -555,5 +569,8 @@ def obfuscate(
             'prewalk_hooks': [
                 inst.prewalk_hook,
             ],
+            'reset_hooks': [
+                inst.reset,
+            ],
         }
     return name_obfuscation_rules
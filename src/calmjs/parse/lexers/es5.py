@@ -28,8 +28,12 @@ __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
 import re
 import ply.lex
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
 
 from calmjs.parse.lexers.tokens import AutoLexToken
+from calmjs.parse.lexers.tokens import TokenTable
 from calmjs.parse.utils import repr_compat
 from calmjs.parse.exceptions import (
     ECMASyntaxError,
@@ -80,10 +84,24 @@ COMMENTS = frozenset([
 
 PATT_LINE_TERMINATOR_SEQUENCE = re.compile(
     r'(\n|\r(?!\n)|\u2028|\u2029|\r\n)', flags=re.S)
+# the line terminators that are never ignored, such that the starting
+# offsets of all lines may be computed from the entire text up front.
+PATT_LINE_BREAK = re.compile(r'\r\n|\r|\n')
+# the remaining line terminators, which are ignored like whitespaces,
+# unless they are found inside a token (e.g. a comment).
+PATT_LINE_SEPARATOR = re.compile('[\u2028\u2029]')
 PATT_LINE_CONTINUATION = re.compile(
     r'\\(\n|\r(?!\n)|\u2028|\u2029|\r\n)', flags=re.S)
 
 
+# the default number of characters to read for each chunk of a stream.
+STREAM_CHUNK_SIZE = 65536
+# the number of characters that must follow a token within the window
+# of a stream for the token to be considered complete, as the rules for
+# the numbers, punctuators and the getter/setter may need to look ahead
+# by up to this many characters.
+STREAM_GUARD = 4
+
 PATT_BROKEN_STRING = re.compile(r"""
 (?:
     # broken double quoted string
@@ -137,7 +155,7 @@ def broken_string_token_handler(lexer, token):
         raise ECMASyntaxError(
             "Invalid %s escape sequence '%s' at %s:%s" % (
                 type_, seq, lexer.lineno,
-                lexer._get_colno_lexpos(position)
+                lexer._get_colno_lexpos(position + lexer.lexdata_offset)
             )
         )
     tl = 16  # truncate length
@@ -188,24 +206,16 @@ class Lexer(object):
     For more information see:
     http://www.ecma-international.org/publications/files/ECMA-ST/ECMA-262.pdf
     """
-    def __init__(self, with_comments=False, yield_comments=False):
+    def __init__(self, with_comments=False, yield_comments=False, **kwargs):
+        # any remaining keyword arguments are passed to build.
         self.lexer = None
-        self.prev_token = None
-        # valid_prev_token is for syntax error hint, and also for
-        # tracking real tokens
-        self.valid_prev_token = None
-        self.cur_token = None
-        self.cur_token_real = None
-        self.next_tokens = []
-        self.token_stack = [[None, []]]
-        self.newline_idx = [0]
         self.error_token_handlers = [
             broken_string_token_handler,
         ]
         self.with_comments = with_comments
         self.yield_comments = yield_comments
-        self.hidden_tokens = []
-        self.build()
+        self.reset()
+        self.build(**kwargs)
 
         if not with_comments:
             # just reassign the method.
@@ -217,34 +227,210 @@ class Lexer(object):
 
     @property
     def lexpos(self):
-        return self.lexer.lexpos if self.lexer else 0
+        return self.lexer.lexpos + self.lexdata_offset if self.lexer else 0
 
     @property
     def last_newline_lexpos(self):
-        return self.newline_idx[-1]
+        return self.newline_idx[self.lineno - 1]
 
     def build(self, **kwargs):
         """Build the lexer."""
         self.lexer = ply.lex.lex(object=self, **kwargs)
 
+    def reset(self):
+        """
+        Reset all states that were tracked for the current input, such
+        that this instance may be reused for lexing a new input without
+        having to rebuild the underlying ply lexer.
+        """
+
+        self.prev_token = None
+        # valid_prev_token is for syntax error hint, and also for
+        # tracking real tokens
+        self.valid_prev_token = None
+        self.cur_token = None
+        self.cur_token_real = None
+        self.next_tokens = []
+        self.token_stack = [[None, []]]
+        # the starting offsets of every line, which are computed from
+        # the text provided up front.
+        self.newline_idx = array('l', [0])
+        self.newline_scanned = 0
+        self.line_separators = False
+        self.hidden_tokens = []
+        # the position of the start of the lexdata within the input, as
+        # the data that has been consumed from a stream is discarded.
+        self.lexdata_offset = 0
+        self.stream = None
+        self.stream_eof = False
+        self.__dict__.pop('get_lexer_token', None)
+
+        if self.lexer:
+            # also drop the reference to the previous input.
+            self.lexer.input('')
+            self.lexer.lineno = 1
+            self.lexer.lexstatestack = []
+            self.lexer.begin('INITIAL')
+
     def input(self, text):
+        self.reset()
         self.lexer.input(text)
+        self._scan_newlines(text, 0, len(text))
+
+    def _scan_newlines(self, text, start, end):
+        # record the starting offsets of the lines for the text between
+        # start and end in a single pass, with the offset of the text
+        # within the input applied.
+        offset = self.lexdata_offset
+        self.newline_idx.extend(
+            offset + match.end()
+            for match in PATT_LINE_BREAK.finditer(text, start, end)
+        )
+        self.newline_scanned = offset + end
+        if not self.line_separators:
+            self.line_separators = bool(
+                PATT_LINE_SEPARATOR.search(text, start, end))
 
     def _update_newline_idx(self, token):
-        lexpos = token.lexpos
-        fragments = PATT_LINE_TERMINATOR_SEQUENCE.split(token.value)
-        for fragment, newline in zip(*[iter(fragments)] * 2):
-            lexpos += len(fragment + newline)
-            self.lexer.lineno += 1
-            self.newline_idx.append(lexpos)
+        # advance the lineno of the lexer to the line at the end of the
+        # token, which is only looked up if the token spans lines.
+        newline_idx = self.newline_idx
+        lexer = self.lexer
+        end = token.lexpos + len(token.value)
+        if self.line_separators:
+            # these are only line terminators inside a token.
+            for match in PATT_LINE_SEPARATOR.finditer(token.value):
+                lexpos = token.lexpos + match.end()
+                idx = bisect_left(newline_idx, lexpos)
+                if idx == len(newline_idx) or newline_idx[idx] != lexpos:
+                    newline_idx.insert(idx, lexpos)
+        if lexer.lineno < len(newline_idx) and (
+                newline_idx[lexer.lineno] <= end):
+            lexer.lineno = bisect_right(newline_idx, end)
+
+    def lookup_position(self, lexpos):
+        """
+        Look up the lineno and colno for the lexpos, for a position that
+        has already been lexed.
+        """
+
+        lineno = bisect_right(self.newline_idx, lexpos)
+        return lineno, lexpos - self.newline_idx[lineno - 1] + 1
 
     def get_lexer_token(self):
         token = self.lexer.token()
         if token:
+            token.lexpos += self.lexdata_offset
             token.colno = self._get_colno(token)
             self._update_newline_idx(token)
         return token
 
+    def tokenize_stream(self, stream, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Return a generator that yields the tokens from the provided
+        stream, which is read in chunks of the provided size, such that
+        only a window of the stream around the current token is kept in
+        memory (along with the index of the newlines), rather than the
+        entire source text.  The positions of the tokens produced are
+        relative to the start of the stream, and are identical to the
+        ones that would be produced from the entire text.
+
+        >>> from io import StringIO
+        >>> lexer = Lexer()
+        >>> stream = StringIO('a = 1;\\nb = a;')
+        >>> [str(t.value) for t in lexer.tokenize_stream(stream, 4)]
+        ['a', '=', '1', ';', 'b', '=', 'a', ';']
+        """
+
+        self.reset()
+        self.stream = stream
+        self.stream_chunk_size = chunk_size
+        # shadow the method with the one that manages the window.
+        self.get_lexer_token = self._get_stream_token
+        try:
+            self._fill_stream(chunk_size)
+            while True:
+                token = self.token()
+                if not token:
+                    break
+                yield token
+        finally:
+            # only clean up if this instance was not reset for another
+            # input while the generator was suspended.
+            if self.stream is stream:
+                self.stream = None
+                self.__dict__.pop('get_lexer_token', None)
+
+    def _fill_stream(self, size):
+        # discard the consumed data from the window, and read from the
+        # stream until the window has at least size characters after
+        # the current position, or until the stream is exhausted.
+        lexer = self.lexer
+        lexpos = lexer.lexpos
+        lexdata = lexer.lexdata
+        chunks = [lexdata[lexpos:]]
+        remaining = len(chunks[0])
+        while not self.stream_eof:
+            if remaining >= size:
+                # the lexer checks the character after the first one
+                # that is not a space or tab to disambiguate a slash,
+                # so ensure that it is also available.
+                idx = len(lexdata) - 2
+                while idx >= lexpos and lexdata[idx] in ' \t':
+                    idx -= 1
+                if idx >= lexpos:
+                    break
+                size = remaining * 2
+            chunk = self.stream.read(max(size - remaining, 1))
+            if not chunk:
+                self.stream_eof = True
+                break
+            chunks.append(chunk)
+            remaining += len(chunk)
+            lexdata = ''.join(chunks)
+            chunks = [lexdata]
+            lexpos = 0
+        self.lexdata_offset += lexer.lexpos
+        lexer.input(chunks[0])
+        # a trailing carriage return may be followed by a line feed.
+        end = len(chunks[0])
+        if not self.stream_eof and chunks[0][-1:] == '\r':
+            end -= 1
+        self._scan_newlines(
+            chunks[0], self.newline_scanned - self.lexdata_offset, end)
+
+    def _get_stream_token(self):
+        lexer = self.lexer
+        get_lexer_token = type(self).get_lexer_token
+        while True:
+            lexpos = lexer.lexpos
+            lineno = lexer.lineno
+            try:
+                token = get_lexer_token(self)
+            except Exception:
+                if self.stream_eof:
+                    raise
+                # the error may be caused by an incomplete token, which
+                # may also trip up the error handlers.
+                token = None
+            else:
+                if self.stream_eof or not (token is None or (
+                        lexer.lexpos + STREAM_GUARD > lexer.lexlen) or (
+                        # an incomplete block comment
+                        token.type == 'DIV' and
+                        lexer.lexdata[lexer.lexpos:lexer.lexpos + 1] == '*')):
+                    break
+            # rewind and try again with a larger window.
+            lexer.lexpos = lexpos
+            lexer.lineno = lineno
+            self._fill_stream(
+                max(lexer.lexlen - lexpos, self.stream_chunk_size) * 2)
+
+        if not self.stream_eof and (
+                lexer.lexlen - lexer.lexpos < self.stream_chunk_size):
+            self._fill_stream(self.stream_chunk_size * 2)
+        return token
+
     def backtracked_token(self, pos=1):
         self.lexer.skip(- pos)
         # clearly the buffer here needs wiping too
@@ -527,6 +713,7 @@ class Lexer(object):
     t_regex_ignore = ' \t'
 
     def t_regex_error(self, token):
+        token.lexpos += self.lexdata_offset
         raise ECMARegexSyntaxError(
             "Error parsing regular expression '%s' at %s:%s" % (
                 token.value, token.lineno, self._get_colno(token))
@@ -679,6 +866,7 @@ class Lexer(object):
         return token
 
     def t_error(self, token):
+        token.lexpos += self.lexdata_offset
         for handler in self.error_token_handlers:
             handler(self, token)
 
@@ -697,3 +885,111 @@ class Lexer(object):
                     self._get_colno(token),
                 )
             )
+
+
+class FastLexer(Lexer):
+    """
+    A lexer that produces the exact same tokens as the Lexer, but with
+    the identifiers, numbers, punctuators and line terminators scanned
+    directly, such that the master regular expression built by ply is
+    only used for everything else (i.e. strings, regular expressions,
+    comments, non-ASCII identifiers and errors).
+
+    >>> lexer = FastLexer()
+    >>> lexer.input('a = 1;')
+    >>> [str(token.type) for token in lexer]
+    ['ID', 'EQ', 'NUMBER', 'SEMI']
+    """
+
+    # the punctuators, excluding the ones starting with '/' as those
+    # must be disambiguated from comments by ply.
+    punctuators = dict(
+        (re.sub(r'\\(.)', r'\1', getattr(Lexer, 't_' + name)), name)
+        for name in Lexer.tokens[:Lexer.tokens.index('NUMBER')]
+        if hasattr(Lexer, 't_' + name) and
+        not getattr(Lexer, 't_' + name).startswith('/')
+    )
+    punctuator_start = frozenset(key[0] for key in punctuators)
+    punctuator_width = max(len(key) for key in punctuators)
+
+    identifier_start = frozenset(
+        'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_$')
+    number_start = frozenset('0123456789')
+    patt_identifier = re.compile(r'[a-zA-Z_$][0-9a-zA-Z_$]*')
+    patt_number = re.compile(Lexer.t_NUMBER, re.VERBOSE)
+    # these are either keywords or identifiers that must be matched by
+    # ply, as they may be the start of a getter or setter.
+    ply_identifiers = frozenset(['get', 'set'])
+
+    def get_lexer_token(self):
+        lexer = self.lexer
+        if lexer.lexstate != 'INITIAL':
+            return super(FastLexer, self).get_lexer_token()
+
+        lexdata = lexer.lexdata
+        lexlen = lexer.lexlen
+        lexignore = lexer.lexignore
+        lexpos = lexer.lexpos
+        while lexpos < lexlen and lexdata[lexpos] in lexignore:
+            lexpos += 1
+        if lexpos >= lexlen:
+            return super(FastLexer, self).get_lexer_token()
+
+        char = lexdata[lexpos]
+        if char in self.identifier_start:
+            value = self.patt_identifier.match(lexdata, lexpos).group()
+            end = lexpos + len(value)
+            if (end < lexlen and lexdata[end] >= '\x80') or (
+                    value in self.ply_identifiers):
+                return super(FastLexer, self).get_lexer_token()
+            type_ = self.keywords_dict.get(value, 'ID')
+        elif char in self.number_start or (char == '.' and (
+                lexdata[lexpos + 1:lexpos + 2] in self.number_start)):
+            value = self.patt_number.match(lexdata, lexpos).group()
+            type_ = 'NUMBER'
+        elif char == '\n' or char == '\r':
+            value = '\r\n' if lexdata[lexpos:lexpos + 2] == '\r\n' else char
+            type_ = 'LINE_TERMINATOR'
+        elif char in self.punctuator_start:
+            # every one of the starting characters is a punctuator.
+            for width in range(self.punctuator_width, 0, -1):
+                value = lexdata[lexpos:lexpos + width]
+                type_ = self.punctuators.get(value)
+                if type_:
+                    break
+        else:
+            return super(FastLexer, self).get_lexer_token()
+
+        token = ply.lex.LexToken()
+        token.type = type_
+        token.value = value
+        token.lineno = lexer.lineno
+        token.lexpos = lexpos + self.lexdata_offset
+        token.colno = token.lexpos - self.newline_idx[lexer.lineno - 1] + 1
+        lexer.lexpos = lexpos + len(value)
+        if type_ == 'LINE_TERMINATOR':
+            lexer.lineno += 1
+        return token
+
+
+def tokenize_compact(text, lexer_cls=FastLexer, **kwargs):
+    """
+    Lex the provided text and return all the tokens in a TokenTable,
+    which stores them as arrays of integers rather than as individual
+    LexToken instances, for the tools that only need the token stream.
+    Any remaining keyword arguments are passed to the lexer class.
+
+    >>> from calmjs.parse.lexers.es5 import tokenize_compact
+    >>> table = tokenize_compact('var a = 1;')
+    >>> len(table)
+    5
+    >>> str(table.type_name(1)), str(table.value(1)), table.colno[1]
+    ('ID', 'a', 5)
+    """
+
+    lexer = lexer_cls(**kwargs)
+    lexer.input(text)
+    table = TokenTable(text, lexer.tokens)
+    table.extend(lexer)
+    table.lines = lexer.newline_idx
+    return table
@@ -3,6 +3,9 @@
 Specialized lexer token subclasses.
 """
 
+from array import array
+from bisect import bisect_right
+
 from ply.lex import LexToken
 
 
@@ -10,3 +13,152 @@ class AutoLexToken(LexToken):
     """
     Special type for automatically generated tokens.
     """
+
+
+class TokenTable(object):
+    """
+    A compact, column oriented table of tokens, where the type and the
+    starting and ending positions of every token are stored in arrays of
+    integers rather than as individual LexToken instances.  The values
+    of the tokens are sliced from the source text on demand, with the
+    exception of the ones that were generated (i.e. AutoLexToken), which
+    are stored separately.
+
+    The line and column numbers are derived from the starting offsets
+    of every line of the source text, and the lineno and colno arrays
+    will only be produced when first accessed.
+
+    The types are stored as the index into the types attribute, such
+    that the tokens of a given type may be found without the creation
+    of any LexToken instances.
+    """
+
+    def __init__(self, source, types=(), lines=(0,)):
+        """
+        Arguments
+
+        source
+            The source text of the tokens.
+        types
+            The initial list of type names, which determines the type
+            ids; any other type names encountered will be added.
+        lines
+            The starting offsets of every line in the source text, as
+            tracked by the newline_idx attribute of the lexer.
+        """
+
+        self.source = source
+        self.types = list(types)
+        self.type_ids = {name: idx for idx, name in enumerate(self.types)}
+        self.lines = array('l', lines)
+        self.type = array('H')
+        self.lexpos = array('l')
+        self.endpos = array('l')
+        # values that are not from the source, keyed by the index.
+        self.values = {}
+        self._lineno = self._colno = None
+
+    def type_id(self, name):
+        """
+        Return the id for the type name, which will be registered if it
+        has not been seen before.
+        """
+
+        type_id = self.type_ids.get(name)
+        if type_id is None:
+            type_id = self.type_ids[name] = len(self.types)
+            self.types.append(name)
+        return type_id
+
+    def append(self, token):
+        """
+        Add a LexToken to the table.
+        """
+
+        if isinstance(token, AutoLexToken):
+            self.values[len(self.type)] = token.value
+            endpos = token.lexpos
+        else:
+            endpos = token.lexpos + len(token.value)
+        self.type.append(self.type_id(token.type))
+        self.lexpos.append(token.lexpos)
+        self.endpos.append(endpos)
+        self._lineno = self._colno = None
+
+    def extend(self, tokens):
+        """
+        Add all the LexTokens from the iterable to the table.
+        """
+
+        for token in tokens:
+            self.append(token)
+
+    def _positions(self):
+        lines = self.lines
+        lineno = array('l')
+        colno = array('l')
+        for idx, lexpos in enumerate(self.lexpos):
+            line = bisect_right(lines, lexpos)
+            lineno.append(line)
+            # the generated tokens have no width, thus no column.
+            colno.append(
+                0 if idx in self.values else lexpos - lines[line - 1] + 1)
+        self._lineno, self._colno = lineno, colno
+
+    @property
+    def lineno(self):
+        if self._lineno is None:
+            self._positions()
+        return self._lineno
+
+    @property
+    def colno(self):
+        if self._colno is None:
+            self._positions()
+        return self._colno
+
+    def type_name(self, idx):
+        """
+        Return the type name of the token at the index.
+        """
+
+        return self.types[self.type[idx]]
+
+    def value(self, idx):
+        """
+        Return the value of the token at the index.
+        """
+
+        if idx < 0:
+            idx += len(self.type)
+        value = self.values.get(idx)
+        if value is None:
+            value = self.source[self.lexpos[idx]:self.endpos[idx]]
+        return value
+
+    def indexes(self, name):
+        """
+        Return the indexes of all the tokens of the provided type name.
+        """
+
+        type_id = self.type_ids.get(name)
+        return [idx for idx, value in enumerate(self.type) if value == type_id]
+
+    def __len__(self):
+        return len(self.type)
+
+    def __getitem__(self, idx):
+        # produce a LexToken, for compatibility with the other tools.
+        if idx < 0:
+            idx += len(self.type)
+        token = AutoLexToken() if idx in self.values else LexToken()
+        token.type = self.type_name(idx)
+        token.value = self.value(idx)
+        token.lexpos = self.lexpos[idx]
+        token.lineno = self.lineno[idx]
+        token.colno = self.colno[idx]
+        return token
+
+    def __iter__(self):
+        for idx in range(len(self.type)):
+            yield self[idx]
@@ -24,15 +24,19 @@
 
 __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 
+from contextlib import contextmanager
 from functools import partial
+from threading import Lock
 
 import ply.yacc
 
+from calmjs.parse.asttypes import pack_pos
 from calmjs.parse.exceptions import ECMASyntaxError
 from calmjs.parse.exceptions import ProductionError
 from calmjs.parse.lexers.tokens import AutoLexToken
 from calmjs.parse.lexers.es5 import Lexer
 from calmjs.parse.factory import AstTypesFactory
+from calmjs.parse.parsers.optimize import load_artifact
 from calmjs.parse.unparsers.es5 import pretty_print
 from calmjs.parse.walkers import ReprWalker
 from calmjs.parse.utils import generate_tab_names
@@ -40,7 +44,8 @@ from calmjs.parse.utils import format_lex_token
 from calmjs.parse.utils import str
 from calmjs.parse.io import read as io_read
 
-asttypes = AstTypesFactory(pretty_print, ReprWalker())
+asttypes = AstTypesFactory(
+    pretty_print, ReprWalker(), name=__name__ + '.asttypes')
 
 # These default values for the `Parser` constructor, passed on to ply;
 # they must be strings; these values are for reference only as
@@ -63,7 +68,8 @@ class Parser(object):
 
     def __init__(self, lex_optimize=True, lextab=lextab,
                  yacc_optimize=True, yacctab=yacctab, yacc_debug=False,
-                 yacc_tracking=True, with_comments=False, asttypes=asttypes):
+                 yacc_tracking=True, with_comments=False, asttypes=asttypes,
+                 lexer_cls=Lexer):
         # A warning: in order for line numbers and column numbers be
         # tracked correctly, ``yacc_tracking`` MUST be turned ON.  As
         # this parser was initially implemented with a number of manual
@@ -82,8 +88,13 @@ class Parser(object):
         self.yacc_debug = yacc_debug
         self.yacc_tracking = yacc_tracking
 
-        self.lexer = Lexer(with_comments=with_comments)
-        self.lexer.build(optimize=lex_optimize, lextab=lextab)
+        # use the tables from the prebuilt artifact, if available.
+        lextab, yacctab = (lex_optimize and yacc_optimize and load_artifact(
+            lextab, yacctab)) or (lextab, yacctab)
+
+        self.with_comments = with_comments
+        self.lexer = lexer_cls(
+            with_comments=with_comments, optimize=lex_optimize, lextab=lextab)
         self.tokens = self.lexer.tokens
 
         self.parser = ply.yacc.yacc(
@@ -106,6 +117,17 @@ class Parser(object):
         )
         raise ECMASyntaxError(msg[len(tokens)].format(*tokens))
 
+    def reset(self):
+        """
+        Reset the states tracked from the previous parse, such that this
+        instance may be reused for parsing a new input.
+        """
+
+        self.lexer.reset()
+        # drop the references to the symbols from the previous parse.
+        self.parser.statestack = []
+        self.parser.symstack = []
+
     def parse(self, text, debug=False):
         if not isinstance(text, str):
             raise TypeError("'%s' argument expected, got '%s'" % (
@@ -379,8 +401,8 @@ class Parser(object):
             p[0] = p[1]
         # TODO there should be a cleaner API for the lexer and their
         # token types for ensuring that the mappings are available.
-        p[0][0]._token_map = {(',' * p[0][0].value): [
-            p[0][0].findpos(p, 0)]}
+        p[0][0]._token_map = (
+            ',' * p[0][0].value, pack_pos(*p[0][0].findpos(p, 0)))
         return
 
     def p_object_literal(self, p):
@@ -1481,13 +1503,120 @@ class Parser(object):
         p[0] = p[1]
 
 
+class ParserPool(object):
+    """
+    A pool of reusable Parser instances.
+
+    Constructing a Parser involves building the ply lexer and loading
+    the LR tables, which can easily cost more than the actual parsing of
+    a small input.  This pool keeps the instances that were released
+    back to it for reuse, keyed by the arguments that determine how
+    they were constructed.
+
+    >>> from calmjs.parse.parsers.es5 import ParserPool
+    >>> pool = ParserPool()
+    >>> parser = pool.acquire()
+    >>> print(parser.parse(u'var a = 1;'))
+    var a = 1;
+    <BLANKLINE>
+    >>> pool.release(parser)
+    >>> pool.acquire() is parser
+    True
+
+    The checkout method provides a context manager that will release
+    the acquired instance at the end of the context.
+
+    >>> with pool.checkout(with_comments=True) as parser:
+    ...     print(parser.parse(u'// comment\\nvar b;'))
+    ...
+    // comment
+    var b;
+    <BLANKLINE>
+
+    Thread safety: a pool instance may be shared by any number of
+    threads, as acquiring from and releasing to the pool are guarded by
+    a lock.  However, as the Parser instances hold states for the input
+    that is being parsed, an acquired instance is exclusively owned by
+    the caller until it is released, such that it must not be shared
+    with any other threads, nor be used by anything after its release.
+    """
+
+    def __init__(self, size=None, parser_cls=Parser):
+        """
+        Arguments
+
+        size
+            The maximum number of idle instances that will be retained
+            for each distinct set of construction arguments; any more
+            instances that get released will be discarded.  Defaults to
+            None, which retains all released instances.
+        parser_cls
+            The Parser class to construct instances with.
+        """
+
+        self.size = size
+        self.parser_cls = parser_cls
+        self.parsers = {}
+        self._lock = Lock()
+
+    def acquire(
+            self, with_comments=False, asttypes=asttypes,
+            lextab=lextab, yacctab=yacctab):
+        """
+        Return a Parser instance constructed with the provided arguments;
+        a previously released instance will be returned if available.
+        """
+
+        key = (with_comments, asttypes, lextab, yacctab)
+        with self._lock:
+            idle = self.parsers.get(key)
+            if idle:
+                return idle.pop()
+        # construction is done outside of the lock as it can be slow.
+        return self.parser_cls(
+            with_comments=with_comments, asttypes=asttypes,
+            lextab=lextab, yacctab=yacctab,
+        )
+
+    def release(self, parser):
+        """
+        Reset the provided Parser instance and return it to this pool.
+        """
+
+        parser.reset()
+        key = (
+            parser.with_comments, parser.asttypes,
+            parser.lextab, parser.yacctab,
+        )
+        with self._lock:
+            idle = self.parsers.setdefault(key, [])
+            if self.size is None or len(idle) < self.size:
+                idle.append(parser)
+
+    @contextmanager
+    def checkout(self, **kwargs):
+        """
+        A context manager that acquires a Parser instance using the
+        provided keyword arguments and releases it on exit.
+        """
+
+        parser = self.acquire(**kwargs)
+        try:
+            yield parser
+        finally:
+            self.release(parser)
+
+
+parser_pool = ParserPool()
+
+
 def parse(source, with_comments=False):
     """
     Return an AST from the input ES5 source.
     """
 
-    parser = Parser(with_comments=with_comments)
-    return parser.parse(source)
+    with parser_pool.checkout(with_comments=with_comments) as parser:
+        return parser.parse(source)
 
 
 read = partial(io_read, parse)
@@ -5,20 +5,33 @@ Helpers for maintenance/generation of the lextab/yacctab modules.
 The original goal of this was to force the creation of tab files using
 the utf8 codec to workaround issues with the ply package, for systems
 that do not have utf8 configured as the default codec.
+
+Optionally, the contents of both the lextab and yacctab modules may be
+written out as a single pickled artifact, which will be loaded by the
+parser in place of the modules, such that the startup cost of importing
+(and compiling, if the bytecode cannot be cached) the rather large tab
+modules is avoided.
 """
 
 import codecs
 import os
+import pickle
 import sys
 from functools import partial
 from os import unlink
+from os.path import dirname
 from os.path import exists
+from os.path import getmtime
+from os.path import join
 from importlib import import_module
+from types import ModuleType
 from calmjs.parse.utils import generate_tab_names
 from calmjs.parse.utils import ply_dist
 
 _ASSUME_PLY_VERSION = '3.11'
 _ASSUME_ENVVAR = 'CALMJS_PARSE_ASSUME_PLY_VERSION'
+# the memoized results of load_artifact
+_artifacts = {}
 
 
 def validate_imports(*imports):
@@ -80,10 +93,122 @@ def unlink_modules(paths):
 
 def reoptimize(module):
     purge_tabs(module)
+    _artifacts.pop((module.lextab, module.yacctab), None)
     # create a new parser should rengenerate the module
     module.Parser()
 
 
+def generate_artifact_path(lextab):
+    """
+    Return the path to the artifact for the provided name of the lextab
+    module, which will be placed alongside the lextab module.
+    """
+
+    package_name, name = lextab.rsplit('.', 1)
+    if not name.startswith('lextab'):
+        raise ValueError('%r is not a lextab module name' % lextab)
+    return join(
+        dirname(import_module(package_name).__file__),
+        'tabs' + name[len('lextab'):] + '.pickle',
+    )
+
+
+def _tab_attrs(module):
+    return {
+        key: value for key, value in vars(module).items()
+        if key.startswith('_') and not key.startswith('__')
+    }
+
+
+def build_artifact(module, compact=False):
+    """
+    Build the pickled artifact for the lextab and yacctab modules of the
+    provided parser module, generating those modules if they are not
+    already available, and return the path to the artifact.
+
+    If compact is True, the action and goto tables will be stored as
+    a CompactTable, which uses significantly less memory at the cost of
+    slower lookups during parsing.
+    """
+
+    path = generate_artifact_path(module.lextab)
+    if exists(path):
+        unlink(path)
+    # ensure the tab modules are generated.
+    module.Parser()
+    data = tuple(
+        (name, _tab_attrs(import_module(name)))
+        for name in (module.lextab, module.yacctab)
+    )
+    if compact:
+        from calmjs.parse.parsers.tables import compact_tables
+        attrs = data[1][1]
+        attrs['_lr_action'], attrs['_lr_goto'] = compact_tables(
+            attrs['_lr_action'], attrs['_lr_goto'])
+
+    # not using mkstemp such that the permissions follow the umask.
+    tmp_path = '%s.%d.tmp' % (path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as stream:
+            pickle.dump(data, stream, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception:
+        if exists(tmp_path):
+            unlink(tmp_path)
+        raise
+    finally:
+        # discard the memoized result from before the build.
+        _artifacts.pop((module.lextab, module.yacctab), None)
+    return path
+
+
+def _load_artifact(lextab, yacctab):
+    try:
+        path = generate_artifact_path(lextab)
+        mtime = getmtime(path)
+    except (ImportError, ValueError, OSError):
+        return None
+
+    # ignore the artifact if the modules were regenerated after it.
+    for name in (lextab, yacctab):
+        tab_path = join(dirname(path), name.rsplit('.', 1)[-1] + '.py')
+        if exists(tab_path) and getmtime(tab_path) > mtime:
+            return None
+
+    try:
+        with open(path, 'rb') as fd:
+            data = pickle.load(fd)
+    except Exception:
+        return None
+
+    if tuple(name for name, attrs in data) != (lextab, yacctab):
+        return None
+
+    modules = []
+    for name, attrs in data:
+        module = ModuleType(name)
+        module.__file__ = path
+        vars(module).update(attrs)
+        modules.append(module)
+    return tuple(modules)
+
+
+def load_artifact(lextab, yacctab):
+    """
+    Return the lextab and yacctab as module objects, loaded from the
+    artifact built for the modules with the provided names, or None if
+    that is not available or older than the modules.  The result is
+    memoized.
+    """
+
+    if not (isinstance(lextab, str) and isinstance(yacctab, str)):
+        return None
+    key = (lextab, yacctab)
+    if key not in _artifacts:
+        _artifacts[key] = _load_artifact(lextab, yacctab)
+    return _artifacts[key]
+
+
 def _assume_ply_version():
     version = os.environ.get(_ASSUME_ENVVAR, _ASSUME_PLY_VERSION)
     if ply_dist is None:
@@ -139,7 +264,9 @@ def optimize_build(module_name, assume_ply_version=True):
         module.Parser(lextab=lextab, yacctab=yacctab)
 
 
-def reoptimize_all(monkey_patch=False, first_build=False):
+def reoptimize_all(
+        monkey_patch=False, first_build=False, artifacts=False,
+        compact=False):
     """
     The main optimize method for maintainence of the generated tab
     modules required by ply
@@ -155,6 +282,18 @@ def reoptimize_all(monkey_patch=False, first_build=False):
         flag for switching between reoptimize/optimize_build method;
         setting the flag to True specifies the latter.
 
+        default: False
+
+    artifacts
+        flag for also building the pickled artifacts that the parsers
+        will load in place of the generated tab modules.
+
+        default: False
+
+    compact
+        flag for storing the LR tables in the artifacts in the compact
+        form, for reduced memory usage at the cost of parsing speed.
+
         default: False
     """
 
@@ -181,6 +320,9 @@ def reoptimize_all(monkey_patch=False, first_build=False):
             else:
                 module = import_module(name, 'calmjs.parse.parsers')
                 reoptimize(module)
+            if artifacts:
+                build_artifact(
+                    import_module(name, 'calmjs.parse.parsers'), compact)
     except ImportError as e:
         if not first_build or 'ply' not in str(e):
             raise
@@ -198,4 +340,7 @@ def reoptimize_all(monkey_patch=False, first_build=False):
 
 
 if __name__ == '__main__':  # pragma: no cover
-    reoptimize_all(True, '--build' in sys.argv)
+    reoptimize_all(
+        True, '--build' in sys.argv, '--artifacts' in sys.argv,
+        '--compact' in sys.argv,
+    )
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Compact representation of the LR tables produced by ply.yacc.
+
+The action and goto tables produced by ply are dicts of dicts, keyed by
+the state and then by the symbol.  The CompactTable provided here keeps
+the same information as a set of flat integer arrays, where identical
+rows are shared and all the rows are packed into the same arrays using
+row displacement (i.e. each row is placed at the first offset where its
+columns do not collide with the columns of the rows already placed,
+with the owner of each slot recorded in the check array).  Lookups
+remain constant time, while only the subset of the dict interface used
+by ply.yacc.LRParser is provided for each of the rows.
+"""
+
+from array import array
+from collections.abc import Mapping
+
+_missing = object()
+# the number of attempts at placing a row into the gaps.
+ATTEMPTS = 64
+
+
+def _array(values):
+    # use the smallest of the signed typecodes that fit all values.
+    low, high = (min(values), max(values)) if values else (0, 0)
+    for typecode in 'bhi':
+        limit = 1 << (array(typecode).itemsize * 8 - 1)
+        if -limit <= low and high < limit:
+            break
+    return array(typecode, values)
+
+
+class CompactRow(Mapping):
+    """
+    A read-only view of a row of a CompactTable.
+    """
+
+    # the arrays of the table are also referenced directly for speed.
+    __slots__ = ('table', 'base', 'key', 'index', 'check', 'entries')
+
+    def __init__(self, table, base, key):
+        self.table = table
+        self.base = base
+        self.key = key
+        self.index = table.index
+        self.check = table.check
+        self.entries = table.entries
+
+    def get(self, symbol, default=None):
+        idx = self.index.get(symbol)
+        if idx is None:
+            return default
+        idx += self.base
+        if self.check[idx] != self.key:
+            return default
+        return self.entries[idx]
+
+    def __getitem__(self, symbol):
+        value = self.get(symbol, _missing)
+        if value is _missing:
+            raise KeyError(symbol)
+        return value
+
+    def __iter__(self):
+        check = self.check
+        for idx, symbol in enumerate(self.table.symbols):
+            if check[self.base + idx] == self.key:
+                yield symbol
+
+    def __len__(self):
+        return sum(1 for symbol in self)
+
+    def __repr__(self):
+        return '<%s %r>' % (type(self).__name__, dict(self))
+
+
+class CompactTable(list):
+    """
+    A list of CompactRow indexed by the state, with the rows backed by
+    the same set of arrays.  This should be created from the original
+    table using the build class method.
+    """
+
+    def __init__(self, symbols, bases, keys, check, entries):
+        super(CompactTable, self).__init__()
+        self.symbols = tuple(symbols)
+        self.index = {symbol: idx for idx, symbol in enumerate(self.symbols)}
+        self.bases = bases
+        self.keys = keys
+        self.check = check
+        self.entries = entries
+        rows = {}
+        for base, key in zip(bases, keys):
+            if key not in rows:
+                rows[key] = CompactRow(self, base, key)
+            self.append(rows[key])
+
+    def __reduce__(self):
+        return (type(self), (
+            self.symbols, self.bases, self.keys, self.check, self.entries))
+
+    def items(self):
+        return enumerate(self)
+
+    @classmethod
+    def build(cls, table, size=None):
+        """
+        Build a CompactTable from the provided table, which is a dict of
+        dicts as generated by ply.yacc, with the values being integers.
+        The size is the number of states, defaults to one more than the
+        largest state in the table, as states with no entries may be
+        omitted from the original table.
+        """
+
+        if size is None:
+            size = max(table) + 1 if table else 0
+        symbols = sorted({symbol for row in table.values() for symbol in row})
+        index = {symbol: idx for idx, symbol in enumerate(symbols)}
+
+        # assign a key to each of the unique rows, including the empty
+        # row which will be used for the omitted states.
+        unique = {(): 0}
+        keys = [0] * size
+        for state, row in table.items():
+            entries = tuple(sorted(
+                (index[symbol], value) for symbol, value in row.items()))
+            keys[state] = unique.setdefault(entries, len(unique))
+
+        # place the densest rows first, as the sparse rows are more
+        # likely to fit into the gaps left behind; the occupied slots
+        # are tracked using a bytearray sized for the worst case where
+        # no rows overlap.
+        width = len(symbols)
+        used = bytearray(len(unique) * width + width)
+        row_bases = {}
+        end = 0
+        for entries, key in sorted(
+                unique.items(), key=lambda item: (-len(item[0]), item[1])):
+            if not entries:
+                row_bases[key] = 0
+                continue
+            first = entries[0][0]
+            span = entries[-1][0] - first + 1
+            # as the slots are either 0 or 1, the pattern of the row
+            # can be tested against the slots as big-endian integers.
+            pattern = bytearray(span)
+            for column, value in entries:
+                pattern[column - first] = 1
+            pattern = int.from_bytes(pattern, 'big')
+            # only try the bases where the first column will be free,
+            # up to a limited number of attempts before simply placing
+            # the row after all the occupied slots.
+            slot = used.find(0, first)
+            for _ in range(ATTEMPTS):
+                if not int.from_bytes(used[slot:slot + span], 'big') & pattern:
+                    break
+                slot = used.find(0, slot + 1)
+            else:
+                slot = max(end, first)
+            base = slot - first
+            end = max(end, base + entries[-1][0] + 1)
+            for column, value in entries:
+                used[base + column] = 1
+            row_bases[key] = base
+
+        # the arrays are sized such that every lookup remains in bounds,
+        # with -1 marking the unused slots in check.
+        length = max(row_bases.values()) + width
+        check = [-1] * length
+        values = [0] * length
+        for entries, key in unique.items():
+            base = row_bases[key]
+            for column, value in entries:
+                check[base + column] = key
+                values[base + column] = value
+        return cls(
+            symbols, _array([row_bases[key] for key in keys]), _array(keys),
+            _array(check), _array(values),
+        )
+
+
+def compact_tables(action, goto):
+    """
+    Return the compact version of the provided action and goto tables
+    from ply.yacc.
+    """
+
+    size = max(action) + 1 if action else 0
+    return CompactTable.build(action, size), CompactTable.build(goto, size)
@@ -0,0 +1,370 @@
+
+# yacctab_es5_py3_ply3_11.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programAND ANDEQUAL AUTOSEMI BAND BLOCK_COMMENT BNOT BOR BREAK BXOR CASE CATCH CLASS COLON COMMA CONDOP CONST CONTINUE DEBUGGER DEFAULT DELETE DIV DIVEQUAL DO ELSE ENUM EQ EQEQ EXPORT EXTENDS FALSE FINALLY FOR FUNCTION GE GETPROP GT ID IF IMPORT IN INSTANCEOF LBRACE LBRACKET LE LINE_COMMENT LINE_TERMINATOR LPAREN LSHIFT LSHIFTEQUAL LT MINUS MINUSEQUAL MINUSMINUS MOD MODEQUAL MULT MULTEQUAL NE NEW NOT NULL NUMBER OR OREQUAL PERIOD PLUS PLUSEQUAL PLUSPLUS RBRACE RBRACKET REGEX RETURN RPAREN RSHIFT RSHIFTEQUAL SEMI SETPROP STREQ STRING STRNEQ SUPER SWITCH THIS THROW TRUE TRY TYPEOF URSHIFT URSHIFTEQUAL VAR VOID WHILE WITH XOREQUALempty :program : source_elementssource_elements : empty\n                           | source_element_list\n        source_element_list : source_element\n                               | source_element_list source_element\n        source_element : statement\n                          | function_declaration\n        statement : block\n                     | variable_statement\n                     | empty_statement\n                     | expr_statement\n                     | if_statement\n                     | iteration_statement\n                     | continue_statement\n                     | break_statement\n                     | return_statement\n                     | with_statement\n                     | switch_statement\n                     | labelled_statement\n                     | throw_statement\n                     | try_statement\n                     | debugger_statement\n                     | function_declaration\n        block : LBRACE source_elements RBRACEliteral : null_literal\n                   | boolean_literal\n                   | numeric_literal\n                   | string_literal\n                   | regex_literal\n        boolean_literal : TRUE\n                           | FALSE\n        null_literal : NULLnumeric_literal : NUMBERstring_literal : STRINGregex_literal : REGEXidentifier : IDreserved_word : BREAK\n                         | CASE\n                         | CATCH\n                         | CONTINUE\n                         | DEBUGGER\n                         | DEFAULT\n                         | DELETE\n                         | DO\n                         | ELSE\n                         | FINALLY\n                         | FOR\n                         | FUNCTION\n                         | IF\n                         | IN\n                         | INSTANCEOF\n                         | NEW\n                         | RETURN\n                         | SWITCH\n                         | THIS\n                         | THROW\n                         | TRY\n                         | TYPEOF\n                         | VAR\n                         | VOID\n                         | WHILE\n                         | WITH\n                         | NULL\n                         | TRUE\n                         | FALSE\n                         | CLASS\n                         | CONST\n                         | ENUM\n                         | EXPORT\n                         | EXTENDS\n                         | IMPORT\n                         | SUPER\n        identifier_name : identifier\n                           | reserved_word\n        primary_expr : primary_expr_no_brace\n                        | object_literal\n        primary_expr_no_brace : identifierprimary_expr_no_brace : THISprimary_expr_no_brace : literal\n                                 | array_literal\n        primary_expr_no_brace : LPAREN expr RPARENarray_literal : LBRACKET elision_opt RBRACKETarray_literal : LBRACKET element_list RBRACKET\n                         | LBRACKET element_list COMMA elision_opt RBRACKET\n        element_list : elision_opt assignment_expr\n                        | element_list COMMA elision_opt assignment_expr\n        elision_opt : emptyelision_opt : elisionelision : COMMA\n                   | elision COMMA\n        object_literal : LBRACE RBRACE\n                          | LBRACE property_list RBRACE\n                          | LBRACE property_list COMMA RBRACE\n        property_list : property_assignment\n                         | property_list COMMA property_assignment\n        property_assignment              : property_name COLON assignment_expr\n             | GETPROP property_name LPAREN RPAREN LBRACE function_body RBRACE\n             | SETPROP property_name LPAREN property_set_parameter_list RPAREN                   LBRACE function_body RBRACE\n        identifier_name_string : identifier_name\n        property_name : identifier_name_string\n                         | string_literal\n                         | numeric_literal\n        property_set_parameter_list : identifier\n        member_expr : primary_expr\n                       | function_expr\n                       | member_expr LBRACKET expr RBRACKET\n                       | member_expr PERIOD identifier_name_string\n                       | NEW member_expr arguments\n        member_expr_nobf : primary_expr_no_brace\n                            | function_expr\n                            | member_expr_nobf LBRACKET expr RBRACKET\n                            | member_expr_nobf PERIOD identifier_name_string\n                            | NEW member_expr arguments\n        new_expr : member_expr\n                    | NEW new_expr\n        new_expr_nobf : member_expr_nobf\n                         | NEW new_expr\n        call_expr : member_expr arguments\n                     | call_expr arguments\n                     | call_expr LBRACKET expr RBRACKET\n                     | call_expr PERIOD identifier_name_string\n        call_expr_nobf : member_expr_nobf arguments\n                          | call_expr_nobf arguments\n                          | call_expr_nobf LBRACKET expr RBRACKET\n                          | call_expr_nobf PERIOD identifier_name_string\n        arguments : LPAREN RPAREN\n                     | LPAREN argument_list RPAREN\n        argument_list : assignment_expr\n                         | argument_list COMMA assignment_expr\n        left_hand_side_expr : new_expr\n                               | call_expr\n        left_hand_side_expr_nobf : new_expr_nobf\n                                    | call_expr_nobf\n        postfix_expr : left_hand_side_expr\n                        | left_hand_side_expr PLUSPLUS\n                        | left_hand_side_expr MINUSMINUS\n        postfix_expr_nobf : left_hand_side_expr_nobf\n                             | left_hand_side_expr_nobf PLUSPLUS\n                             | left_hand_side_expr_nobf MINUSMINUS\n        unary_expr : postfix_expr\n                      | unary_expr_common\n        unary_expr_nobf : postfix_expr_nobf\n                           | unary_expr_common\n        unary_expr_common : DELETE unary_expr\n                             | VOID unary_expr\n                             | TYPEOF unary_expr\n                             | PLUSPLUS unary_expr\n                             | MINUSMINUS unary_expr\n                             | PLUS unary_expr\n                             | MINUS unary_expr\n                             | BNOT unary_expr\n                             | NOT unary_expr\n        multiplicative_expr : unary_expr\n                               | multiplicative_expr MULT unary_expr\n                               | multiplicative_expr DIV unary_expr\n                               | multiplicative_expr MOD unary_expr\n        multiplicative_expr_nobf : unary_expr_nobf\n                                    | multiplicative_expr_nobf MULT unary_expr\n                                    | multiplicative_expr_nobf DIV unary_expr\n                                    | multiplicative_expr_nobf MOD unary_expr\n        additive_expr : multiplicative_expr\n                         | additive_expr PLUS multiplicative_expr\n                         | additive_expr MINUS multiplicative_expr\n        additive_expr_nobf : multiplicative_expr_nobf\n                              | additive_expr_nobf PLUS multiplicative_expr\n                              | additive_expr_nobf MINUS multiplicative_expr\n        shift_expr : additive_expr\n                      | shift_expr LSHIFT additive_expr\n                      | shift_expr RSHIFT additive_expr\n                      | shift_expr URSHIFT additive_expr\n        shift_expr_nobf : additive_expr_nobf\n                           | shift_expr_nobf LSHIFT additive_expr\n                           | shift_expr_nobf RSHIFT additive_expr\n                           | shift_expr_nobf URSHIFT additive_expr\n        relational_expr : shift_expr\n                           | relational_expr LT shift_expr\n                           | relational_expr GT shift_expr\n                           | relational_expr LE shift_expr\n                           | relational_expr GE shift_expr\n                           | relational_expr INSTANCEOF shift_expr\n                           | relational_expr IN shift_expr\n        relational_expr_noin : shift_expr\n                                | relational_expr_noin LT shift_expr\n                                | relational_expr_noin GT shift_expr\n                                | relational_expr_noin LE shift_expr\n                                | relational_expr_noin GE shift_expr\n                                | relational_expr_noin INSTANCEOF shift_expr\n        relational_expr_nobf : shift_expr_nobf\n                                | relational_expr_nobf LT shift_expr\n                                | relational_expr_nobf GT shift_expr\n                                | relational_expr_nobf LE shift_expr\n                                | relational_expr_nobf GE shift_expr\n                                | relational_expr_nobf INSTANCEOF shift_expr\n                                | relational_expr_nobf IN shift_expr\n        equality_expr : relational_expr\n                         | equality_expr EQEQ relational_expr\n                         | equality_expr NE relational_expr\n                         | equality_expr STREQ relational_expr\n                         | equality_expr STRNEQ relational_expr\n        equality_expr_noin : relational_expr_noin\n                              | equality_expr_noin EQEQ relational_expr\n                              | equality_expr_noin NE relational_expr\n                              | equality_expr_noin STREQ relational_expr\n                              | equality_expr_noin STRNEQ relational_expr\n        equality_expr_nobf : relational_expr_nobf\n                              | equality_expr_nobf EQEQ relational_expr\n                              | equality_expr_nobf NE relational_expr\n                              | equality_expr_nobf STREQ relational_expr\n                              | equality_expr_nobf STRNEQ relational_expr\n        bitwise_and_expr : equality_expr\n                            | bitwise_and_expr BAND equality_expr\n        bitwise_and_expr_noin             : equality_expr_noin\n            | bitwise_and_expr_noin BAND equality_expr_noin\n        bitwise_and_expr_nobf             : equality_expr_nobf\n            | bitwise_and_expr_nobf BAND equality_expr_nobf\n        bitwise_xor_expr : bitwise_and_expr\n                            | bitwise_xor_expr BXOR bitwise_and_expr\n        \n        bitwise_xor_expr_noin             : bitwise_and_expr_noin\n            | bitwise_xor_expr_noin BXOR bitwise_and_expr_noin\n        \n        bitwise_xor_expr_nobf             : bitwise_and_expr_nobf\n            | bitwise_xor_expr_nobf BXOR bitwise_and_expr_nobf\n        bitwise_or_expr : bitwise_xor_expr\n                           | bitwise_or_expr BOR bitwise_xor_expr\n        \n        bitwise_or_expr_noin             : bitwise_xor_expr_noin\n            | bitwise_or_expr_noin BOR bitwise_xor_expr_noin\n        \n        bitwise_or_expr_nobf             : bitwise_xor_expr_nobf\n            | bitwise_or_expr_nobf BOR bitwise_xor_expr_nobf\n        logical_and_expr : bitwise_or_expr\n                            | logical_and_expr AND bitwise_or_expr\n        \n        logical_and_expr_noin : bitwise_or_expr_noin\n                              | logical_and_expr_noin AND bitwise_or_expr_noin\n        \n        logical_and_expr_nobf : bitwise_or_expr_nobf\n                              | logical_and_expr_nobf AND bitwise_or_expr_nobf\n        logical_or_expr : logical_and_expr\n                           | logical_or_expr OR logical_and_expr\n        logical_or_expr_noin : logical_and_expr_noin\n                                | logical_or_expr_noin OR logical_and_expr_noin\n        logical_or_expr_nobf : logical_and_expr_nobf\n                                | logical_or_expr_nobf OR logical_and_expr_nobf\n        \n        conditional_expr             : logical_or_expr\n            | logical_or_expr CONDOP assignment_expr COLON assignment_expr\n        \n        conditional_expr_noin             : logical_or_expr_noin\n            | logical_or_expr_noin CONDOP assignment_expr_noin COLON                   assignment_expr_noin\n        \n        conditional_expr_nobf             : logical_or_expr_nobf\n            | logical_or_expr_nobf CONDOP assignment_expr COLON assignment_expr\n        \n        assignment_expr             : conditional_expr\n            | left_hand_side_expr assignment_operator assignment_expr\n        \n        assignment_expr_noin             : conditional_expr_noin\n            | left_hand_side_expr assignment_operator assignment_expr_noin\n        \n        assignment_expr_nobf             : conditional_expr_nobf\n            | left_hand_side_expr_nobf assignment_operator assignment_expr\n        assignment_operator : EQ\n                               | MULTEQUAL\n                               | DIVEQUAL\n                               | MODEQUAL\n                               | PLUSEQUAL\n                               | MINUSEQUAL\n                               | LSHIFTEQUAL\n                               | RSHIFTEQUAL\n                               | URSHIFTEQUAL\n                               | ANDEQUAL\n                               | XOREQUAL\n                               | OREQUAL\n        expr : assignment_expr\n                | expr COMMA assignment_expr\n        expr_noin : assignment_expr_noin\n                     | expr_noin COMMA assignment_expr_noin\n        expr_nobf : assignment_expr_nobf\n                     | expr_nobf COMMA assignment_expr\n        variable_statement : VAR variable_declaration_list SEMI\n                              | VAR variable_declaration_list AUTOSEMI\n        \n        variable_declaration_list             : variable_declaration\n            | variable_declaration_list COMMA variable_declaration\n        \n        variable_declaration_list_noin             : variable_declaration_noin\n            | variable_declaration_list_noin COMMA variable_declaration_noin\n        variable_declaration : identifier\n                                | identifier initializer\n        variable_declaration_noin : identifier\n                                     | identifier initializer_noin\n        initializer : EQ assignment_exprinitializer_noin : EQ assignment_expr_noinempty_statement : SEMIexpr_statement : expr_nobf SEMI\n                          | expr_nobf AUTOSEMI\n        if_statement : IF LPAREN expr RPAREN statementif_statement : IF LPAREN expr RPAREN statement ELSE statement\n        iteration_statement             : DO statement WHILE LPAREN expr RPAREN SEMI\n            | DO statement WHILE LPAREN expr RPAREN AUTOSEMI\n        iteration_statement : WHILE LPAREN expr RPAREN statement\n        iteration_statement             : FOR LPAREN expr_noin_opt SEMI expr_opt SEMI expr_opt RPAREN                   statement\n            | FOR LPAREN VAR variable_declaration_list_noin SEMI expr_opt SEMI                  expr_opt RPAREN statement\n        \n        iteration_statement             : FOR LPAREN left_hand_side_expr IN expr RPAREN statement\n        \n        iteration_statement :             FOR LPAREN VAR identifier IN expr RPAREN statement\n        \n        iteration_statement           : FOR LPAREN VAR identifier initializer_noin IN expr RPAREN statement\n        expr_opt : empty\n                    | expr\n        expr_noin_opt : empty\n                         | expr_noin\n        continue_statement : CONTINUE SEMI\n                              | CONTINUE AUTOSEMI\n        continue_statement : CONTINUE identifier SEMI\n                              | CONTINUE identifier AUTOSEMI\n        break_statement : BREAK SEMI\n                           | BREAK AUTOSEMI\n        break_statement : BREAK identifier SEMI\n                           | BREAK identifier AUTOSEMI\n        return_statement : RETURN SEMI\n                            | RETURN AUTOSEMI\n        return_statement : RETURN expr SEMI\n                            | RETURN expr AUTOSEMI\n        with_statement : WITH LPAREN expr RPAREN statementswitch_statement : SWITCH LPAREN expr RPAREN case_block\n        case_block             : LBRACE case_clauses_opt RBRACE\n            | LBRACE case_clauses_opt default_clause case_clauses_opt RBRACE\n        case_clauses_opt : empty\n                            | case_clauses\n        case_clauses : case_clause\n                        | case_clauses case_clause\n        case_clause : CASE expr COLON source_elementsdefault_clause : DEFAULT COLON source_elementslabelled_statement : identifier COLON statementthrow_statement : THROW expr SEMI\n                           | THROW expr AUTOSEMI\n        try_statement : TRY block catchtry_statement : TRY block finallytry_statement : TRY block catch finallycatch : CATCH LPAREN identifier RPAREN blockfinally : FINALLY blockdebugger_statement : DEBUGGER SEMI\n                              | DEBUGGER AUTOSEMI\n        \n        function_declaration             : FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE\n            | FUNCTION identifier LPAREN formal_parameter_list RPAREN LBRACE                  function_body RBRACE\n        \n        function_expr             : FUNCTION LPAREN RPAREN LBRACE function_body RBRACE\n            | FUNCTION LPAREN formal_parameter_list RPAREN                 LBRACE function_body RBRACE\n        \n        function_expr             : FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE\n            | FUNCTION identifier LPAREN formal_parameter_list RPAREN                 LBRACE function_body RBRACE\n        formal_parameter_list : identifier\n                                 | formal_parameter_list COMMA identifier\n        function_body : source_elements'
+    
+_lr_action_items = {'$end':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,89,125,126,130,133,134,136,137,139,140,146,147,215,302,303,304,327,328,329,330,331,332,335,336,337,338,451,453,476,478,506,507,541,548,549,550,556,558,563,564,571,579,581,582,586,],[-1,0,-2,-3,-4,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-283,-6,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,-322,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-327,-329,-286,-290,-312,-313,-332,-287,-288,-289,-293,-314,-328,-333,-294,-291,-295,-315,-292,]),'FUNCTION':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,169,171,172,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,225,226,228,229,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[23,23,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,109,23,-283,23,109,109,109,-1,109,109,109,109,109,109,109,109,109,-6,23,109,258,-284,-285,109,109,-24,109,109,-300,-301,-304,-305,-308,-309,109,109,-330,-331,109,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,109,109,109,258,109,109,109,258,109,-90,-88,-89,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-322,109,109,109,109,109,258,109,109,258,109,109,258,258,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-25,-271,-272,109,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,23,258,109,23,109,23,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,23,-327,-329,109,109,109,23,23,109,-286,-290,109,109,109,-312,-313,23,23,23,109,109,23,109,109,-332,23,23,-287,-288,-289,109,23,-293,-314,-328,-333,23,23,-294,23,23,23,-291,23,-295,-315,-292,]),'LBRACE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,40,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,166,168,171,175,177,178,179,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,212,215,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,340,357,358,380,382,383,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,453,454,457,459,460,461,464,466,469,476,478,482,484,486,506,507,515,519,520,521,524,526,531,533,534,539,540,541,545,546,547,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[26,26,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,110,26,-283,26,110,110,26,110,-1,110,110,110,110,110,110,110,110,110,-6,26,110,-284,-285,110,110,-24,110,110,-300,-301,-304,-305,-308,-309,110,110,-330,-331,110,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,110,110,110,110,110,-90,-88,-89,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,382,-322,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-25,-271,-272,110,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,26,-1,-91,460,26,464,110,26,110,26,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,26,508,-327,-329,110,110,110,26,515,26,110,519,-286,-290,110,110,110,-312,-313,26,26,545,546,26,110,110,26,110,110,26,-332,26,26,568,-287,-288,-289,110,26,-293,-314,-328,-333,26,26,-294,26,26,26,-291,26,-295,-315,-292,]),'VAR':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,132,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[27,27,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,27,-283,27,-6,27,269,-284,-285,-24,313,-300,-301,-304,-305,-308,-309,-330,-331,269,269,-322,269,269,269,269,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,27,269,27,27,27,-327,-329,27,27,-286,-290,-312,-313,27,27,27,27,-332,27,27,-287,-288,-289,27,-293,-314,-328,-333,27,27,-294,27,27,27,-291,27,-295,-315,-292,]),'SEMI':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,26,28,29,31,34,35,36,41,42,43,44,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,89,92,94,95,96,97,98,99,100,101,103,104,105,106,107,108,111,112,113,114,115,116,117,118,119,120,122,123,124,125,126,130,132,133,134,135,136,137,138,139,140,141,144,146,147,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,215,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,302,303,304,306,308,312,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,335,336,337,338,341,343,344,346,347,350,352,353,354,356,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,382,385,386,388,390,391,393,394,395,396,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,426,427,428,429,430,449,451,453,455,456,458,460,464,467,468,471,476,478,479,480,481,482,485,488,489,490,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,510,512,515,516,518,519,524,525,527,528,529,532,533,541,543,545,546,548,549,550,553,554,556,557,558,563,564,565,568,569,571,572,574,575,576,579,580,581,582,586,],[28,28,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-78,28,-283,125,28,133,136,139,146,-269,-37,-251,-138,-245,-133,-134,-239,-117,-233,-110,-111,-227,-79,-80,-81,-221,-26,-27,-28,-29,-30,-215,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-6,28,-265,-247,-135,-241,-131,-132,-235,-115,-229,-105,-106,-223,-76,-77,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,303,-273,-277,-284,-285,-24,-1,-300,-301,327,-304,-305,329,-308,-309,331,335,-330,-331,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-322,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-25,-271,-272,-278,-270,427,-135,-298,-299,-267,-249,-243,-237,-231,-225,-219,-213,-201,-183,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-252,-240,-138,-126,-127,-234,-113,-114,-83,-84,-228,-222,-216,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,28,-266,-248,-236,-122,-230,-108,-109,-224,-218,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-274,-281,28,28,-1,482,-279,-275,28,-327,-329,-125,-128,-112,28,28,-121,-107,-94,-286,-290,526,-296,-297,-1,-280,-135,-250,-268,-238,-232,-226,-220,-214,-202,-203,-204,-205,-184,-185,-186,-187,-188,-312,-313,-246,-85,28,-334,-242,28,28,549,552,-276,-279,-282,28,-332,-335,28,28,-287,-288,-289,-280,28,-293,-244,-314,-328,-333,-336,28,28,-294,28,28,28,-337,-291,28,-295,-315,-292,]),'IF':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[30,30,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,30,-283,30,-6,30,259,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,259,259,-322,259,259,259,259,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,30,259,30,30,30,-327,-329,30,30,-286,-290,-312,-313,30,30,30,30,-332,30,30,-287,-288,-289,30,-293,-314,-328,-333,30,30,-294,30,30,30,-291,30,-295,-315,-292,]),'DO':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[31,31,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,31,-283,31,-6,31,254,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,254,254,-322,254,254,254,254,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,31,254,31,31,31,-327,-329,31,31,-286,-290,-312,-313,31,31,31,31,-332,31,31,-287,-288,-289,31,-293,-314,-328,-333,31,31,-294,31,31,31,-291,31,-295,-315,-292,]),'WHILE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,129,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[32,32,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,32,-283,32,-6,32,271,-284,-285,310,-24,-300,-301,-304,-305,-308,-309,-330,-331,271,271,-322,271,271,271,271,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,32,271,32,32,32,-327,-329,32,32,-286,-290,-312,-313,32,32,32,32,-332,32,32,-287,-288,-289,32,-293,-314,-328,-333,32,32,-294,32,32,32,-291,32,-295,-315,-292,]),'FOR':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[33,33,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,33,-283,33,-6,33,257,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,257,257,-322,257,257,257,257,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,33,257,33,33,33,-327,-329,33,33,-286,-290,-312,-313,33,33,33,33,-332,33,33,-287,-288,-289,33,-293,-314,-328,-333,33,33,-294,33,33,33,-291,33,-295,-315,-292,]),'CONTINUE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[34,34,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,34,-283,34,-6,34,250,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,250,250,-322,250,250,250,250,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,34,250,34,34,34,-327,-329,34,34,-286,-290,-312,-313,34,34,34,34,-332,34,34,-287,-288,-289,34,-293,-314,-328,-333,34,34,-294,34,34,34,-291,34,-295,-315,-292,]),'BREAK':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[35,35,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,35,-283,35,-6,35,247,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,247,247,-322,247,247,247,247,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,35,247,35,35,35,-327,-329,35,35,-286,-290,-312,-313,35,35,35,35,-332,35,35,-287,-288,-289,35,-293,-314,-328,-333,35,35,-294,35,35,35,-291,35,-295,-315,-292,]),'RETURN':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[36,36,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,36,-283,36,-6,36,263,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,263,263,-322,263,263,263,263,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,36,263,36,36,36,-327,-329,36,36,-286,-290,-312,-313,36,36,36,36,-332,36,36,-287,-288,-289,36,-293,-314,-328,-333,36,36,-294,36,36,36,-291,36,-295,-315,-292,]),'WITH':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[37,37,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,37,-283,37,-6,37,272,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,272,272,-322,272,272,272,272,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,37,272,37,37,37,-327,-329,37,37,-286,-290,-312,-313,37,37,37,37,-332,37,37,-287,-288,-289,37,-293,-314,-328,-333,37,37,-294,37,37,37,-291,37,-295,-315,-292,]),'SWITCH':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[38,38,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,38,-283,38,-6,38,264,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,264,264,-322,264,264,264,264,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,38,264,38,38,38,-327,-329,38,38,-286,-290,-312,-313,38,38,38,38,-332,38,38,-287,-288,-289,38,-293,-314,-328,-333,38,38,-294,38,38,38,-291,38,-295,-315,-292,]),'THROW':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[39,39,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,39,-283,39,-6,39,266,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,266,266,-322,266,266,266,266,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,39,266,39,39,39,-327,-329,39,39,-286,-290,-312,-313,39,39,39,39,-332,39,39,-287,-288,-289,39,-293,-314,-328,-333,39,39,-294,39,39,39,-291,39,-295,-315,-292,]),'TRY':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[40,40,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,40,-283,40,-6,40,267,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,267,267,-322,267,267,267,267,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,40,267,40,40,40,-327,-329,40,40,-286,-290,-312,-313,40,40,40,40,-332,40,40,-287,-288,-289,40,-293,-314,-328,-333,40,40,-294,40,40,40,-291,40,-295,-315,-292,]),'DEBUGGER':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,31,89,92,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,382,399,424,426,449,451,453,460,464,476,478,506,507,515,519,524,533,541,545,546,548,549,550,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[41,41,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,41,-283,41,-6,41,251,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,251,251,-322,251,251,251,251,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,41,251,41,41,41,-327,-329,41,41,-286,-290,-312,-313,41,41,41,41,-332,41,41,-287,-288,-289,41,-293,-314,-328,-333,41,41,-294,41,41,41,-291,41,-295,-315,-292,]),'ID':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,31,34,35,36,39,51,52,77,78,82,83,84,85,86,87,88,89,91,92,102,109,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,169,171,172,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,211,215,217,218,221,222,224,225,226,228,229,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,307,313,327,328,329,330,331,332,335,336,337,338,357,358,382,384,397,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,452,453,454,457,459,460,464,466,475,476,478,482,483,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[43,43,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,43,43,43,43,-283,43,43,43,43,43,43,-1,43,43,43,43,43,43,43,43,43,-6,43,43,43,43,43,-284,-285,43,43,-24,43,43,-300,-301,-304,-305,-308,-309,43,43,-330,-331,43,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,43,43,43,43,43,43,43,43,43,-90,-88,-89,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-322,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-25,-271,-272,43,43,43,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-327,43,-329,43,43,43,43,43,43,43,-286,-290,43,43,43,43,-312,-313,43,43,43,43,43,43,43,43,-332,43,43,-287,-288,-289,43,43,-293,-314,-328,-333,43,43,-294,43,43,43,-291,43,-295,-315,-292,]),'NEW':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,169,171,172,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,225,226,228,229,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[51,51,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,102,51,-283,51,102,102,102,-1,102,102,102,102,102,102,102,102,102,-6,51,102,262,-284,-285,102,102,-24,102,102,-300,-301,-304,-305,-308,-309,102,102,-330,-331,102,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,102,51,102,262,102,51,102,262,102,-90,-88,-89,51,51,51,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-322,102,102,102,102,102,262,102,102,262,102,102,262,262,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,-25,-271,-272,102,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,51,262,102,51,102,51,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,51,-327,-329,102,102,102,51,51,102,-286,-290,102,102,102,-312,-313,51,51,51,102,102,51,102,102,-332,51,51,-287,-288,-289,102,51,-293,-314,-328,-333,51,51,-294,51,51,51,-291,51,-295,-315,-292,]),'THIS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,169,171,172,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,225,226,228,229,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[57,57,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,57,57,-283,57,57,57,57,-1,57,57,57,57,57,57,57,57,57,-6,57,57,265,-284,-285,57,57,-24,57,57,-300,-301,-304,-305,-308,-309,57,57,-330,-331,57,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,57,57,57,265,57,57,57,265,57,-90,-88,-89,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-322,57,57,57,57,57,265,57,57,265,57,57,265,265,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-25,-271,-272,57,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,57,265,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-327,-329,57,57,57,57,57,57,-286,-290,57,57,57,-312,-313,57,57,57,57,57,57,57,57,-332,57,57,-287,-288,-289,57,57,-293,-314,-328,-333,57,57,-294,57,57,57,-291,57,-295,-315,-292,]),'LPAREN':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,28,30,31,32,33,36,37,38,39,43,48,50,51,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,90,92,99,101,102,104,105,107,108,109,111,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,171,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,216,217,218,221,222,223,224,226,227,228,231,232,233,234,235,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,310,327,328,329,330,331,332,335,336,337,338,339,346,347,352,353,354,356,357,358,382,390,393,394,398,400,401,402,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,455,456,457,458,459,460,464,466,467,468,471,476,478,482,484,486,506,507,512,515,516,519,524,526,531,533,534,539,541,543,545,546,548,549,550,552,554,556,558,563,564,565,568,569,571,572,574,575,576,579,580,581,582,586,],[25,25,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,91,-78,25,25,-283,128,25,131,132,25,142,143,25,-37,168,168,25,-1,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,25,25,25,25,25,25,25,25,25,-6,211,25,168,168,25,-105,-106,-76,-77,91,-78,-284,-285,25,25,-24,25,25,-300,-301,-304,-305,-308,-309,25,25,-330,-331,25,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,25,25,-124,25,25,25,-123,25,168,25,-90,-88,-89,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-322,-82,25,25,25,25,-120,25,25,-119,25,168,25,25,397,-92,-101,-102,-103,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-25,-271,-272,25,425,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,452,-126,-127,-113,-114,-83,-84,-1,-91,25,-122,-108,-109,-93,25,474,475,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-327,-329,25,-125,-128,25,-112,25,25,25,25,-121,-107,-94,-286,-290,25,25,25,-312,-313,-85,25,-334,25,25,25,25,25,25,25,-332,-335,25,25,-287,-288,-289,25,25,-293,-314,-328,-333,-336,25,25,-294,25,25,25,-337,-291,25,-295,-315,-292,]),'LBRACKET':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,48,50,51,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,92,99,101,102,104,105,107,108,111,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,171,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,216,217,218,221,222,223,224,226,227,228,231,232,233,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,346,347,352,353,354,356,357,358,382,390,393,394,398,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,455,456,457,458,459,460,464,466,467,468,471,476,478,482,484,486,506,507,512,515,516,519,524,526,531,533,534,539,541,543,545,546,548,549,550,552,554,556,558,563,564,565,568,569,571,572,574,575,576,579,580,581,582,586,],[52,52,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-78,52,52,-283,52,52,52,-37,166,171,52,-1,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,52,52,52,52,52,52,52,52,52,-6,52,224,228,52,-105,-106,-76,-77,-78,-284,-285,52,52,-24,52,52,-300,-301,-304,-305,-308,-309,52,52,-330,-331,52,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,52,52,-124,52,52,52,-123,52,228,52,-90,-88,-89,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-322,-82,52,52,52,52,-120,52,52,-119,52,228,52,52,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-25,-271,-272,52,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-126,-127,-113,-114,-83,-84,-1,-91,52,-122,-108,-109,-93,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-327,-329,52,-125,-128,52,-112,52,52,52,52,-121,-107,-94,-286,-290,52,52,52,-312,-313,-85,52,-334,52,52,52,52,52,52,52,-332,-335,52,52,-287,-288,-289,52,52,-293,-314,-328,-333,-336,52,52,-294,52,52,52,-337,-291,52,-295,-315,-292,]),'NULL':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,169,171,172,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,225,226,228,229,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[67,67,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,67,67,-283,67,67,67,67,-1,67,67,67,67,67,67,67,67,67,-6,67,67,273,-284,-285,67,67,-24,67,67,-300,-301,-304,-305,-308,-309,67,67,-330,-331,67,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,67,67,67,273,67,67,67,273,67,-90,-88,-89,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-322,67,67,67,67,67,273,67,67,273,67,67,273,273,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-25,-271,-272,67,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,67,273,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,-327,-329,67,67,67,67,67,67,-286,-290,67,67,67,-312,-313,67,67,67,67,67,67,67,67,-332,67,67,-287,-288,-289,67,67,-293,-314,-328,-333,67,67,-294,67,67,67,-291,67,-295,-315,-292,]),'TRUE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,169,171,172,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,225,226,228,229,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[68,68,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,68,68,-283,68,68,68,68,-1,68,68,68,68,68,68,68,68,68,-6,68,68,274,-284,-285,68,68,-24,68,68,-300,-301,-304,-305,-308,-309,68,68,-330,-331,68,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,68,68,68,274,68,68,68,274,68,-90,-88,-89,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-322,68,68,68,68,68,274,68,68,274,68,68,274,274,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-25,-271,-272,68,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,68,274,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-327,-329,68,68,68,68,68,68,-286,-290,68,68,68,-312,-313,68,68,68,68,68,68,68,68,-332,68,68,-287,-288,-289,68,68,-293,-314,-328,-333,68,68,-294,68,68,68,-291,68,-295,-315,-292,]),'FALSE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,169,171,172,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,225,226,228,229,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[69,69,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,69,69,-283,69,69,69,69,-1,69,69,69,69,69,69,69,69,69,-6,69,69,275,-284,-285,69,69,-24,69,69,-300,-301,-304,-305,-308,-309,69,69,-330,-331,69,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,69,69,69,275,69,69,69,275,69,-90,-88,-89,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-322,69,69,69,69,69,275,69,69,275,69,69,275,275,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-25,-271,-272,69,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,69,275,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-327,-329,69,69,69,69,69,69,-286,-290,69,69,69,-312,-313,69,69,69,69,69,69,69,69,-332,69,69,-287,-288,-289,69,69,-293,-314,-328,-333,69,69,-294,69,69,69,-291,69,-295,-315,-292,]),'NUMBER':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,168,169,171,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,226,228,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[70,70,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,70,70,-283,70,70,70,70,-1,70,70,70,70,70,70,70,70,70,-6,70,70,70,-284,-285,70,70,-24,70,70,-300,-301,-304,-305,-308,-309,70,70,-330,-331,70,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,70,70,70,70,70,70,70,-90,-88,-89,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-322,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-25,-271,-272,70,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-327,-329,70,70,70,70,70,70,-286,-290,70,70,70,-312,-313,70,70,70,70,70,70,70,70,-332,70,70,-287,-288,-289,70,70,-293,-314,-328,-333,70,70,-294,70,70,70,-291,70,-295,-315,-292,]),'STRING':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,168,169,171,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,226,228,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[71,71,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,71,71,-283,71,71,71,71,-1,71,71,71,71,71,71,71,71,71,-6,71,71,71,-284,-285,71,71,-24,71,71,-300,-301,-304,-305,-308,-309,71,71,-330,-331,71,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,71,71,71,71,71,71,71,-90,-88,-89,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-322,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-25,-271,-272,71,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-327,-329,71,71,71,71,71,71,-286,-290,71,71,71,-312,-313,71,71,71,71,71,71,71,71,-332,71,71,-287,-288,-289,71,71,-293,-314,-328,-333,71,71,-294,71,71,71,-291,71,-295,-315,-292,]),'REGEX':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,51,52,77,78,82,83,84,85,86,87,88,89,92,102,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,168,169,171,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[72,72,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,72,72,-283,72,72,72,72,-1,72,72,72,72,72,72,72,72,72,-6,72,72,-284,-285,72,72,-24,72,72,-300,-301,-304,-305,-308,-309,72,72,-330,-331,72,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,72,72,72,72,72,72,72,-90,-88,-89,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-322,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-25,-271,-272,72,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-327,-329,72,72,72,72,72,72,-286,-290,72,72,72,-312,-313,72,72,72,72,72,72,72,72,-332,72,72,-287,-288,-289,72,72,-293,-314,-328,-333,72,72,-294,72,72,72,-291,72,-295,-315,-292,]),'DELETE':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,169,171,172,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,225,226,228,229,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[84,84,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,84,84,-283,84,84,84,-1,84,84,84,84,84,84,84,84,84,-6,84,253,-284,-285,84,84,-24,84,84,-300,-301,-304,-305,-308,-309,84,84,-330,-331,84,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,84,84,84,253,84,84,84,253,84,-90,-88,-89,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-322,84,84,84,84,84,253,84,84,253,84,84,253,253,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-25,-271,-272,84,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,84,253,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,-327,-329,84,84,84,84,84,84,-286,-290,84,84,84,-312,-313,84,84,84,84,84,84,84,84,-332,84,84,-287,-288,-289,84,84,-293,-314,-328,-333,84,84,-294,84,84,84,-291,84,-295,-315,-292,]),'VOID':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,169,171,172,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,225,226,228,229,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[85,85,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,85,85,-283,85,85,85,-1,85,85,85,85,85,85,85,85,85,-6,85,270,-284,-285,85,85,-24,85,85,-300,-301,-304,-305,-308,-309,85,85,-330,-331,85,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,85,85,85,270,85,85,85,270,85,-90,-88,-89,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-322,85,85,85,85,85,270,85,85,270,85,85,270,270,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-25,-271,-272,85,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,85,270,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-327,-329,85,85,85,85,85,85,-286,-290,85,85,85,-312,-313,85,85,85,85,85,85,85,85,-332,85,85,-287,-288,-289,85,85,-293,-314,-328,-333,85,85,-294,85,85,85,-291,85,-295,-315,-292,]),'TYPEOF':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,110,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,167,168,169,171,172,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,225,226,228,229,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[86,86,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,86,86,-283,86,86,86,-1,86,86,86,86,86,86,86,86,86,-6,86,268,-284,-285,86,86,-24,86,86,-300,-301,-304,-305,-308,-309,86,86,-330,-331,86,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,86,86,86,268,86,86,86,268,86,-90,-88,-89,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-322,86,86,86,86,86,268,86,86,268,86,86,268,268,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-25,-271,-272,86,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,86,268,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-327,-329,86,86,86,86,86,86,-286,-290,86,86,86,-312,-313,86,86,86,86,86,86,86,86,-332,86,86,-287,-288,-289,86,86,-293,-314,-328,-333,86,86,-294,86,86,86,-291,86,-295,-315,-292,]),'PLUSPLUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,92,96,98,99,101,104,105,107,108,111,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,171,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,202,215,216,217,218,221,222,223,224,226,227,228,230,231,232,233,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,314,327,328,329,330,331,332,335,336,337,338,344,346,347,352,353,354,356,357,358,382,390,393,394,398,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,455,456,457,458,459,460,464,466,467,468,471,476,478,482,484,486,488,506,507,512,515,516,519,524,526,531,533,534,539,541,543,545,546,548,549,550,552,554,556,558,563,564,565,568,569,571,572,574,575,576,579,580,581,582,586,],[82,82,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-78,82,82,-283,82,82,82,-37,149,-133,-134,-117,-1,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,82,82,82,82,82,82,82,82,82,-6,82,219,-131,-132,-115,-105,-106,-76,-77,-78,-284,-285,82,82,-24,82,82,-300,-301,-304,-305,-308,-309,82,82,-330,-331,82,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,82,82,-124,82,82,82,-123,82,-118,-115,82,-90,-88,-89,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,219,-322,-82,82,82,82,82,-120,82,82,-119,82,-116,-115,82,82,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-25,-271,-272,82,219,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,149,-126,-127,-113,-114,-83,-84,-1,-91,82,-122,-108,-109,-93,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-327,-329,82,-125,-128,82,-112,82,82,82,82,-121,-107,-94,-286,-290,82,82,82,219,-312,-313,-85,82,-334,82,82,82,82,82,82,82,-332,-335,82,82,-287,-288,-289,82,82,-293,-314,-328,-333,-336,82,82,-294,82,82,82,-337,-291,82,-295,-315,-292,]),'MINUSMINUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,77,78,82,83,84,85,86,87,88,89,92,96,98,99,101,104,105,107,108,111,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,171,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,202,215,216,217,218,221,222,223,224,226,227,228,230,231,232,233,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,314,327,328,329,330,331,332,335,336,337,338,344,346,347,352,353,354,356,357,358,382,390,393,394,398,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,455,456,457,458,459,460,464,466,467,468,471,476,478,482,484,486,488,506,507,512,515,516,519,524,526,531,533,534,539,541,543,545,546,548,549,550,552,554,556,558,563,564,565,568,569,571,572,574,575,576,579,580,581,582,586,],[83,83,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-78,83,83,-283,83,83,83,-37,150,-133,-134,-117,-1,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,83,83,83,83,83,83,83,83,83,-6,83,220,-131,-132,-115,-105,-106,-76,-77,-78,-284,-285,83,83,-24,83,83,-300,-301,-304,-305,-308,-309,83,83,-330,-331,83,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,83,83,-124,83,83,83,-123,83,-118,-115,83,-90,-88,-89,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,220,-322,-82,83,83,83,83,-120,83,83,-119,83,-116,-115,83,83,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-25,-271,-272,83,220,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,150,-126,-127,-113,-114,-83,-84,-1,-91,83,-122,-108,-109,-93,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-327,-329,83,-125,-128,83,-112,83,83,83,83,-121,-107,-94,-286,-290,83,83,83,220,-312,-313,-85,83,-334,83,83,83,83,83,83,83,-332,-335,83,83,-287,-288,-289,83,83,-293,-314,-328,-333,-336,83,83,-294,83,83,83,-337,-291,83,-295,-315,-292,]),'PLUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,96,98,99,101,104,105,107,108,111,116,117,118,119,120,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,171,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,215,216,217,218,219,220,221,222,223,224,226,227,228,230,231,232,233,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,314,327,328,329,330,331,332,335,336,337,338,344,346,347,352,353,354,356,357,358,372,373,374,375,376,377,378,379,382,390,393,394,398,400,414,415,416,417,418,419,420,421,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,455,456,457,458,459,460,464,466,467,468,471,476,478,482,484,486,488,506,507,512,515,516,519,524,526,531,533,534,539,541,543,545,546,548,549,550,552,554,556,558,563,564,565,568,569,571,572,574,575,576,579,580,581,582,586,],[77,77,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-78,77,77,-283,77,77,77,-37,-138,-133,-134,-117,-1,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,196,-165,77,77,-158,-143,-144,77,77,77,77,77,77,77,-6,77,-135,-131,-132,-115,-105,-106,-76,-77,-78,297,-162,-154,-141,-142,-284,-285,77,77,-24,77,77,-300,-301,-304,-305,-308,-309,77,77,-330,-331,77,-139,-140,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,77,77,-124,77,77,77,-123,77,-118,-115,77,-90,-88,-89,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-322,-82,77,77,-136,-137,77,77,-120,77,77,-119,77,-116,-115,77,77,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-25,-271,-272,77,-135,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-138,-126,-127,-113,-114,-83,-84,-1,-91,297,297,297,-166,-167,-159,-160,-161,77,-122,-108,-109,-93,77,297,297,297,-163,-164,-155,-156,-157,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-327,-329,77,-125,-128,77,-112,77,77,77,77,-121,-107,-94,-286,-290,77,77,77,-135,-312,-313,-85,77,-334,77,77,77,77,77,77,77,-332,-335,77,77,-287,-288,-289,77,77,-293,-314,-328,-333,-336,77,77,-294,77,77,77,-337,-291,77,-295,-315,-292,]),'MINUS':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,28,31,36,39,43,45,47,48,50,52,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,92,96,98,99,101,104,105,107,108,111,116,117,118,119,120,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,168,169,170,171,173,174,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,215,216,217,218,219,220,221,222,223,224,226,227,228,230,231,232,233,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,314,327,328,329,330,331,332,335,336,337,338,344,346,347,352,353,354,356,357,358,372,373,374,375,376,377,378,379,382,390,393,394,398,400,414,415,416,417,418,419,420,421,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,455,456,457,458,459,460,464,466,467,468,471,476,478,482,484,486,488,506,507,512,515,516,519,524,526,531,533,534,539,541,543,545,546,548,549,550,552,554,556,558,563,564,565,568,569,571,572,574,575,576,579,580,581,582,586,],[78,78,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-78,78,78,-283,78,78,78,-37,-138,-133,-134,-117,-1,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,197,-165,78,78,-158,-143,-144,78,78,78,78,78,78,78,-6,78,-135,-131,-132,-115,-105,-106,-76,-77,-78,298,-162,-154,-141,-142,-284,-285,78,78,-24,78,78,-300,-301,-304,-305,-308,-309,78,78,-330,-331,78,-139,-140,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,78,78,-124,78,78,78,-123,78,-118,-115,78,-90,-88,-89,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-322,-82,78,78,-136,-137,78,78,-120,78,78,-119,78,-116,-115,78,78,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-25,-271,-272,78,-135,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-138,-126,-127,-113,-114,-83,-84,-1,-91,298,298,298,-166,-167,-159,-160,-161,78,-122,-108,-109,-93,78,298,298,298,-163,-164,-155,-156,-157,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-327,-329,78,-125,-128,78,-112,78,78,78,78,-121,-107,-94,-286,-290,78,78,78,-135,-312,-313,-85,78,-334,78,78,78,78,78,78,78,-332,-335,78,78,-287,-288,-289,78,78,-293,-314,-328,-333,-336,78,78,-294,78,78,78,-337,-291,78,-295,-315,-292,]),'BNOT':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,168,169,171,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[87,87,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,87,87,-283,87,87,87,-1,87,87,87,87,87,87,87,87,87,-6,87,-284,-285,87,87,-24,87,87,-300,-301,-304,-305,-308,-309,87,87,-330,-331,87,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,87,87,87,87,87,87,87,-90,-88,-89,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-322,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-25,-271,-272,87,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-327,-329,87,87,87,87,87,87,-286,-290,87,87,87,-312,-313,87,87,87,87,87,87,87,87,-332,87,87,-287,-288,-289,87,87,-293,-314,-328,-333,87,87,-294,87,87,87,-291,87,-295,-315,-292,]),'NOT':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,25,26,28,31,36,39,52,77,78,82,83,84,85,86,87,88,89,92,125,126,127,128,130,131,132,133,134,136,137,139,140,142,143,146,147,148,151,152,153,154,155,156,157,158,159,160,161,162,163,164,166,168,169,171,175,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,215,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,307,327,328,329,330,331,332,335,336,337,338,357,358,382,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,451,453,454,457,459,460,464,466,476,478,482,484,486,506,507,515,519,524,526,531,533,534,539,541,545,546,548,549,550,552,554,556,558,563,564,568,569,571,572,574,575,579,580,581,582,586,],[88,88,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,88,88,-283,88,88,88,-1,88,88,88,88,88,88,88,88,88,-6,88,-284,-285,88,88,-24,88,88,-300,-301,-304,-305,-308,-309,88,88,-330,-331,88,-253,-254,-255,-256,-257,-258,-259,-260,-261,-262,-263,-264,88,88,88,88,88,88,88,-90,-88,-89,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-322,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-25,-271,-272,88,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-1,-91,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-327,-329,88,88,88,88,88,88,-286,-290,88,88,88,-312,-313,88,88,88,88,88,88,88,88,-332,88,88,-287,-288,-289,88,88,-293,-314,-328,-333,88,88,-294,88,88,88,-291,88,-295,-315,-292,]),'RBRACE':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,28,43,57,58,59,61,62,63,64,65,67,68,69,70,71,72,89,95,96,97,98,99,100,101,103,104,105,106,107,108,110,111,112,113,114,115,116,117,118,119,120,121,125,126,130,133,134,136,137,139,140,146,147,201,202,203,204,205,206,207,208,209,210,215,216,219,220,223,227,230,231,235,236,237,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,302,303,304,327,328,329,330,331,332,335,336,337,338,347,354,356,382,386,388,390,391,393,394,395,396,398,399,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,451,453,456,460,462,463,464,467,468,471,472,473,476,478,506,507,508,512,514,515,516,517,518,519,535,536,537,538,541,542,543,544,545,546,548,549,550,556,558,559,561,563,564,565,566,567,568,571,573,574,575,576,577,578,579,581,582,583,584,585,586,],[-3,-4,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-1,-283,-37,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,-6,-247,-135,-241,-131,-132,-235,-115,-229,-105,-106,-223,-76,-77,235,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,302,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-322,-82,-136,-137,-120,-119,-116,-115,-92,398,-95,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,-127,-83,-84,-1,-248,-236,-122,-230,-108,-109,-224,-218,-93,471,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-327,-329,-128,-1,516,-340,-1,-121,-107,-94,-96,-97,-286,-290,-312,-313,-1,-85,541,-1,-334,543,-242,-1,558,-316,-317,-318,-332,564,-335,565,-1,-1,-287,-288,-289,-293,-314,-1,-319,-328,-333,-336,576,577,-1,-294,582,-1,-1,-337,-98,585,-291,-295,-315,-321,-320,-99,-292,]),'CASE':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,89,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,399,451,453,476,478,506,507,508,537,538,541,548,549,550,556,558,559,561,563,564,571,574,575,579,581,582,583,584,586,],[-3,-4,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-283,-6,248,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,248,248,-322,248,248,248,248,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,248,-327,-329,-286,-290,-312,-313,539,539,-318,-332,-287,-288,-289,-293,-314,539,-319,-328,-333,-294,-1,-1,-291,-295,-315,-321,-320,-292,]),'DEFAULT':([3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,89,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,399,451,453,476,478,506,507,508,535,536,537,538,541,548,549,550,556,558,561,563,564,571,575,579,581,582,584,586,],[-3,-4,-5,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-283,-6,252,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,252,252,-322,252,252,252,252,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,252,-327,-329,-286,-290,-312,-313,-1,560,-316,-317,-318,-332,-287,-288,-289,-293,-314,-319,-328,-333,-294,-1,-291,-295,-315,-320,-292,]),'ELSE':([8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,28,110,125,126,130,133,134,136,137,139,140,146,147,167,172,215,225,229,239,240,302,303,304,327,328,329,330,331,332,335,336,337,338,399,451,453,476,478,506,507,541,548,549,550,556,558,563,564,571,579,581,582,586,],[-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-22,-23,-283,255,-284,-285,-24,-300,-301,-304,-305,-308,-309,-330,-331,255,255,-322,255,255,255,255,-25,-271,-272,-302,-303,-306,-307,-310,-311,-323,-324,-325,-326,255,-327,-329,524,-290,-312,-313,-332,-287,-288,-289,-293,-314,-328,-333,-294,-291,-295,-315,-292,]),'COLON':([24,43,57,58,59,61,62,63,64,65,67,68,69,70,71,72,94,95,96,97,98,99,100,101,103,104,105,106,107,108,111,112,113,114,115,116,117,118,119,120,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,238,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,318,319,320,321,322,323,324,325,326,342,347,354,356,385,386,387,388,390,391,393,394,395,396,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,456,467,468,471,488,489,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,512,516,518,543,557,560,562,565,576,],[92,-37,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,-265,-247,-135,-241,-131,-132,-235,-115,-229,-105,-106,-223,-76,-77,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,400,-101,-102,-103,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-249,-243,-237,-231,-225,-219,-213,-201,-183,454,-127,-83,-84,-266,-248,466,-236,-122,-230,-108,-109,-224,-218,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-128,-121,-107,-94,-135,-250,534,-238,-232,-226,-220,-214,-202,-203,-204,-205,-184,-185,-186,-187,-188,-85,-334,-242,-335,-244,574,575,-336,-337,]),'PERIOD':([24,43,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,99,101,104,105,107,108,111,165,170,174,216,223,227,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,512,516,541,543,564,565,576,],[-78,-37,167,172,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,225,229,-105,-106,-76,-77,-78,-124,-123,229,-82,-120,-119,229,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,-85,-334,-336,-335,-337,-336,-337,]),'EQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,124,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,429,455,456,458,467,468,471,488,512,516,529,541,543,564,565,576,],[-78,-37,151,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,151,-131,-132,-115,-105,-106,-76,-77,-78,307,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,151,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,486,-125,-128,-112,-121,-107,-94,151,-85,-334,486,-336,-335,-337,-336,-337,]),'MULTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,152,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,152,-131,-132,-115,-105,-106,-76,-77,-78,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,152,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,152,-85,-334,-336,-335,-337,-336,-337,]),'DIVEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,153,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,153,-131,-132,-115,-105,-106,-76,-77,-78,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,153,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,153,-85,-334,-336,-335,-337,-336,-337,]),'MODEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,154,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,154,-131,-132,-115,-105,-106,-76,-77,-78,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,154,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,154,-85,-334,-336,-335,-337,-336,-337,]),'PLUSEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,155,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,155,-131,-132,-115,-105,-106,-76,-77,-78,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,155,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,155,-85,-334,-336,-335,-337,-336,-337,]),'MINUSEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,156,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,156,-131,-132,-115,-105,-106,-76,-77,-78,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,156,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,156,-85,-334,-336,-335,-337,-336,-337,]),'LSHIFTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,157,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,157,-131,-132,-115,-105,-106,-76,-77,-78,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,157,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,157,-85,-334,-336,-335,-337,-336,-337,]),'RSHIFTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,158,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,158,-131,-132,-115,-105,-106,-76,-77,-78,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,158,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,158,-85,-334,-336,-335,-337,-336,-337,]),'URSHIFTEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,159,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,159,-131,-132,-115,-105,-106,-76,-77,-78,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,159,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,159,-85,-334,-336,-335,-337,-336,-337,]),'ANDEQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,160,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,160,-131,-132,-115,-105,-106,-76,-77,-78,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,160,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,160,-85,-334,-336,-335,-337,-336,-337,]),'XOREQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,161,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,161,-131,-132,-115,-105,-106,-76,-77,-78,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,161,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,161,-85,-334,-336,-335,-337,-336,-337,]),'OREQUAL':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,96,98,99,101,104,105,107,108,111,165,170,173,174,216,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,346,347,352,353,354,356,390,393,394,398,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,162,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,162,-131,-132,-115,-105,-106,-76,-77,-78,-124,-123,-118,-115,-82,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,162,-126,-127,-113,-114,-83,-84,-122,-108,-109,-93,-125,-128,-112,-121,-107,-94,162,-85,-334,-336,-335,-337,-336,-337,]),'MULT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,76,79,80,81,96,98,99,101,104,105,107,108,111,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,344,346,347,352,353,354,356,375,376,377,378,379,390,393,394,398,417,418,419,420,421,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,198,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,299,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,-138,-126,-127,-113,-114,-83,-84,299,299,-159,-160,-161,-122,-108,-109,-93,299,299,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,-85,-334,-336,-335,-337,-336,-337,]),'DIV':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,76,79,80,81,96,98,99,101,104,105,107,108,111,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,344,346,347,352,353,354,356,375,376,377,378,379,390,393,394,398,417,418,419,420,421,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,199,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,300,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,-138,-126,-127,-113,-114,-83,-84,300,300,-159,-160,-161,-122,-108,-109,-93,300,300,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,-85,-334,-336,-335,-337,-336,-337,]),'MOD':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,76,79,80,81,96,98,99,101,104,105,107,108,111,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,344,346,347,352,353,354,356,375,376,377,378,379,390,393,394,398,417,418,419,420,421,455,456,458,467,468,471,488,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,200,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,301,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,-138,-126,-127,-113,-114,-83,-84,301,301,-159,-160,-161,-122,-108,-109,-93,301,301,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,-85,-334,-336,-335,-337,-336,-337,]),'LSHIFT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,326,344,346,347,352,353,354,356,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,193,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,294,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,294,-138,-126,-127,-113,-114,-83,-84,294,294,294,294,294,294,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,294,294,294,294,294,294,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,294,294,294,294,294,-85,-334,-336,-335,-337,-336,-337,]),'RSHIFT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,326,344,346,347,352,353,354,356,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,194,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,295,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,295,-138,-126,-127,-113,-114,-83,-84,295,295,295,295,295,295,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,295,295,295,295,295,295,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,295,295,295,295,295,-85,-334,-336,-335,-337,-336,-337,]),'URSHIFT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,326,344,346,347,352,353,354,356,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,195,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,296,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,296,-138,-126,-127,-113,-114,-83,-84,296,296,296,296,296,296,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,296,296,296,296,296,296,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,296,296,296,296,296,-85,-334,-336,-335,-337,-336,-337,]),'LT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,325,326,344,346,347,352,353,354,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,187,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,288,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,444,-183,-138,-126,-127,-113,-114,-83,-84,288,288,288,288,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,288,288,288,288,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,288,288,288,288,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'GT':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,325,326,344,346,347,352,353,354,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,188,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,289,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,445,-183,-138,-126,-127,-113,-114,-83,-84,289,289,289,289,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,289,289,289,289,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,289,289,289,289,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'LE':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,325,326,344,346,347,352,353,354,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,189,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,290,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,446,-183,-138,-126,-127,-113,-114,-83,-84,290,290,290,290,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,290,290,290,290,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,290,290,290,290,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'GE':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,325,326,344,346,347,352,353,354,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,190,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,291,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,447,-183,-138,-126,-127,-113,-114,-83,-84,291,291,291,291,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,291,291,291,291,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,291,291,291,291,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'INSTANCEOF':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,107,108,110,111,114,115,116,117,118,119,120,149,150,165,167,170,172,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,225,227,229,230,231,235,239,240,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,325,326,344,346,347,352,353,354,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,399,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,191,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,261,-78,292,-176,-168,-162,-154,-141,-142,-139,-140,-124,261,-123,261,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,261,-119,261,-116,-115,-92,261,261,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,448,-183,-138,-126,-127,-113,-114,-83,-84,292,292,292,292,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,261,292,292,292,292,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,292,292,292,292,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'IN':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,107,108,110,111,114,115,116,117,118,119,120,149,150,165,167,170,172,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,225,227,229,230,231,235,239,240,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,318,319,320,321,322,323,324,325,326,344,346,347,352,353,354,356,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,399,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,429,455,456,458,467,468,471,485,488,489,492,493,494,495,496,497,498,499,500,501,502,503,504,505,512,516,532,541,543,557,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,192,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,260,-78,293,-176,-168,-162,-154,-141,-142,-139,-140,-124,260,-123,260,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,260,-119,260,-116,-115,-92,260,260,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,431,-249,-243,-237,-231,-225,-219,-213,-201,-183,-138,-126,-127,-113,-114,-83,-84,293,293,293,293,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,260,293,293,293,293,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,484,-125,-128,-112,-121,-107,-94,531,-135,-250,-238,-232,-226,-220,-214,293,293,293,293,-184,-185,-186,-187,-188,-85,-334,-282,-336,-335,-244,-337,-336,-337,]),'EQEQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,113,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,324,325,326,344,346,347,352,353,354,356,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,496,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,183,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,284,-196,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,440,-201,-183,-138,-126,-127,-113,-114,-83,-84,183,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,284,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,440,-202,-203,-204,-205,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'NE':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,113,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,324,325,326,344,346,347,352,353,354,356,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,496,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,184,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,285,-196,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,441,-201,-183,-138,-126,-127,-113,-114,-83,-84,184,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,285,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,441,-202,-203,-204,-205,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'STREQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,113,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,324,325,326,344,346,347,352,353,354,356,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,496,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,185,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,286,-196,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,442,-201,-183,-138,-126,-127,-113,-114,-83,-84,185,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,286,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,442,-202,-203,-204,-205,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'STRNEQ':([24,43,45,47,48,50,54,55,57,58,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,113,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,324,325,326,344,346,347,352,353,354,356,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,496,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,-26,-27,-28,-29,-30,186,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,287,-196,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,443,-201,-183,-138,-126,-127,-113,-114,-83,-84,186,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,-93,287,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,443,-202,-203,-204,-205,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'BAND':([24,43,45,47,48,50,54,55,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,107,108,111,112,113,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,323,324,325,326,344,346,347,352,353,354,356,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,396,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,495,496,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,-79,-80,-81,182,-26,-27,-28,-29,-30,-215,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,-76,-77,-78,283,-211,-196,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,439,-213,-201,-183,-138,-126,-127,-113,-114,-83,-84,182,-216,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,283,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,439,-214,-202,-203,-204,-205,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'BXOR':([24,43,45,47,48,50,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,104,105,106,107,108,111,112,113,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,322,323,324,325,326,344,346,347,352,353,354,356,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,393,394,395,396,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,494,495,496,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,-110,-111,181,-79,-80,-81,-221,-26,-27,-28,-29,-30,-215,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,-105,-106,233,-76,-77,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,438,-219,-213,-201,-183,-138,-126,-127,-113,-114,-83,-84,181,-222,-216,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,-108,-109,233,-218,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,438,-220,-214,-202,-203,-204,-205,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'BOR':([24,43,45,47,48,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,101,103,104,105,106,107,108,111,112,113,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,321,322,323,324,325,326,344,346,347,350,352,353,354,356,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,390,391,393,394,395,396,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,493,494,495,496,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,-117,180,-110,-111,-227,-79,-80,-81,-221,-26,-27,-28,-29,-30,-215,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-135,-131,-132,-115,232,-105,-106,-223,-76,-77,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,437,-225,-219,-213,-201,-183,-138,-126,-127,180,-113,-114,-83,-84,-228,-222,-216,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-122,232,-108,-109,-224,-218,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,437,-226,-220,-214,-202,-203,-204,-205,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'AND':([24,43,45,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,98,99,100,101,103,104,105,106,107,108,111,112,113,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,320,321,322,323,324,325,326,343,344,346,347,350,352,353,354,356,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,388,390,391,393,394,395,396,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,-133,-134,169,-117,-233,-110,-111,-227,-79,-80,-81,-221,-26,-27,-28,-29,-30,-215,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-135,-131,-132,226,-115,-229,-105,-106,-223,-76,-77,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,436,-231,-225,-219,-213,-201,-183,169,-138,-126,-127,-234,-113,-114,-83,-84,-228,-222,-216,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,226,-122,-230,-108,-109,-224,-218,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,436,-232,-226,-220,-214,-202,-203,-204,-205,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'CONDOP':([24,43,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,97,98,99,100,101,103,104,105,106,107,108,111,112,113,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,319,320,321,322,323,324,325,326,343,344,346,347,350,352,353,354,356,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,388,390,391,393,394,395,396,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,163,-133,-134,-239,-117,-233,-110,-111,-227,-79,-80,-81,-221,-26,-27,-28,-29,-30,-215,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-135,221,-131,-132,-235,-115,-229,-105,-106,-223,-76,-77,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,434,-237,-231,-225,-219,-213,-201,-183,-240,-138,-126,-127,-234,-113,-114,-83,-84,-228,-222,-216,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-236,-122,-230,-108,-109,-224,-218,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,-238,-232,-226,-220,-214,-202,-203,-204,-205,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'OR':([24,43,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,96,97,98,99,100,101,103,104,105,106,107,108,111,112,113,114,115,116,117,118,119,120,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,314,319,320,321,322,323,324,325,326,343,344,346,347,350,352,353,354,356,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,388,390,391,393,394,395,396,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,455,456,458,467,468,471,488,492,493,494,495,496,497,498,499,500,501,502,503,504,505,512,516,541,543,564,565,576,],[-78,-37,-138,164,-133,-134,-239,-117,-233,-110,-111,-227,-79,-80,-81,-221,-26,-27,-28,-29,-30,-215,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-135,222,-131,-132,-235,-115,-229,-105,-106,-223,-76,-77,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-135,435,-237,-231,-225,-219,-213,-201,-183,-240,-138,-126,-127,-234,-113,-114,-83,-84,-228,-222,-216,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-236,-122,-230,-108,-109,-224,-218,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-125,-128,-112,-121,-107,-94,-135,-238,-232,-226,-220,-214,-202,-203,-204,-205,-184,-185,-186,-187,-188,-85,-334,-336,-335,-337,-336,-337,]),'AUTOSEMI':([24,29,34,35,36,41,42,43,44,45,46,47,48,49,50,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,94,95,96,97,98,99,100,101,103,104,105,106,107,108,111,112,113,114,115,116,117,118,119,120,122,123,124,135,138,141,144,149,150,165,170,173,174,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,306,308,341,343,344,346,347,350,352,353,354,356,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,385,386,388,390,391,393,394,395,396,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,455,456,458,467,468,471,510,512,516,518,525,541,543,564,565,576,],[-78,126,134,137,140,147,-269,-37,-251,-138,-245,-133,-134,-239,-117,-233,-110,-111,-227,-79,-80,-81,-221,-26,-27,-28,-29,-30,-215,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,-265,-247,-135,-241,-131,-132,-235,-115,-229,-105,-106,-223,-76,-77,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,304,-273,-277,328,330,332,336,-139,-140,-124,-123,-118,-115,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-278,-270,-252,-240,-138,-126,-127,-234,-113,-114,-83,-84,-228,-222,-216,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,-266,-248,-236,-122,-230,-108,-109,-224,-218,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-274,-281,-125,-128,-112,-121,-107,-94,-246,-85,-334,-242,550,-336,-335,-337,-336,-337,]),'COMMA':([24,29,42,43,44,45,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,79,80,81,93,94,95,96,97,98,99,100,101,103,104,105,106,107,108,111,112,113,114,115,116,117,118,119,120,122,123,124,141,144,149,150,165,170,173,174,176,177,179,201,202,203,204,205,206,207,208,209,210,213,214,216,219,220,223,227,230,231,235,236,237,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,306,308,309,311,314,316,317,318,319,320,321,322,323,324,325,326,333,334,341,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,381,385,386,388,389,390,391,392,393,394,395,396,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,428,429,430,455,456,458,465,467,468,470,471,472,473,477,481,485,487,488,489,490,492,493,494,495,496,497,498,499,500,501,502,503,504,505,510,511,512,513,516,518,528,529,530,532,541,543,553,555,557,562,564,565,576,577,585,],[-78,127,-269,-37,-251,-138,-245,-133,-134,-239,-117,177,-233,-110,-111,-227,-79,-80,-81,-221,-26,-27,-28,-29,-30,-215,-33,-31,-32,-34,-35,-36,-206,-189,-172,-165,-158,-143,-144,217,-265,-247,-135,-241,-131,-132,-235,-115,-229,-105,-106,-223,-76,-77,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,305,-273,-277,217,217,-139,-140,-124,-123,-118,-115,357,-90,358,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,384,-338,-82,-136,-137,-120,-119,-116,-115,-92,399,-95,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-278,-270,217,217,-135,433,-267,-249,-243,-237,-231,-225,-219,-213,-201,-183,217,217,-252,-240,-138,217,-126,-127,457,-129,-234,217,-113,-114,-83,-86,-84,177,-91,-228,-222,-216,-207,-208,-209,-210,-190,-191,-192,-193,-194,-195,-173,-174,-175,-166,-167,-159,-160,-161,384,-266,-248,-236,217,-122,-230,217,-108,-109,-224,-218,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-274,-281,483,-279,-275,-125,-128,-112,-339,-121,-107,384,-94,-96,-97,217,217,-280,217,-135,-250,-268,-238,-232,-226,-220,-214,-202,-203,-204,-205,-184,-185,-186,-187,-188,-246,-130,-85,-87,-334,-242,-276,-279,217,-282,-336,-335,-280,217,-244,217,-337,-336,-337,-98,-99,]),'RPAREN':([43,57,58,59,61,62,63,64,65,67,68,69,70,71,72,91,93,94,95,96,97,98,99,100,101,103,104,105,106,107,108,111,112,113,114,115,116,117,118,119,120,168,201,202,203,204,205,206,207,208,209,210,211,213,214,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,309,311,333,334,347,348,349,354,356,381,385,386,388,390,391,393,394,395,396,397,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,456,465,467,468,470,471,474,477,480,481,487,509,511,512,516,518,522,523,526,530,543,551,552,555,565,570,576,],[-37,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,212,216,-265,-247,-135,-241,-131,-132,-235,-115,-229,-105,-106,-223,-76,-77,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,347,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,380,383,-338,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,424,426,449,450,-127,456,-129,-83,-84,461,-266,-248,-236,-122,-230,-108,-109,-224,-218,469,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-128,-339,-121,-107,520,-94,521,525,-296,-297,533,540,-130,-85,-334,-242,547,-104,-1,554,-335,569,-1,572,-336,580,-337,]),'RBRACKET':([43,52,57,58,59,61,62,63,64,65,67,68,69,70,71,72,94,95,96,97,98,99,100,101,103,104,105,106,107,108,111,112,113,114,115,116,117,118,119,120,175,176,177,178,179,201,202,203,204,205,206,207,208,209,210,216,219,220,223,227,230,231,235,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,345,347,351,354,355,356,357,358,385,386,388,389,390,391,392,393,394,395,396,398,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,456,459,467,468,471,512,513,516,518,543,565,576,],[-37,-1,-79,-80,-81,-26,-27,-28,-29,-30,-33,-31,-32,-34,-35,-36,-265,-247,-135,-241,-131,-132,-235,-115,-229,-105,-106,-223,-76,-77,-78,-217,-211,-196,-176,-168,-162,-154,-141,-142,354,356,-90,-88,-89,-150,-135,-151,-148,-149,-145,-146,-147,-152,-153,-82,-136,-137,-120,-119,-116,-115,-92,-100,-74,-75,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,455,-127,458,-83,-86,-84,-1,-91,-266,-248,-236,467,-122,-230,468,-108,-109,-224,-218,-93,-212,-197,-198,-199,-200,-177,-178,-179,-180,-181,-182,-169,-170,-171,-163,-164,-155,-156,-157,-128,512,-121,-107,-94,-85,-87,-334,-242,-335,-336,-337,]),'GETPROP':([110,399,],[239,239,]),'SETPROP':([110,399,],[240,240,]),'CATCH':([110,145,167,172,225,229,239,240,302,399,],[249,339,249,249,249,249,249,249,-25,249,]),'FINALLY':([110,145,167,172,225,229,239,240,302,337,399,563,],[256,340,256,256,256,256,256,256,-25,340,256,-328,]),'CLASS':([110,167,172,225,229,239,240,399,],[276,276,276,276,276,276,276,276,]),'CONST':([110,167,172,225,229,239,240,399,],[277,277,277,277,277,277,277,277,]),'ENUM':([110,167,172,225,229,239,240,399,],[278,278,278,278,278,278,278,278,]),'EXPORT':([110,167,172,225,229,239,240,399,],[279,279,279,279,279,279,279,279,]),'EXTENDS':([110,167,172,225,229,239,240,399,],[280,280,280,280,280,280,280,280,]),'IMPORT':([110,167,172,225,229,239,240,399,],[281,281,281,281,281,281,281,281,]),'SUPER':([110,167,172,225,229,239,240,399,],[282,282,282,282,282,282,282,282,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'source_elements':([0,26,382,460,464,515,519,545,546,568,574,575,],[2,121,463,463,463,463,463,463,463,463,583,584,]),'empty':([0,26,52,132,357,382,427,460,464,482,508,515,519,526,545,546,552,559,568,574,575,],[3,3,178,315,178,3,480,3,3,480,536,3,3,480,3,3,480,536,3,3,3,]),'source_element_list':([0,26,382,460,464,515,519,545,546,568,574,575,],[4,4,4,4,4,4,4,4,4,4,4,4,]),'source_element':([0,4,26,382,460,464,515,519,545,546,568,574,575,],[5,89,5,5,5,5,5,5,5,5,5,5,5,]),'statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[6,6,6,129,215,6,476,478,506,6,6,6,6,548,556,6,6,571,6,579,581,6,6,586,]),'function_declaration':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[7,7,7,130,130,7,130,130,130,7,7,7,7,130,130,7,7,130,7,130,130,7,7,130,]),'block':([0,4,26,31,40,92,340,382,424,426,449,460,464,515,519,524,533,540,545,546,554,568,569,572,574,575,580,],[8,8,8,8,145,8,453,8,8,8,8,8,8,8,8,8,8,563,8,8,8,8,8,8,8,8,8,]),'variable_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'empty_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'expr_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'if_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'iteration_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'continue_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'break_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'return_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'with_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'switch_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'labelled_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'throw_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'try_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'debugger_statement':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'identifier':([0,4,23,25,26,27,31,34,35,36,39,51,77,78,82,83,84,85,86,87,88,91,92,102,109,110,127,128,131,132,142,143,148,163,164,166,167,168,169,171,172,175,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,211,217,218,221,222,224,225,226,228,229,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,305,307,313,382,384,397,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,452,454,457,459,460,464,466,475,482,483,484,486,515,519,524,526,531,533,534,539,545,546,552,554,568,569,572,574,575,580,],[24,24,90,111,24,124,24,135,138,111,111,111,111,111,111,111,111,111,111,111,111,214,24,111,234,245,111,111,111,111,111,111,111,111,111,111,245,111,111,111,245,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,214,111,111,111,111,111,245,111,111,245,111,111,245,245,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,124,111,429,24,465,214,245,111,24,111,24,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,24,509,111,111,111,24,24,111,523,111,529,111,111,24,24,24,111,111,24,111,111,24,24,111,24,24,24,24,24,24,24,]),'expr_nobf':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'assignment_expr_nobf':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'conditional_expr_nobf':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'left_hand_side_expr_nobf':([0,4,26,31,92,164,169,180,181,182,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[45,45,45,45,45,344,344,344,344,344,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'logical_or_expr_nobf':([0,4,26,31,92,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'new_expr_nobf':([0,4,26,31,92,164,169,180,181,182,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'call_expr_nobf':([0,4,26,31,92,164,169,180,181,182,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'logical_and_expr_nobf':([0,4,26,31,92,164,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[49,49,49,49,49,343,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'member_expr_nobf':([0,4,26,31,92,164,169,180,181,182,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'bitwise_or_expr_nobf':([0,4,26,31,92,164,169,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[53,53,53,53,53,53,350,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'primary_expr_no_brace':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,128,131,132,142,143,148,163,164,166,168,169,171,175,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,382,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,454,457,459,460,464,466,482,484,486,515,519,524,526,531,533,534,539,545,546,552,554,568,569,572,574,575,580,],[54,54,107,54,54,107,107,107,107,107,107,107,107,107,107,107,107,54,107,107,107,107,107,107,107,107,107,54,107,107,54,107,107,54,54,54,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,54,107,54,107,54,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,54,107,107,107,54,54,107,107,107,107,54,54,54,107,107,54,107,107,54,54,107,54,54,54,54,54,54,54,]),'function_expr':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,128,131,132,142,143,148,163,164,166,168,169,171,175,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,382,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,454,457,459,460,464,466,482,484,486,515,519,524,526,531,533,534,539,545,546,552,554,568,569,572,574,575,580,],[55,55,105,55,55,105,105,105,105,105,105,105,105,105,105,105,105,55,105,105,105,105,105,105,105,105,105,55,105,105,55,105,105,55,55,55,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,55,105,55,105,55,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,55,105,105,105,55,55,105,105,105,105,55,55,55,105,105,55,105,105,55,55,105,55,55,55,55,55,55,55,]),'bitwise_xor_expr_nobf':([0,4,26,31,92,164,169,180,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[56,56,56,56,56,56,56,359,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,128,131,132,142,143,148,163,164,166,168,169,171,175,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,382,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,454,457,459,460,464,466,482,484,486,515,519,524,526,531,533,534,539,545,546,552,554,568,569,572,574,575,580,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'array_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,128,131,132,142,143,148,163,164,166,168,169,171,175,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,382,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,454,457,459,460,464,466,482,484,486,515,519,524,526,531,533,534,539,545,546,552,554,568,569,572,574,575,580,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'bitwise_and_expr_nobf':([0,4,26,31,92,164,169,180,181,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[60,60,60,60,60,60,60,60,360,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'null_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,128,131,132,142,143,148,163,164,166,168,169,171,175,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,382,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,454,457,459,460,464,466,482,484,486,515,519,524,526,531,533,534,539,545,546,552,554,568,569,572,574,575,580,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'boolean_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,128,131,132,142,143,148,163,164,166,168,169,171,175,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,382,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,454,457,459,460,464,466,482,484,486,515,519,524,526,531,533,534,539,545,546,552,554,568,569,572,574,575,580,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'numeric_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,110,127,128,131,132,142,143,148,163,164,166,168,169,171,175,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,454,457,459,460,464,466,482,484,486,515,519,524,526,531,533,534,539,545,546,552,554,568,569,572,574,575,580,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,243,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,243,243,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,243,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'string_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,110,127,128,131,132,142,143,148,163,164,166,168,169,171,175,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,239,240,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,382,399,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,454,457,459,460,464,466,482,484,486,515,519,524,526,531,533,534,539,545,546,552,554,568,569,572,574,575,580,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,242,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,242,242,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,242,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'regex_literal':([0,4,25,26,31,36,39,51,77,78,82,83,84,85,86,87,88,92,102,127,128,131,132,142,143,148,163,164,166,168,169,171,175,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,382,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,454,457,459,460,464,466,482,484,486,515,519,524,526,531,533,534,539,545,546,552,554,568,569,572,574,575,580,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'equality_expr_nobf':([0,4,26,31,92,164,169,180,181,182,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[66,66,66,66,66,66,66,66,66,361,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'relational_expr_nobf':([0,4,26,31,92,164,169,180,181,182,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'shift_expr_nobf':([0,4,26,31,92,164,169,180,181,182,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'additive_expr_nobf':([0,4,26,31,92,164,169,180,181,182,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'multiplicative_expr_nobf':([0,4,26,31,92,164,169,180,181,182,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'unary_expr_nobf':([0,4,26,31,92,164,169,180,181,182,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'postfix_expr_nobf':([0,4,26,31,92,164,169,180,181,182,382,424,426,449,460,464,515,519,524,533,545,546,554,568,569,572,574,575,580,],[80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'unary_expr_common':([0,4,25,26,31,36,39,77,78,82,83,84,85,86,87,88,92,127,128,131,132,142,143,148,163,164,166,168,169,171,175,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,382,400,424,425,426,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,454,457,459,460,464,466,482,484,486,515,519,524,526,531,533,534,539,545,546,552,554,568,569,572,574,575,580,],[81,81,120,81,81,120,120,120,120,120,120,120,120,120,120,120,81,120,120,120,120,120,120,120,120,81,120,120,81,120,120,81,81,81,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,81,120,81,120,81,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,81,120,120,120,81,81,120,120,120,120,81,81,81,120,120,81,120,120,81,81,120,81,81,81,81,81,81,81,]),'expr':([25,36,39,128,131,142,143,166,171,224,228,425,427,431,482,484,526,531,539,552,],[93,141,144,309,311,333,334,345,351,389,392,477,481,487,481,530,481,555,562,481,]),'assignment_expr':([25,36,39,127,128,131,142,143,148,163,166,168,171,175,217,218,221,224,228,307,400,425,427,431,454,457,459,466,482,484,526,531,539,552,],[94,94,94,308,94,94,94,94,341,342,94,349,94,355,385,386,387,94,94,423,473,94,94,94,510,511,513,518,94,94,94,94,94,94,]),'conditional_expr':([25,36,39,127,128,131,142,143,148,163,166,168,171,175,217,218,221,224,228,307,400,425,427,431,454,457,459,466,482,484,526,531,539,552,],[95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,]),'left_hand_side_expr':([25,36,39,77,78,82,83,84,85,86,87,88,127,128,131,132,142,143,148,163,166,168,171,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,400,425,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,454,457,459,466,482,484,486,526,531,534,539,552,],[96,96,96,202,202,202,202,202,202,202,202,202,96,96,96,314,96,96,96,96,96,96,96,96,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,96,96,96,202,96,202,96,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,202,96,96,96,96,96,488,488,488,202,202,202,202,202,202,202,202,202,202,202,202,202,202,96,96,96,96,96,96,488,96,96,488,96,96,]),'logical_or_expr':([25,36,39,127,128,131,142,143,148,163,166,168,171,175,217,218,221,224,228,307,400,425,427,431,454,457,459,466,482,484,526,531,539,552,],[97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'new_expr':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,127,128,131,132,142,143,148,163,166,168,171,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,400,425,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,454,457,459,466,482,484,486,526,531,534,539,552,],[98,98,98,173,98,98,98,98,98,98,98,98,98,230,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,]),'call_expr':([25,36,39,77,78,82,83,84,85,86,87,88,127,128,131,132,142,143,148,163,166,168,171,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,400,425,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,454,457,459,466,482,484,486,526,531,534,539,552,],[99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,]),'logical_and_expr':([25,36,39,127,128,131,142,143,148,163,166,168,171,175,217,218,221,222,224,228,307,400,425,427,431,454,457,459,466,482,484,526,531,539,552,],[100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,388,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,]),'member_expr':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,127,128,131,132,142,143,148,163,166,168,171,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,400,425,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,454,457,459,466,482,484,486,526,531,534,539,552,],[101,101,101,174,101,101,101,101,101,101,101,101,101,231,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,]),'bitwise_or_expr':([25,36,39,127,128,131,142,143,148,163,166,168,171,175,217,218,221,222,224,226,228,307,400,425,427,431,454,457,459,466,482,484,526,531,539,552,],[103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,391,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,]),'primary_expr':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,127,128,131,132,142,143,148,163,166,168,171,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,400,425,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,454,457,459,466,482,484,486,526,531,534,539,552,],[104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,]),'bitwise_xor_expr':([25,36,39,127,128,131,142,143,148,163,166,168,171,175,217,218,221,222,224,226,228,232,307,400,425,427,431,454,457,459,466,482,484,526,531,539,552,],[106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,395,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,]),'object_literal':([25,36,39,51,77,78,82,83,84,85,86,87,88,102,127,128,131,132,142,143,148,163,166,168,171,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,400,425,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,454,457,459,466,482,484,486,526,531,534,539,552,],[108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,]),'bitwise_and_expr':([25,36,39,127,128,131,142,143,148,163,166,168,171,175,217,218,221,222,224,226,228,232,233,307,400,425,427,431,454,457,459,466,482,484,526,531,539,552,],[112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,396,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,]),'equality_expr':([25,36,39,127,128,131,142,143,148,163,166,168,171,175,217,218,221,222,224,226,228,232,233,283,307,400,425,427,431,454,457,459,466,482,484,526,531,539,552,],[113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,403,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,]),'relational_expr':([25,36,39,127,128,131,142,143,148,163,166,168,171,175,183,184,185,186,217,218,221,222,224,226,228,232,233,283,284,285,286,287,307,400,425,427,431,440,441,442,443,454,457,459,466,482,484,526,531,539,552,],[114,114,114,114,114,114,114,114,114,114,114,114,114,114,362,363,364,365,114,114,114,114,114,114,114,114,114,114,404,405,406,407,114,114,114,114,114,497,498,499,500,114,114,114,114,114,114,114,114,114,114,]),'shift_expr':([25,36,39,127,128,131,132,142,143,148,163,166,168,171,175,183,184,185,186,187,188,189,190,191,192,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,307,400,425,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,454,457,459,466,482,484,486,526,531,534,539,552,],[115,115,115,115,115,115,326,115,115,115,115,115,115,115,115,115,115,115,115,366,367,368,369,370,371,115,115,115,115,115,115,115,115,115,115,115,115,115,115,408,409,410,411,412,413,115,115,115,115,115,326,326,326,326,326,326,326,326,115,115,115,115,501,502,503,504,505,115,115,115,115,115,115,326,115,115,326,115,115,]),'additive_expr':([25,36,39,127,128,131,132,142,143,148,163,166,168,171,175,183,184,185,186,187,188,189,190,191,192,193,194,195,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,307,400,425,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,454,457,459,466,482,484,486,526,531,534,539,552,],[116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,372,373,374,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,414,415,416,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,]),'multiplicative_expr':([25,36,39,127,128,131,132,142,143,148,163,166,168,171,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,307,400,425,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,454,457,459,466,482,484,486,526,531,534,539,552,],[117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,375,376,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,417,418,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,]),'unary_expr':([25,36,39,77,78,82,83,84,85,86,87,88,127,128,131,132,142,143,148,163,166,168,171,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,400,425,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,454,457,459,466,482,484,486,526,531,534,539,552,],[118,118,118,201,203,204,205,206,207,208,209,210,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,377,378,379,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,419,420,421,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,118,]),'postfix_expr':([25,36,39,77,78,82,83,84,85,86,87,88,127,128,131,132,142,143,148,163,166,168,171,175,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,217,218,221,222,224,226,228,232,233,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,307,400,425,427,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,454,457,459,466,482,484,486,526,531,534,539,552,],[119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,119,]),'variable_declaration_list':([27,],[122,]),'variable_declaration':([27,305,],[123,422,]),'assignment_operator':([45,96,314,488,],[148,218,432,432,]),'arguments':([48,50,99,101,174,231,],[165,170,223,227,353,394,]),'elision_opt':([52,357,],[175,459,]),'element_list':([52,],[176,]),'elision':([52,357,],[179,179,]),'formal_parameter_list':([91,211,397,],[213,381,470,]),'property_list':([110,],[236,]),'property_assignment':([110,399,],[237,472,]),'property_name':([110,239,240,399,],[238,401,402,238,]),'identifier_name_string':([110,167,172,225,229,239,240,399,],[241,346,352,390,393,241,241,241,]),'identifier_name':([110,167,172,225,229,239,240,399,],[244,244,244,244,244,244,244,244,]),'reserved_word':([110,167,172,225,229,239,240,399,],[246,246,246,246,246,246,246,246,]),'initializer':([124,],[306,]),'expr_noin_opt':([132,],[312,]),'expr_noin':([132,],[316,]),'assignment_expr_noin':([132,432,433,434,486,534,],[317,489,490,491,532,557,]),'conditional_expr_noin':([132,432,433,434,486,534,],[318,318,318,318,318,318,]),'logical_or_expr_noin':([132,432,433,434,486,534,],[319,319,319,319,319,319,]),'logical_and_expr_noin':([132,432,433,434,435,486,534,],[320,320,320,320,492,320,320,]),'bitwise_or_expr_noin':([132,432,433,434,435,436,486,534,],[321,321,321,321,321,493,321,321,]),'bitwise_xor_expr_noin':([132,432,433,434,435,436,437,486,534,],[322,322,322,322,322,322,494,322,322,]),'bitwise_and_expr_noin':([132,432,433,434,435,436,437,438,486,534,],[323,323,323,323,323,323,323,495,323,323,]),'equality_expr_noin':([132,432,433,434,435,436,437,438,439,486,534,],[324,324,324,324,324,324,324,324,496,324,324,]),'relational_expr_noin':([132,432,433,434,435,436,437,438,439,486,534,],[325,325,325,325,325,325,325,325,325,325,325,]),'catch':([145,],[337,]),'finally':([145,337,],[338,451,]),'argument_list':([168,],[348,]),'variable_declaration_list_noin':([313,],[428,]),'variable_declaration_noin':([313,483,],[430,528,]),'function_body':([382,460,464,515,519,545,546,568,],[462,514,517,542,544,566,567,578,]),'expr_opt':([427,482,526,552,],[479,527,551,570,]),'initializer_noin':([429,529,],[485,553,]),'case_block':([450,],[507,]),'property_set_parameter_list':([475,],[522,]),'case_clauses_opt':([508,559,],[535,573,]),'case_clauses':([508,559,],[537,537,]),'case_clause':([508,537,559,],[538,561,538,]),'default_clause':([535,],[559,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('empty -> <empty>','empty',0,'p_empty','es5.py',144),
+  ('program -> source_elements','program',1,'p_program','es5.py',179),
+  ('source_elements -> empty','source_elements',1,'p_source_elements','es5.py',186),
+  ('source_elements -> source_element_list','source_elements',1,'p_source_elements','es5.py',187),
+  ('source_element_list -> source_element','source_element_list',1,'p_source_element_list','es5.py',192),
+  ('source_element_list -> source_element_list source_element','source_element_list',2,'p_source_element_list','es5.py',193),
+  ('source_element -> statement','source_element',1,'p_source_element','es5.py',202),
+  ('source_element -> function_declaration','source_element',1,'p_source_element','es5.py',203),
+  ('statement -> block','statement',1,'p_statement','es5.py',208),
+  ('statement -> variable_statement','statement',1,'p_statement','es5.py',209),
+  ('statement -> empty_statement','statement',1,'p_statement','es5.py',210),
+  ('statement -> expr_statement','statement',1,'p_statement','es5.py',211),
+  ('statement -> if_statement','statement',1,'p_statement','es5.py',212),
+  ('statement -> iteration_statement','statement',1,'p_statement','es5.py',213),
+  ('statement -> continue_statement','statement',1,'p_statement','es5.py',214),
+  ('statement -> break_statement','statement',1,'p_statement','es5.py',215),
+  ('statement -> return_statement','statement',1,'p_statement','es5.py',216),
+  ('statement -> with_statement','statement',1,'p_statement','es5.py',217),
+  ('statement -> switch_statement','statement',1,'p_statement','es5.py',218),
+  ('statement -> labelled_statement','statement',1,'p_statement','es5.py',219),
+  ('statement -> throw_statement','statement',1,'p_statement','es5.py',220),
+  ('statement -> try_statement','statement',1,'p_statement','es5.py',221),
+  ('statement -> debugger_statement','statement',1,'p_statement','es5.py',222),
+  ('statement -> function_declaration','statement',1,'p_statement','es5.py',223),
+  ('block -> LBRACE source_elements RBRACE','block',3,'p_block','es5.py',230),
+  ('literal -> null_literal','literal',1,'p_literal','es5.py',235),
+  ('literal -> boolean_literal','literal',1,'p_literal','es5.py',236),
+  ('literal -> numeric_literal','literal',1,'p_literal','es5.py',237),
+  ('literal -> string_literal','literal',1,'p_literal','es5.py',238),
+  ('literal -> regex_literal','literal',1,'p_literal','es5.py',239),
+  ('boolean_literal -> TRUE','boolean_literal',1,'p_boolean_literal','es5.py',244),
+  ('boolean_literal -> FALSE','boolean_literal',1,'p_boolean_literal','es5.py',245),
+  ('null_literal -> NULL','null_literal',1,'p_null_literal','es5.py',251),
+  ('numeric_literal -> NUMBER','numeric_literal',1,'p_numeric_literal','es5.py',256),
+  ('string_literal -> STRING','string_literal',1,'p_string_literal','es5.py',261),
+  ('regex_literal -> REGEX','regex_literal',1,'p_regex_literal','es5.py',266),
+  ('identifier -> ID','identifier',1,'p_identifier','es5.py',271),
+  ('reserved_word -> BREAK','reserved_word',1,'p_reserved_word','es5.py',278),
+  ('reserved_word -> CASE','reserved_word',1,'p_reserved_word','es5.py',279),
+  ('reserved_word -> CATCH','reserved_word',1,'p_reserved_word','es5.py',280),
+  ('reserved_word -> CONTINUE','reserved_word',1,'p_reserved_word','es5.py',281),
+  ('reserved_word -> DEBUGGER','reserved_word',1,'p_reserved_word','es5.py',282),
+  ('reserved_word -> DEFAULT','reserved_word',1,'p_reserved_word','es5.py',283),
+  ('reserved_word -> DELETE','reserved_word',1,'p_reserved_word','es5.py',284),
+  ('reserved_word -> DO','reserved_word',1,'p_reserved_word','es5.py',285),
+  ('reserved_word -> ELSE','reserved_word',1,'p_reserved_word','es5.py',286),
+  ('reserved_word -> FINALLY','reserved_word',1,'p_reserved_word','es5.py',287),
+  ('reserved_word -> FOR','reserved_word',1,'p_reserved_word','es5.py',288),
+  ('reserved_word -> FUNCTION','reserved_word',1,'p_reserved_word','es5.py',289),
+  ('reserved_word -> IF','reserved_word',1,'p_reserved_word','es5.py',290),
+  ('reserved_word -> IN','reserved_word',1,'p_reserved_word','es5.py',291),
+  ('reserved_word -> INSTANCEOF','reserved_word',1,'p_reserved_word','es5.py',292),
+  ('reserved_word -> NEW','reserved_word',1,'p_reserved_word','es5.py',293),
+  ('reserved_word -> RETURN','reserved_word',1,'p_reserved_word','es5.py',294),
+  ('reserved_word -> SWITCH','reserved_word',1,'p_reserved_word','es5.py',295),
+  ('reserved_word -> THIS','reserved_word',1,'p_reserved_word','es5.py',296),
+  ('reserved_word -> THROW','reserved_word',1,'p_reserved_word','es5.py',297),
+  ('reserved_word -> TRY','reserved_word',1,'p_reserved_word','es5.py',298),
+  ('reserved_word -> TYPEOF','reserved_word',1,'p_reserved_word','es5.py',299),
+  ('reserved_word -> VAR','reserved_word',1,'p_reserved_word','es5.py',300),
+  ('reserved_word -> VOID','reserved_word',1,'p_reserved_word','es5.py',301),
+  ('reserved_word -> WHILE','reserved_word',1,'p_reserved_word','es5.py',302),
+  ('reserved_word -> WITH','reserved_word',1,'p_reserved_word','es5.py',303),
+  ('reserved_word -> NULL','reserved_word',1,'p_reserved_word','es5.py',304),
+  ('reserved_word -> TRUE','reserved_word',1,'p_reserved_word','es5.py',305),
+  ('reserved_word -> FALSE','reserved_word',1,'p_reserved_word','es5.py',306),
+  ('reserved_word -> CLASS','reserved_word',1,'p_reserved_word','es5.py',307),
+  ('reserved_word -> CONST','reserved_word',1,'p_reserved_word','es5.py',308),
+  ('reserved_word -> ENUM','reserved_word',1,'p_reserved_word','es5.py',309),
+  ('reserved_word -> EXPORT','reserved_word',1,'p_reserved_word','es5.py',310),
+  ('reserved_word -> EXTENDS','reserved_word',1,'p_reserved_word','es5.py',311),
+  ('reserved_word -> IMPORT','reserved_word',1,'p_reserved_word','es5.py',312),
+  ('reserved_word -> SUPER','reserved_word',1,'p_reserved_word','es5.py',313),
+  ('identifier_name -> identifier','identifier_name',1,'p_identifier_name','es5.py',319),
+  ('identifier_name -> reserved_word','identifier_name',1,'p_identifier_name','es5.py',320),
+  ('primary_expr -> primary_expr_no_brace','primary_expr',1,'p_primary_expr','es5.py',328),
+  ('primary_expr -> object_literal','primary_expr',1,'p_primary_expr','es5.py',329),
+  ('primary_expr_no_brace -> identifier','primary_expr_no_brace',1,'p_primary_expr_no_brace_1','es5.py',334),
+  ('primary_expr_no_brace -> THIS','primary_expr_no_brace',1,'p_primary_expr_no_brace_2','es5.py',338),
+  ('primary_expr_no_brace -> literal','primary_expr_no_brace',1,'p_primary_expr_no_brace_3','es5.py',343),
+  ('primary_expr_no_brace -> array_literal','primary_expr_no_brace',1,'p_primary_expr_no_brace_3','es5.py',344),
+  ('primary_expr_no_brace -> LPAREN expr RPAREN','primary_expr_no_brace',3,'p_primary_expr_no_brace_4','es5.py',349),
+  ('array_literal -> LBRACKET elision_opt RBRACKET','array_literal',3,'p_array_literal_1','es5.py',358),
+  ('array_literal -> LBRACKET element_list RBRACKET','array_literal',3,'p_array_literal_2','es5.py',363),
+  ('array_literal -> LBRACKET element_list COMMA elision_opt RBRACKET','array_literal',5,'p_array_literal_2','es5.py',364),
+  ('element_list -> elision_opt assignment_expr','element_list',2,'p_element_list','es5.py',373),
+  ('element_list -> element_list COMMA elision_opt assignment_expr','element_list',4,'p_element_list','es5.py',374),
+  ('elision_opt -> empty','elision_opt',1,'p_elision_opt_1','es5.py',384),
+  ('elision_opt -> elision','elision_opt',1,'p_elision_opt_2','es5.py',388),
+  ('elision -> COMMA','elision',1,'p_elision','es5.py',392),
+  ('elision -> elision COMMA','elision',2,'p_elision','es5.py',393),
+  ('object_literal -> LBRACE RBRACE','object_literal',2,'p_object_literal','es5.py',409),
+  ('object_literal -> LBRACE property_list RBRACE','object_literal',3,'p_object_literal','es5.py',410),
+  ('object_literal -> LBRACE property_list COMMA RBRACE','object_literal',4,'p_object_literal','es5.py',411),
+  ('property_list -> property_assignment','property_list',1,'p_property_list','es5.py',420),
+  ('property_list -> property_list COMMA property_assignment','property_list',3,'p_property_list','es5.py',421),
+  ('property_assignment -> property_name COLON assignment_expr','property_assignment',3,'p_property_assignment','es5.py',431),
+  ('property_assignment -> GETPROP property_name LPAREN RPAREN LBRACE function_body RBRACE','property_assignment',7,'p_property_assignment','es5.py',432),
+  ('property_assignment -> SETPROP property_name LPAREN property_set_parameter_list RPAREN LBRACE function_body RBRACE','property_assignment',8,'p_property_assignment','es5.py',433),
+  ('identifier_name_string -> identifier_name','identifier_name_string',1,'p_identifier_name_string','es5.py',454),
+  ('property_name -> identifier_name_string','property_name',1,'p_property_name','es5.py',463),
+  ('property_name -> string_literal','property_name',1,'p_property_name','es5.py',464),
+  ('property_name -> numeric_literal','property_name',1,'p_property_name','es5.py',465),
+  ('property_set_parameter_list -> identifier','property_set_parameter_list',1,'p_property_set_parameter_list','es5.py',470),
+  ('member_expr -> primary_expr','member_expr',1,'p_member_expr','es5.py',479),
+  ('member_expr -> function_expr','member_expr',1,'p_member_expr','es5.py',480),
+  ('member_expr -> member_expr LBRACKET expr RBRACKET','member_expr',4,'p_member_expr','es5.py',481),
+  ('member_expr -> member_expr PERIOD identifier_name_string','member_expr',3,'p_member_expr','es5.py',482),
+  ('member_expr -> NEW member_expr arguments','member_expr',3,'p_member_expr','es5.py',483),
+  ('member_expr_nobf -> primary_expr_no_brace','member_expr_nobf',1,'p_member_expr_nobf','es5.py',500),
+  ('member_expr_nobf -> function_expr','member_expr_nobf',1,'p_member_expr_nobf','es5.py',501),
+  ('member_expr_nobf -> member_expr_nobf LBRACKET expr RBRACKET','member_expr_nobf',4,'p_member_expr_nobf','es5.py',502),
+  ('member_expr_nobf -> member_expr_nobf PERIOD identifier_name_string','member_expr_nobf',3,'p_member_expr_nobf','es5.py',503),
+  ('member_expr_nobf -> NEW member_expr arguments','member_expr_nobf',3,'p_member_expr_nobf','es5.py',504),
+  ('new_expr -> member_expr','new_expr',1,'p_new_expr','es5.py',521),
+  ('new_expr -> NEW new_expr','new_expr',2,'p_new_expr','es5.py',522),
+  ('new_expr_nobf -> member_expr_nobf','new_expr_nobf',1,'p_new_expr_nobf','es5.py',531),
+  ('new_expr_nobf -> NEW new_expr','new_expr_nobf',2,'p_new_expr_nobf','es5.py',532),
+  ('call_expr -> member_expr arguments','call_expr',2,'p_call_expr','es5.py',541),
+  ('call_expr -> call_expr arguments','call_expr',2,'p_call_expr','es5.py',542),
+  ('call_expr -> call_expr LBRACKET expr RBRACKET','call_expr',4,'p_call_expr','es5.py',543),
+  ('call_expr -> call_expr PERIOD identifier_name_string','call_expr',3,'p_call_expr','es5.py',544),
+  ('call_expr_nobf -> member_expr_nobf arguments','call_expr_nobf',2,'p_call_expr_nobf','es5.py',557),
+  ('call_expr_nobf -> call_expr_nobf arguments','call_expr_nobf',2,'p_call_expr_nobf','es5.py',558),
+  ('call_expr_nobf -> call_expr_nobf LBRACKET expr RBRACKET','call_expr_nobf',4,'p_call_expr_nobf','es5.py',559),
+  ('call_expr_nobf -> call_expr_nobf PERIOD identifier_name_string','call_expr_nobf',3,'p_call_expr_nobf','es5.py',560),
+  ('arguments -> LPAREN RPAREN','arguments',2,'p_arguments','es5.py',573),
+  ('arguments -> LPAREN argument_list RPAREN','arguments',3,'p_arguments','es5.py',574),
+  ('argument_list -> assignment_expr','argument_list',1,'p_argument_list','es5.py',583),
+  ('argument_list -> argument_list COMMA assignment_expr','argument_list',3,'p_argument_list','es5.py',584),
+  ('left_hand_side_expr -> new_expr','left_hand_side_expr',1,'p_lef_hand_side_expr','es5.py',593),
+  ('left_hand_side_expr -> call_expr','left_hand_side_expr',1,'p_lef_hand_side_expr','es5.py',594),
+  ('left_hand_side_expr_nobf -> new_expr_nobf','left_hand_side_expr_nobf',1,'p_lef_hand_side_expr_nobf','es5.py',599),
+  ('left_hand_side_expr_nobf -> call_expr_nobf','left_hand_side_expr_nobf',1,'p_lef_hand_side_expr_nobf','es5.py',600),
+  ('postfix_expr -> left_hand_side_expr','postfix_expr',1,'p_postfix_expr','es5.py',606),
+  ('postfix_expr -> left_hand_side_expr PLUSPLUS','postfix_expr',2,'p_postfix_expr','es5.py',607),
+  ('postfix_expr -> left_hand_side_expr MINUSMINUS','postfix_expr',2,'p_postfix_expr','es5.py',608),
+  ('postfix_expr_nobf -> left_hand_side_expr_nobf','postfix_expr_nobf',1,'p_postfix_expr_nobf','es5.py',617),
+  ('postfix_expr_nobf -> left_hand_side_expr_nobf PLUSPLUS','postfix_expr_nobf',2,'p_postfix_expr_nobf','es5.py',618),
+  ('postfix_expr_nobf -> left_hand_side_expr_nobf MINUSMINUS','postfix_expr_nobf',2,'p_postfix_expr_nobf','es5.py',619),
+  ('unary_expr -> postfix_expr','unary_expr',1,'p_unary_expr','es5.py',629),
+  ('unary_expr -> unary_expr_common','unary_expr',1,'p_unary_expr','es5.py',630),
+  ('unary_expr_nobf -> postfix_expr_nobf','unary_expr_nobf',1,'p_unary_expr_nobf','es5.py',635),
+  ('unary_expr_nobf -> unary_expr_common','unary_expr_nobf',1,'p_unary_expr_nobf','es5.py',636),
+  ('unary_expr_common -> DELETE unary_expr','unary_expr_common',2,'p_unary_expr_common','es5.py',641),
+  ('unary_expr_common -> VOID unary_expr','unary_expr_common',2,'p_unary_expr_common','es5.py',642),
+  ('unary_expr_common -> TYPEOF unary_expr','unary_expr_common',2,'p_unary_expr_common','es5.py',643),
+  ('unary_expr_common -> PLUSPLUS unary_expr','unary_expr_common',2,'p_unary_expr_common','es5.py',644),
+  ('unary_expr_common -> MINUSMINUS unary_expr','unary_expr_common',2,'p_unary_expr_common','es5.py',645),
+  ('unary_expr_common -> PLUS unary_expr','unary_expr_common',2,'p_unary_expr_common','es5.py',646),
+  ('unary_expr_common -> MINUS unary_expr','unary_expr_common',2,'p_unary_expr_common','es5.py',647),
+  ('unary_expr_common -> BNOT unary_expr','unary_expr_common',2,'p_unary_expr_common','es5.py',648),
+  ('unary_expr_common -> NOT unary_expr','unary_expr_common',2,'p_unary_expr_common','es5.py',649),
+  ('multiplicative_expr -> unary_expr','multiplicative_expr',1,'p_multiplicative_expr','es5.py',656),
+  ('multiplicative_expr -> multiplicative_expr MULT unary_expr','multiplicative_expr',3,'p_multiplicative_expr','es5.py',657),
+  ('multiplicative_expr -> multiplicative_expr DIV unary_expr','multiplicative_expr',3,'p_multiplicative_expr','es5.py',658),
+  ('multiplicative_expr -> multiplicative_expr MOD unary_expr','multiplicative_expr',3,'p_multiplicative_expr','es5.py',659),
+  ('multiplicative_expr_nobf -> unary_expr_nobf','multiplicative_expr_nobf',1,'p_multiplicative_expr_nobf','es5.py',668),
+  ('multiplicative_expr_nobf -> multiplicative_expr_nobf MULT unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','es5.py',669),
+  ('multiplicative_expr_nobf -> multiplicative_expr_nobf DIV unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','es5.py',670),
+  ('multiplicative_expr_nobf -> multiplicative_expr_nobf MOD unary_expr','multiplicative_expr_nobf',3,'p_multiplicative_expr_nobf','es5.py',671),
+  ('additive_expr -> multiplicative_expr','additive_expr',1,'p_additive_expr','es5.py',681),
+  ('additive_expr -> additive_expr PLUS multiplicative_expr','additive_expr',3,'p_additive_expr','es5.py',682),
+  ('additive_expr -> additive_expr MINUS multiplicative_expr','additive_expr',3,'p_additive_expr','es5.py',683),
+  ('additive_expr_nobf -> multiplicative_expr_nobf','additive_expr_nobf',1,'p_additive_expr_nobf','es5.py',692),
+  ('additive_expr_nobf -> additive_expr_nobf PLUS multiplicative_expr','additive_expr_nobf',3,'p_additive_expr_nobf','es5.py',693),
+  ('additive_expr_nobf -> additive_expr_nobf MINUS multiplicative_expr','additive_expr_nobf',3,'p_additive_expr_nobf','es5.py',694),
+  ('shift_expr -> additive_expr','shift_expr',1,'p_shift_expr','es5.py',704),
+  ('shift_expr -> shift_expr LSHIFT additive_expr','shift_expr',3,'p_shift_expr','es5.py',705),
+  ('shift_expr -> shift_expr RSHIFT additive_expr','shift_expr',3,'p_shift_expr','es5.py',706),
+  ('shift_expr -> shift_expr URSHIFT additive_expr','shift_expr',3,'p_shift_expr','es5.py',707),
+  ('shift_expr_nobf -> additive_expr_nobf','shift_expr_nobf',1,'p_shift_expr_nobf','es5.py',716),
+  ('shift_expr_nobf -> shift_expr_nobf LSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','es5.py',717),
+  ('shift_expr_nobf -> shift_expr_nobf RSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','es5.py',718),
+  ('shift_expr_nobf -> shift_expr_nobf URSHIFT additive_expr','shift_expr_nobf',3,'p_shift_expr_nobf','es5.py',719),
+  ('relational_expr -> shift_expr','relational_expr',1,'p_relational_expr','es5.py',729),
+  ('relational_expr -> relational_expr LT shift_expr','relational_expr',3,'p_relational_expr','es5.py',730),
+  ('relational_expr -> relational_expr GT shift_expr','relational_expr',3,'p_relational_expr','es5.py',731),
+  ('relational_expr -> relational_expr LE shift_expr','relational_expr',3,'p_relational_expr','es5.py',732),
+  ('relational_expr -> relational_expr GE shift_expr','relational_expr',3,'p_relational_expr','es5.py',733),
+  ('relational_expr -> relational_expr INSTANCEOF shift_expr','relational_expr',3,'p_relational_expr','es5.py',734),
+  ('relational_expr -> relational_expr IN shift_expr','relational_expr',3,'p_relational_expr','es5.py',735),
+  ('relational_expr_noin -> shift_expr','relational_expr_noin',1,'p_relational_expr_noin','es5.py',744),
+  ('relational_expr_noin -> relational_expr_noin LT shift_expr','relational_expr_noin',3,'p_relational_expr_noin','es5.py',745),
+  ('relational_expr_noin -> relational_expr_noin GT shift_expr','relational_expr_noin',3,'p_relational_expr_noin','es5.py',746),
+  ('relational_expr_noin -> relational_expr_noin LE shift_expr','relational_expr_noin',3,'p_relational_expr_noin','es5.py',747),
+  ('relational_expr_noin -> relational_expr_noin GE shift_expr','relational_expr_noin',3,'p_relational_expr_noin','es5.py',748),
+  ('relational_expr_noin -> relational_expr_noin INSTANCEOF shift_expr','relational_expr_noin',3,'p_relational_expr_noin','es5.py',749),
+  ('relational_expr_nobf -> shift_expr_nobf','relational_expr_nobf',1,'p_relational_expr_nobf','es5.py',758),
+  ('relational_expr_nobf -> relational_expr_nobf LT shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','es5.py',759),
+  ('relational_expr_nobf -> relational_expr_nobf GT shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','es5.py',760),
+  ('relational_expr_nobf -> relational_expr_nobf LE shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','es5.py',761),
+  ('relational_expr_nobf -> relational_expr_nobf GE shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','es5.py',762),
+  ('relational_expr_nobf -> relational_expr_nobf INSTANCEOF shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','es5.py',763),
+  ('relational_expr_nobf -> relational_expr_nobf IN shift_expr','relational_expr_nobf',3,'p_relational_expr_nobf','es5.py',764),
+  ('equality_expr -> relational_expr','equality_expr',1,'p_equality_expr','es5.py',774),
+  ('equality_expr -> equality_expr EQEQ relational_expr','equality_expr',3,'p_equality_expr','es5.py',775),
+  ('equality_expr -> equality_expr NE relational_expr','equality_expr',3,'p_equality_expr','es5.py',776),
+  ('equality_expr -> equality_expr STREQ relational_expr','equality_expr',3,'p_equality_expr','es5.py',777),
+  ('equality_expr -> equality_expr STRNEQ relational_expr','equality_expr',3,'p_equality_expr','es5.py',778),
+  ('equality_expr_noin -> relational_expr_noin','equality_expr_noin',1,'p_equality_expr_noin','es5.py',787),
+  ('equality_expr_noin -> equality_expr_noin EQEQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','es5.py',788),
+  ('equality_expr_noin -> equality_expr_noin NE relational_expr','equality_expr_noin',3,'p_equality_expr_noin','es5.py',789),
+  ('equality_expr_noin -> equality_expr_noin STREQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','es5.py',790),
+  ('equality_expr_noin -> equality_expr_noin STRNEQ relational_expr','equality_expr_noin',3,'p_equality_expr_noin','es5.py',791),
+  ('equality_expr_nobf -> relational_expr_nobf','equality_expr_nobf',1,'p_equality_expr_nobf','es5.py',800),
+  ('equality_expr_nobf -> equality_expr_nobf EQEQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','es5.py',801),
+  ('equality_expr_nobf -> equality_expr_nobf NE relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','es5.py',802),
+  ('equality_expr_nobf -> equality_expr_nobf STREQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','es5.py',803),
+  ('equality_expr_nobf -> equality_expr_nobf STRNEQ relational_expr','equality_expr_nobf',3,'p_equality_expr_nobf','es5.py',804),
+  ('bitwise_and_expr -> equality_expr','bitwise_and_expr',1,'p_bitwise_and_expr','es5.py',814),
+  ('bitwise_and_expr -> bitwise_and_expr BAND equality_expr','bitwise_and_expr',3,'p_bitwise_and_expr','es5.py',815),
+  ('bitwise_and_expr_noin -> equality_expr_noin','bitwise_and_expr_noin',1,'p_bitwise_and_expr_noin','es5.py',824),
+  ('bitwise_and_expr_noin -> bitwise_and_expr_noin BAND equality_expr_noin','bitwise_and_expr_noin',3,'p_bitwise_and_expr_noin','es5.py',825),
+  ('bitwise_and_expr_nobf -> equality_expr_nobf','bitwise_and_expr_nobf',1,'p_bitwise_and_expr_nobf','es5.py',835),
+  ('bitwise_and_expr_nobf -> bitwise_and_expr_nobf BAND equality_expr_nobf','bitwise_and_expr_nobf',3,'p_bitwise_and_expr_nobf','es5.py',836),
+  ('bitwise_xor_expr -> bitwise_and_expr','bitwise_xor_expr',1,'p_bitwise_xor_expr','es5.py',846),
+  ('bitwise_xor_expr -> bitwise_xor_expr BXOR bitwise_and_expr','bitwise_xor_expr',3,'p_bitwise_xor_expr','es5.py',847),
+  ('bitwise_xor_expr_noin -> bitwise_and_expr_noin','bitwise_xor_expr_noin',1,'p_bitwise_xor_expr_noin','es5.py',857),
+  ('bitwise_xor_expr_noin -> bitwise_xor_expr_noin BXOR bitwise_and_expr_noin','bitwise_xor_expr_noin',3,'p_bitwise_xor_expr_noin','es5.py',858),
+  ('bitwise_xor_expr_nobf -> bitwise_and_expr_nobf','bitwise_xor_expr_nobf',1,'p_bitwise_xor_expr_nobf','es5.py',869),
+  ('bitwise_xor_expr_nobf -> bitwise_xor_expr_nobf BXOR bitwise_and_expr_nobf','bitwise_xor_expr_nobf',3,'p_bitwise_xor_expr_nobf','es5.py',870),
+  ('bitwise_or_expr -> bitwise_xor_expr','bitwise_or_expr',1,'p_bitwise_or_expr','es5.py',880),
+  ('bitwise_or_expr -> bitwise_or_expr BOR bitwise_xor_expr','bitwise_or_expr',3,'p_bitwise_or_expr','es5.py',881),
+  ('bitwise_or_expr_noin -> bitwise_xor_expr_noin','bitwise_or_expr_noin',1,'p_bitwise_or_expr_noin','es5.py',891),
+  ('bitwise_or_expr_noin -> bitwise_or_expr_noin BOR bitwise_xor_expr_noin','bitwise_or_expr_noin',3,'p_bitwise_or_expr_noin','es5.py',892),
+  ('bitwise_or_expr_nobf -> bitwise_xor_expr_nobf','bitwise_or_expr_nobf',1,'p_bitwise_or_expr_nobf','es5.py',903),
+  ('bitwise_or_expr_nobf -> bitwise_or_expr_nobf BOR bitwise_xor_expr_nobf','bitwise_or_expr_nobf',3,'p_bitwise_or_expr_nobf','es5.py',904),
+  ('logical_and_expr -> bitwise_or_expr','logical_and_expr',1,'p_logical_and_expr','es5.py',915),
+  ('logical_and_expr -> logical_and_expr AND bitwise_or_expr','logical_and_expr',3,'p_logical_and_expr','es5.py',916),
+  ('logical_and_expr_noin -> bitwise_or_expr_noin','logical_and_expr_noin',1,'p_logical_and_expr_noin','es5.py',926),
+  ('logical_and_expr_noin -> logical_and_expr_noin AND bitwise_or_expr_noin','logical_and_expr_noin',3,'p_logical_and_expr_noin','es5.py',927),
+  ('logical_and_expr_nobf -> bitwise_or_expr_nobf','logical_and_expr_nobf',1,'p_logical_and_expr_nobf','es5.py',937),
+  ('logical_and_expr_nobf -> logical_and_expr_nobf AND bitwise_or_expr_nobf','logical_and_expr_nobf',3,'p_logical_and_expr_nobf','es5.py',938),
+  ('logical_or_expr -> logical_and_expr','logical_or_expr',1,'p_logical_or_expr','es5.py',947),
+  ('logical_or_expr -> logical_or_expr OR logical_and_expr','logical_or_expr',3,'p_logical_or_expr','es5.py',948),
+  ('logical_or_expr_noin -> logical_and_expr_noin','logical_or_expr_noin',1,'p_logical_or_expr_noin','es5.py',957),
+  ('logical_or_expr_noin -> logical_or_expr_noin OR logical_and_expr_noin','logical_or_expr_noin',3,'p_logical_or_expr_noin','es5.py',958),
+  ('logical_or_expr_nobf -> logical_and_expr_nobf','logical_or_expr_nobf',1,'p_logical_or_expr_nobf','es5.py',967),
+  ('logical_or_expr_nobf -> logical_or_expr_nobf OR logical_and_expr_nobf','logical_or_expr_nobf',3,'p_logical_or_expr_nobf','es5.py',968),
+  ('conditional_expr -> logical_or_expr','conditional_expr',1,'p_conditional_expr','es5.py',979),
+  ('conditional_expr -> logical_or_expr CONDOP assignment_expr COLON assignment_expr','conditional_expr',5,'p_conditional_expr','es5.py',980),
+  ('conditional_expr_noin -> logical_or_expr_noin','conditional_expr_noin',1,'p_conditional_expr_noin','es5.py',992),
+  ('conditional_expr_noin -> logical_or_expr_noin CONDOP assignment_expr_noin COLON assignment_expr_noin','conditional_expr_noin',5,'p_conditional_expr_noin','es5.py',993),
+  ('conditional_expr_nobf -> logical_or_expr_nobf','conditional_expr_nobf',1,'p_conditional_expr_nobf','es5.py',1006),
+  ('conditional_expr_nobf -> logical_or_expr_nobf CONDOP assignment_expr COLON assignment_expr','conditional_expr_nobf',5,'p_conditional_expr_nobf','es5.py',1007),
+  ('assignment_expr -> conditional_expr','assignment_expr',1,'p_assignment_expr','es5.py',1020),
+  ('assignment_expr -> left_hand_side_expr assignment_operator assignment_expr','assignment_expr',3,'p_assignment_expr','es5.py',1021),
+  ('assignment_expr_noin -> conditional_expr_noin','assignment_expr_noin',1,'p_assignment_expr_noin','es5.py',1032),
+  ('assignment_expr_noin -> left_hand_side_expr assignment_operator assignment_expr_noin','assignment_expr_noin',3,'p_assignment_expr_noin','es5.py',1033),
+  ('assignment_expr_nobf -> conditional_expr_nobf','assignment_expr_nobf',1,'p_assignment_expr_nobf','es5.py',1044),
+  ('assignment_expr_nobf -> left_hand_side_expr_nobf assignment_operator assignment_expr','assignment_expr_nobf',3,'p_assignment_expr_nobf','es5.py',1045),
+  ('assignment_operator -> EQ','assignment_operator',1,'p_assignment_operator','es5.py',1055),
+  ('assignment_operator -> MULTEQUAL','assignment_operator',1,'p_assignment_operator','es5.py',1056),
+  ('assignment_operator -> DIVEQUAL','assignment_operator',1,'p_assignment_operator','es5.py',1057),
+  ('assignment_operator -> MODEQUAL','assignment_operator',1,'p_assignment_operator','es5.py',1058),
+  ('assignment_operator -> PLUSEQUAL','assignment_operator',1,'p_assignment_operator','es5.py',1059),
+  ('assignment_operator -> MINUSEQUAL','assignment_operator',1,'p_assignment_operator','es5.py',1060),
+  ('assignment_operator -> LSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','es5.py',1061),
+  ('assignment_operator -> RSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','es5.py',1062),
+  ('assignment_operator -> URSHIFTEQUAL','assignment_operator',1,'p_assignment_operator','es5.py',1063),
+  ('assignment_operator -> ANDEQUAL','assignment_operator',1,'p_assignment_operator','es5.py',1064),
+  ('assignment_operator -> XOREQUAL','assignment_operator',1,'p_assignment_operator','es5.py',1065),
+  ('assignment_operator -> OREQUAL','assignment_operator',1,'p_assignment_operator','es5.py',1066),
+  ('expr -> assignment_expr','expr',1,'p_expr','es5.py',1072),
+  ('expr -> expr COMMA assignment_expr','expr',3,'p_expr','es5.py',1073),
+  ('expr_noin -> assignment_expr_noin','expr_noin',1,'p_expr_noin','es5.py',1082),
+  ('expr_noin -> expr_noin COMMA assignment_expr_noin','expr_noin',3,'p_expr_noin','es5.py',1083),
+  ('expr_nobf -> assignment_expr_nobf','expr_nobf',1,'p_expr_nobf','es5.py',1092),
+  ('expr_nobf -> expr_nobf COMMA assignment_expr','expr_nobf',3,'p_expr_nobf','es5.py',1093),
+  ('variable_statement -> VAR variable_declaration_list SEMI','variable_statement',3,'p_variable_statement','es5.py',1103),
+  ('variable_statement -> VAR variable_declaration_list AUTOSEMI','variable_statement',3,'p_variable_statement','es5.py',1104),
+  ('variable_declaration_list -> variable_declaration','variable_declaration_list',1,'p_variable_declaration_list','es5.py',1111),
+  ('variable_declaration_list -> variable_declaration_list COMMA variable_declaration','variable_declaration_list',3,'p_variable_declaration_list','es5.py',1112),
+  ('variable_declaration_list_noin -> variable_declaration_noin','variable_declaration_list_noin',1,'p_variable_declaration_list_noin','es5.py',1123),
+  ('variable_declaration_list_noin -> variable_declaration_list_noin COMMA variable_declaration_noin','variable_declaration_list_noin',3,'p_variable_declaration_list_noin','es5.py',1124),
+  ('variable_declaration -> identifier','variable_declaration',1,'p_variable_declaration','es5.py',1134),
+  ('variable_declaration -> identifier initializer','variable_declaration',2,'p_variable_declaration','es5.py',1135),
+  ('variable_declaration_noin -> identifier','variable_declaration_noin',1,'p_variable_declaration_noin','es5.py',1145),
+  ('variable_declaration_noin -> identifier initializer_noin','variable_declaration_noin',2,'p_variable_declaration_noin','es5.py',1146),
+  ('initializer -> EQ assignment_expr','initializer',2,'p_initializer','es5.py',1156),
+  ('initializer_noin -> EQ assignment_expr_noin','initializer_noin',2,'p_initializer_noin','es5.py',1160),
+  ('empty_statement -> SEMI','empty_statement',1,'p_empty_statement','es5.py',1165),
+  ('expr_statement -> expr_nobf SEMI','expr_statement',2,'p_expr_statement','es5.py',1171),
+  ('expr_statement -> expr_nobf AUTOSEMI','expr_statement',2,'p_expr_statement','es5.py',1172),
+  ('if_statement -> IF LPAREN expr RPAREN statement','if_statement',5,'p_if_statement_1','es5.py',1195),
+  ('if_statement -> IF LPAREN expr RPAREN statement ELSE statement','if_statement',7,'p_if_statement_2','es5.py',1200),
+  ('iteration_statement -> DO statement WHILE LPAREN expr RPAREN SEMI','iteration_statement',7,'p_iteration_statement_1','es5.py',1208),
+  ('iteration_statement -> DO statement WHILE LPAREN expr RPAREN AUTOSEMI','iteration_statement',7,'p_iteration_statement_1','es5.py',1209),
+  ('iteration_statement -> WHILE LPAREN expr RPAREN statement','iteration_statement',5,'p_iteration_statement_2','es5.py',1216),
+  ('iteration_statement -> FOR LPAREN expr_noin_opt SEMI expr_opt SEMI expr_opt RPAREN statement','iteration_statement',9,'p_iteration_statement_3','es5.py',1222),
+  ('iteration_statement -> FOR LPAREN VAR variable_declaration_list_noin SEMI expr_opt SEMI expr_opt RPAREN statement','iteration_statement',10,'p_iteration_statement_3','es5.py',1223),
+  ('iteration_statement -> FOR LPAREN left_hand_side_expr IN expr RPAREN statement','iteration_statement',7,'p_iteration_statement_4','es5.py',1255),
+  ('iteration_statement -> FOR LPAREN VAR identifier IN expr RPAREN statement','iteration_statement',8,'p_iteration_statement_5','es5.py',1263),
+  ('iteration_statement -> FOR LPAREN VAR identifier initializer_noin IN expr RPAREN statement','iteration_statement',9,'p_iteration_statement_6','es5.py',1273),
+  ('expr_opt -> empty','expr_opt',1,'p_expr_opt','es5.py',1283),
+  ('expr_opt -> expr','expr_opt',1,'p_expr_opt','es5.py',1284),
+  ('expr_noin_opt -> empty','expr_noin_opt',1,'p_expr_noin_opt','es5.py',1289),
+  ('expr_noin_opt -> expr_noin','expr_noin_opt',1,'p_expr_noin_opt','es5.py',1290),
+  ('continue_statement -> CONTINUE SEMI','continue_statement',2,'p_continue_statement_1','es5.py',1296),
+  ('continue_statement -> CONTINUE AUTOSEMI','continue_statement',2,'p_continue_statement_1','es5.py',1297),
+  ('continue_statement -> CONTINUE identifier SEMI','continue_statement',3,'p_continue_statement_2','es5.py',1303),
+  ('continue_statement -> CONTINUE identifier AUTOSEMI','continue_statement',3,'p_continue_statement_2','es5.py',1304),
+  ('break_statement -> BREAK SEMI','break_statement',2,'p_break_statement_1','es5.py',1311),
+  ('break_statement -> BREAK AUTOSEMI','break_statement',2,'p_break_statement_1','es5.py',1312),
+  ('break_statement -> BREAK identifier SEMI','break_statement',3,'p_break_statement_2','es5.py',1318),
+  ('break_statement -> BREAK identifier AUTOSEMI','break_statement',3,'p_break_statement_2','es5.py',1319),
+  ('return_statement -> RETURN SEMI','return_statement',2,'p_return_statement_1','es5.py',1326),
+  ('return_statement -> RETURN AUTOSEMI','return_statement',2,'p_return_statement_1','es5.py',1327),
+  ('return_statement -> RETURN expr SEMI','return_statement',3,'p_return_statement_2','es5.py',1333),
+  ('return_statement -> RETURN expr AUTOSEMI','return_statement',3,'p_return_statement_2','es5.py',1334),
+  ('with_statement -> WITH LPAREN expr RPAREN statement','with_statement',5,'p_with_statement','es5.py',1341),
+  ('switch_statement -> SWITCH LPAREN expr RPAREN case_block','switch_statement',5,'p_switch_statement','es5.py',1347),
+  ('case_block -> LBRACE case_clauses_opt RBRACE','case_block',3,'p_case_block','es5.py',1357),
+  ('case_block -> LBRACE case_clauses_opt default_clause case_clauses_opt RBRACE','case_block',5,'p_case_block','es5.py',1358),
+  ('case_clauses_opt -> empty','case_clauses_opt',1,'p_case_clauses_opt','es5.py',1372),
+  ('case_clauses_opt -> case_clauses','case_clauses_opt',1,'p_case_clauses_opt','es5.py',1373),
+  ('case_clauses -> case_clause','case_clauses',1,'p_case_clauses','es5.py',1378),
+  ('case_clauses -> case_clauses case_clause','case_clauses',2,'p_case_clauses','es5.py',1379),
+  ('case_clause -> CASE expr COLON source_elements','case_clause',4,'p_case_clause','es5.py',1388),
+  ('default_clause -> DEFAULT COLON source_elements','default_clause',3,'p_default_clause','es5.py',1393),
+  ('labelled_statement -> identifier COLON statement','labelled_statement',3,'p_labelled_statement','es5.py',1399),
+  ('throw_statement -> THROW expr SEMI','throw_statement',3,'p_throw_statement','es5.py',1405),
+  ('throw_statement -> THROW expr AUTOSEMI','throw_statement',3,'p_throw_statement','es5.py',1406),
+  ('try_statement -> TRY block catch','try_statement',3,'p_try_statement_1','es5.py',1413),
+  ('try_statement -> TRY block finally','try_statement',3,'p_try_statement_2','es5.py',1418),
+  ('try_statement -> TRY block catch finally','try_statement',4,'p_try_statement_3','es5.py',1423),
+  ('catch -> CATCH LPAREN identifier RPAREN block','catch',5,'p_catch','es5.py',1428),
+  ('finally -> FINALLY block','finally',2,'p_finally','es5.py',1433),
+  ('debugger_statement -> DEBUGGER SEMI','debugger_statement',2,'p_debugger_statement','es5.py',1439),
+  ('debugger_statement -> DEBUGGER AUTOSEMI','debugger_statement',2,'p_debugger_statement','es5.py',1440),
+  ('function_declaration -> FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE','function_declaration',7,'p_function_declaration','es5.py',1448),
+  ('function_declaration -> FUNCTION identifier LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_declaration',8,'p_function_declaration','es5.py',1449),
+  ('function_expr -> FUNCTION LPAREN RPAREN LBRACE function_body RBRACE','function_expr',6,'p_function_expr_1','es5.py',1463),
+  ('function_expr -> FUNCTION LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_expr',7,'p_function_expr_1','es5.py',1464),
+  ('function_expr -> FUNCTION identifier LPAREN RPAREN LBRACE function_body RBRACE','function_expr',7,'p_function_expr_2','es5.py',1478),
+  ('function_expr -> FUNCTION identifier LPAREN formal_parameter_list RPAREN LBRACE function_body RBRACE','function_expr',8,'p_function_expr_2','es5.py',1479),
+  ('formal_parameter_list -> identifier','formal_parameter_list',1,'p_formal_parameter_list','es5.py',1492),
+  ('formal_parameter_list -> formal_parameter_list COMMA identifier','formal_parameter_list',3,'p_formal_parameter_list','es5.py',1493),
+  ('function_body -> source_elements','function_body',1,'p_function_body','es5.py',1502),
+]
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+Selectors for the nodes of a tree, in the form of CSS-like patterns.
+
+A selector is made up of compounds separated by combinators, where a
+compound is the name of a node type (or ``*`` for any node), which may
+be followed by any number of attribute filters enclosed by brackets;
+the type of a node matches if the name is the name of its class or any
+of its base classes.  An attribute filter may be one of the following:
+
+``[attr]``
+    The attribute is present and is not None or empty.
+``[attr=value]``
+    The attribute is equal to the value, which may be quoted with
+    either single or double quotes, with backslash escapes for the
+    quote character.  Should the attribute be a node, or a list of
+    nodes, the value will be treated as a compound instead.
+``[attr=Compound[...]]``
+    The attribute is a node (or a list with a node) that matches the
+    nested compound.
+
+The combinators are ``>`` for a child of the node matched by the
+previous compound, or whitespace for any descendant, where the children
+of a node are those produced by its children method.
+"""
+
+import re
+
+from calmjs.parse.asttypes import Node
+
+PATT_NAME = re.compile(r'[A-Za-z_$][\w$]*|\*')
+PATT_WORD = re.compile(r'''[^\s\[\]=>"']+''')
+PATT_STRING = re.compile(r'''"((?:[^"\\]|\\.)*)"|'((?:[^'\\]|\\.)*)\'''')
+PATT_ESCAPE = re.compile(r'\\(.)')
+PATT_SPACE = re.compile(r'\s*')
+
+# the names of the classes of every node type.
+_type_names = {}
+
+
+def type_names(cls):
+    """
+    Return the set of names of the class and of its base classes.
+    """
+
+    names = _type_names.get(cls)
+    if names is None:
+        names = _type_names[cls] = frozenset(
+            base.__name__ for base in cls.__mro__)
+    return names
+
+
+class SelectorParser(object):
+    """
+    Turn the text of a selector into a list of (combinator, matcher)
+    for every compound, where the first combinator is None and every
+    matcher is a function that accepts a node.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+
+    def error(self, message):
+        raise ValueError('%s at position %d in selector %r' % (
+            message, self.pos, self.text))
+
+    def space(self):
+        end = PATT_SPACE.match(self.text, self.pos).end()
+        skipped = end > self.pos
+        self.pos = end
+        return skipped
+
+    def peek(self):
+        return self.text[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        self.space()
+        if self.peek() != char:
+            self.error('expected %r' % char)
+        self.pos += 1
+
+    def parse(self):
+        self.space()
+        chain = [(None, self.compound())]
+        while True:
+            skipped = self.space()
+            if self.pos == len(self.text):
+                return chain
+            if self.peek() == '>':
+                self.pos += 1
+                self.space()
+                combinator = '>'
+            elif skipped:
+                combinator = ' '
+            else:
+                self.error('unexpected %r' % self.peek())
+            chain.append((combinator, self.compound()))
+
+    def compound(self):
+        match = PATT_NAME.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            name = match.group()
+        elif self.peek() == '[':
+            name = '*'
+        else:
+            self.error('expected a node type')
+
+        checks = []
+        while self.peek() == '[':
+            self.pos += 1
+            self.space()
+            match = PATT_NAME.match(self.text, self.pos)
+            if not match or match.group() == '*':
+                self.error('expected an attribute name')
+            self.pos = match.end()
+            attr = match.group()
+            self.space()
+            if self.peek() == '=':
+                self.pos += 1
+                self.space()
+                checks.append(self.attribute(attr))
+            else:
+                checks.append(_attr_present(attr))
+            self.expect(']')
+        return _compound(None if name == '*' else name, checks)
+
+    def attribute(self, attr):
+        match = PATT_STRING.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            value = match.group(1)
+            if value is None:
+                value = match.group(2)
+            return _attr_equals(attr, PATT_ESCAPE.sub(r'\1', value), None)
+
+        match = PATT_NAME.match(self.text, self.pos)
+        if match and self.text[match.end():match.end() + 1] == '[':
+            return _attr_equals(attr, None, self.compound())
+        match = PATT_WORD.match(self.text, self.pos)
+        if not match:
+            self.error('expected a value')
+        self.pos = match.end()
+        value = match.group()
+        # a bare word may also be the name of a node type.
+        name = PATT_NAME.match(value)
+        return _attr_equals(attr, value, _compound(
+            None if value == '*' else value, []
+        ) if name and name.end() == len(value) else None)
+
+
+def _compound(name, checks):
+    def match(node):
+        if name is not None and name not in type_names(type(node)):
+            return False
+        for check in checks:
+            if not check(node):
+                return False
+        return True
+    match.name = name
+    return match
+
+
+def _attr_present(attr):
+    def check(node):
+        value = getattr(node, attr, None)
+        return value is not None and value != [] and value != ''
+    return check
+
+
+def _attr_equals(attr, literal, compound):
+    def check(node):
+        value = getattr(node, attr, None)
+        if value is None:
+            return False
+        if isinstance(value, list):
+            return compound is not None and any(
+                isinstance(item, Node) and compound(item) for item in value)
+        if isinstance(value, Node):
+            return compound is not None and compound(value)
+        return literal is not None and str(value) == literal
+    return check
+
+
+class Selector(object):
+    """
+    A selector compiled from the text of a CSS-like pattern.
+
+    >>> from calmjs.parse.parsers.es5 import parse
+    >>> from calmjs.parse.query import Selector
+    >>> tree = parse(u"var a = require('a'), b = f('b');")
+    >>> selector = Selector(
+    ...     'FunctionCall[identifier=Identifier[value=require]] '
+    ...     '> Arguments > String')
+    >>> [node.value for node in selector.select(tree)]
+    ["'a'"]
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.chain = SelectorParser(text).parse()
+        # the name of the node type that must be matched by any node
+        # selected, or None for any node.
+        self.name = self.chain[-1][1].name
+
+    def __repr__(self):
+        return '<%s %r>' % (type(self).__name__, self.text)
+
+    def match(self, node, ancestors=()):
+        """
+        Return True if the node, with the provided list of ancestors
+        from the root down to its parent, matches this selector.
+        """
+
+        chain = self.chain
+        return chain[-1][1](node) and _match_ancestors(
+            chain, len(chain) - 1, ancestors, len(ancestors))
+
+    def select(self, node):
+        """
+        Return the list of nodes in the tree from the provided node
+        (inclusive) that matched this selector, in pre-order.
+        """
+
+        return select(node, self)[0]
+
+
+def _match_ancestors(chain, idx, ancestors, pos):
+    # ensure the compounds before the one at idx, which matched the node
+    # at pos, are matched by the ancestors of that node.
+    if idx == 0:
+        return True
+    combinator = chain[idx][0]
+    match = chain[idx - 1][1]
+    if combinator == '>':
+        return pos > 0 and match(ancestors[pos - 1]) and _match_ancestors(
+            chain, idx - 1, ancestors, pos - 1)
+    for ancestor in range(pos - 1, -1, -1):
+        if match(ancestors[ancestor]) and _match_ancestors(
+                chain, idx - 1, ancestors, ancestor):
+            return True
+    return False
+
+
+def select(node, *selectors):
+    """
+    Walk through the tree from the provided node (inclusive) once, and
+    return a list with the list of nodes matched by each of the provided
+    selectors, which may either be a Selector or the text for one.
+
+    >>> from calmjs.parse.parsers.es5 import parse
+    >>> from calmjs.parse.query import select
+    >>> tree = parse(u'var a = f(b); g(a.c);')
+    >>> calls, props = select(tree, 'FunctionCall', 'DotAccessor > *')
+    >>> [call.identifier.value for call in calls]
+    ['f', 'g']
+    >>> [prop.value for prop in props]
+    ['a', 'c']
+    """
+
+    if not isinstance(node, Node):
+        raise TypeError('not a node')
+
+    selectors = [
+        selector if isinstance(selector, Selector) else Selector(selector)
+        for selector in selectors
+    ]
+    results = [[] for selector in selectors]
+    # group the selectors by the node type they select, such that each
+    # node will only be tested against the relevant selectors.
+    by_name = {}
+    for selector, result in zip(selectors, results):
+        by_name.setdefault(selector.name, []).append((selector, result))
+    every = by_name.pop(None, [])
+
+    ancestors = []
+    stack = [(node, 0)]
+    while stack:
+        current, depth = stack.pop()
+        del ancestors[depth:]
+        candidates = list(every)
+        for name in type_names(type(current)):
+            candidates.extend(by_name.get(name, ()))
+        for selector, result in candidates:
+            if selector.match(current, ancestors):
+                result.append(current)
+        ancestors.append(current)
+        stack.extend(
+            (child, depth + 1) for child in reversed(current.children())
+            if child is not None
+        )
+    return results
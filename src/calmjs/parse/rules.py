@@ -159,7 +159,9 @@ def indent(indent_str=None):
         }, 'deferrable_handlers': {
             LineComment: deferrable_handler_comment,
             BlockComment: deferrable_handler_comment,
-        }}
+        }, 'reset_hooks': [
+            inst.reset,
+        ]}
     return indentation_rule
 
 
@@ -199,5 +201,8 @@ def obfuscate(
             'prewalk_hooks': [
                 inst.prewalk_hook,
             ],
+            'reset_hooks': [
+                inst.reset,
+            ],
         }
     return name_obfuscation_rules
@@ -9,6 +9,7 @@ from __future__ import unicode_literals
 from collections import namedtuple
 from functools import partial
 
+from calmjs.parse.asttypes import EMPTY_TOKEN_MAP
 from calmjs.parse.asttypes import Elision
 from calmjs.parse.asttypes import Identifier
 
@@ -367,7 +368,8 @@ class ElisionJoinAttr(ElisionToken):
 
     # the surrogate Elision node to be treated as a separator.
     sep = Elision(1)
-    sep._token_map = {}  # so its getpos returns an implied position
+    # so its getpos returns an implied position
+    sep._token_map = EMPTY_TOKEN_MAP
 
     def __call__(self, walk, dispatcher, node):
         nodes = iter(self._getattr(dispatcher, node))
@@ -44,8 +44,14 @@ class StringIOWrapper(StringIO):
 
 def make_suite():  # pragma: no cover
     from calmjs.parse.lexers import es5 as es5lexer
+    from calmjs.parse.parsers import es5 as es5parser
+    from calmjs.parse import cache
+    from calmjs.parse import flat
+    from calmjs.parse import query
     from calmjs.parse import walkers
     from calmjs.parse import sourcemap
+    from calmjs.parse.unparsers import compiler
+    from calmjs.parse.unparsers import walker
 
     def open(p, flag='r'):
         result = StringIOWrapper(examples[p] if flag == 'r' else '')
@@ -88,10 +94,22 @@ def make_suite():  # pragma: no cover
     try:
         test_suite.addTest(doctest.DocTestSuite(
             es5lexer, optionflags=optflags))
+        test_suite.addTest(doctest.DocTestSuite(
+            es5parser, optionflags=optflags))
+        test_suite.addTest(doctest.DocTestSuite(
+            cache, optionflags=optflags))
+        test_suite.addTest(doctest.DocTestSuite(
+            flat, optionflags=optflags))
+        test_suite.addTest(doctest.DocTestSuite(
+            query, optionflags=optflags))
         test_suite.addTest(doctest.DocTestSuite(
             walkers, optionflags=optflags))
         test_suite.addTest(doctest.DocTestSuite(
             sourcemap, optionflags=optflags))
+        test_suite.addTest(doctest.DocTestSuite(
+            walker, optionflags=optflags))
+        test_suite.addTest(doctest.DocTestSuite(
+            compiler, optionflags=optflags))
         test_suite.addTest(doctest.DocTestCase(
             # skipping all the error case tests which should all be in the
             # troubleshooting section at the end; bump the index whenever
@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
+import copy
+import pickle
+import sys
 import unittest
 
 from calmjs.parse import asttypes
+from calmjs.parse import es5
 from calmjs.parse.asttypes import Comments
 from calmjs.parse.asttypes import BlockComment
 from calmjs.parse.asttypes import LineComment
 from calmjs.parse.asttypes import nodetype
+from calmjs.parse.walkers import ReprWalker
 
 
 class CommentNodesTestCase(unittest.TestCase):
@@ -52,3 +57,128 @@ class MiscTestCase(unittest.TestCase):
         self.assertIs(asttypes.Node, nodetype(node))
         self.assertIs(Unsupported, nodetype(unsupported))
         self.assertIs(object, nodetype(object()))
+
+
+class TokenMapTestCase(unittest.TestCase):
+
+    def test_pack_pos(self):
+        for pos in [(0, 0, 0), (1, 2, 3), (2 ** 32 - 1, 1, 2 ** 32 - 1)]:
+            self.assertEqual(pos, asttypes.unpack_pos(asttypes.pack_pos(*pos)))
+
+    def test_getpos_unset(self):
+        node = asttypes.Node()
+        del node._token_map
+        self.assertEqual(node.getpos('a', 0), (None, None, None))
+
+    def test_getpos_empty(self):
+        node = asttypes.Node()
+        self.assertIs(node._token_map, asttypes.EMPTY_TOKEN_MAP)
+        self.assertEqual(node.getpos('a', 0), (0, 0, 0))
+
+    def test_getpos_packed(self):
+        node = asttypes.Node()
+        node._token_map = (
+            '(', asttypes.pack_pos(0, 1, 1),
+            ';', asttypes.pack_pos(3, 1, 4),
+            ';', asttypes.pack_pos(5, 2, 1),
+        )
+        self.assertEqual(node.getpos('(', 0), (0, 1, 1))
+        self.assertEqual(node.getpos(';', 0), (3, 1, 4))
+        self.assertEqual(node.getpos(';', 1), (5, 2, 1))
+        self.assertEqual(node.getpos(';', 2), (0, 0, 0))
+        self.assertEqual(node.getpos(')', 0), (0, 0, 0))
+
+    def test_getpos_dict(self):
+        node = asttypes.Node()
+        node._token_map = {';': [(3, 1, 4), (5, 2, 1)]}
+        self.assertEqual(node.getpos(';', 1), (5, 2, 1))
+        self.assertEqual(node.getpos(';', 2), (0, 0, 0))
+        self.assertEqual(node.getpos(')', 0), (0, 0, 0))
+
+    def test_parsed(self):
+        program = es5('for (;;) {}\nvar x;')
+        for_ = program.children()[0]
+        self.assertEqual(for_.getpos(';', 0), (5, 1, 6))
+        self.assertEqual(for_.getpos(';', 1), (6, 1, 7))
+        self.assertEqual(for_.getpos(')', 0), (7, 1, 8))
+        self.assertEqual(for_.statement.getpos('{', 0), (9, 1, 10))
+        identifier = program.children()[1].children()[0].identifier
+        self.assertEqual(identifier.getpos('x', 0), (16, 2, 5))
+        copied = pickle.loads(pickle.dumps(program))
+        self.assertEqual(
+            copied.children()[0]._token_map, for_._token_map)
+
+
+class PickleTestCase(unittest.TestCase):
+
+    def test_roundtrip_plain(self):
+        tree = asttypes.ES5Program([
+            asttypes.ExprStatement(asttypes.BinOp(
+                '+', asttypes.Identifier('a'), asttypes.Number('1'))),
+            asttypes.VarStatement([
+                asttypes.VarDecl(asttypes.Identifier('b'))]),
+            asttypes.ExprStatement(asttypes.Array([
+                asttypes.Elision(1), asttypes.Number('2')])),
+        ])
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            result = pickle.loads(pickle.dumps(tree, protocol))
+            self.assertEqual(
+                ReprWalker().walk(tree), ReprWalker().walk(result))
+            binop = result.children()[0].expr
+            self.assertTrue(isinstance(binop, asttypes.BinOp))
+            self.assertEqual(binop.left.value, 'a')
+            self.assertIsNone(result.children()[1].children()[0].initializer)
+            self.assertEqual(result.children()[2].expr.items[1].value, '2')
+
+    def test_none_in_list(self):
+        tree = asttypes.Node([None, asttypes.Number('1'), None])
+        result = pickle.loads(pickle.dumps(tree))
+        self.assertEqual(3, len(result.children()))
+        self.assertIsNone(result.children()[0])
+        self.assertEqual(result.children()[1].value, '1')
+        self.assertIsNone(result.children()[2])
+
+    def test_roundtrip_parsed(self):
+        tree = es5(
+            '// header\nvar a = function(x) {\n  return [, x / 2];\n};\n',
+            with_comments=True)
+        result = pickle.loads(pickle.dumps(tree))
+        self.assertIs(type(tree), type(result))
+        self.assertEqual(repr(tree), repr(result))
+        self.assertEqual(str(tree), str(result))
+        self.assertEqual(
+            list(tree.children()[0].getpos('var', 0)),
+            list(result.children()[0].getpos('var', 0)))
+        self.assertEqual(str(result.children()[0].comments), '// header')
+
+    def test_shared_node(self):
+        ident = asttypes.Identifier('a')
+        tree = asttypes.Node([
+            asttypes.BinOp('+', ident, ident), ident])
+        result = pickle.loads(pickle.dumps(tree))
+        binop = result.children()[0]
+        self.assertIs(binop.left, binop.right)
+        self.assertIs(binop.left, result.children()[1])
+
+    def test_deep_tree(self):
+        depth = sys.getrecursionlimit() * 2
+        node = asttypes.Identifier('a')
+        for _ in range(depth):
+            node = asttypes.BinOp('+', node, asttypes.Identifier('a'))
+        data = pickle.dumps(node)
+        result = pickle.loads(data)
+        self.assertEqual(data, pickle.dumps(result))
+        count = 0
+        while isinstance(result, asttypes.BinOp):
+            count += 1
+            result = result.left
+        self.assertEqual(depth, count)
+
+    def test_copy(self):
+        tree = es5('var a = b;')
+        stmt = copy.copy(tree)
+        self.assertIsNot(stmt, tree)
+        self.assertIs(stmt.children()[0], tree.children()[0])
+        deep = copy.deepcopy(tree)
+        self.assertIsNot(deep.children()[0], tree.children()[0])
+        self.assertEqual(repr(deep), repr(tree))
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from calmjs.parse import batch
+from calmjs.parse.exceptions import ECMASyntaxError
+from calmjs.parse.parsers.es5 import parse
+from calmjs.parse.parsers.es5 import read
+
+
+class BatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = mkdtemp()
+        self.addCleanup(rmtree, self.tempdir)
+        sources = [
+            ('a.js', 'var a = function(x) {\n  return x / 2;\n};\n'),
+            ('b.js', '// comment\nvar b = /b/g;\n'),
+            ('bad.js', 'var c = {;\n'),
+            ('d.js', 'function d() {\n  return [1, 2, 3];\n}\n'),
+        ]
+        self.paths = []
+        for name, source in sources:
+            path = join(self.tempdir, name)
+            with open(path, 'w', encoding='utf8') as fd:
+                fd.write(source)
+            self.paths.append(path)
+
+    def test_parse_path(self):
+        result = batch.parse_path(parse, self.paths[0])
+        self.assertEqual(result.path, self.paths[0])
+        self.assertIsNone(result.error)
+        self.assertEqual(result.node.sourcepath, self.paths[0])
+        with open(self.paths[0], encoding='utf8') as fd:
+            self.assertEqual(repr(result.node), repr(read(fd)))
+
+    def test_parse_path_error(self):
+        result = batch.parse_path(parse, self.paths[2])
+        self.assertIsNone(result.node)
+        self.assertTrue(isinstance(result.error, ECMASyntaxError))
+        self.assertIn(
+            "Unexpected ';' at 1:10 after '{' at 1:9 in ", str(result.error))
+        self.assertIn('bad.js', str(result.error))
+
+    def test_parse_files_ordered(self):
+        results = list(batch.parse_files(self.paths, workers=2))
+        self.assertEqual(self.paths, [r.path for r in results])
+        for path, result in zip(self.paths, results):
+            expected = batch.parse_path(parse, path)
+            self.assertEqual(repr(expected.node), repr(result.node))
+            self.assertEqual(str(expected.error), str(result.error))
+        self.assertEqual(
+            [None, None, ECMASyntaxError, None],
+            [r.error and type(r.error) for r in results])
+        self.assertEqual(results[0].node.sourcepath, self.paths[0])
+        self.assertEqual(
+            str(results[3].node), 'function d() {\n  return [1, 2, 3];\n}\n')
+
+    def test_parse_files_unordered_chunked(self):
+        results = list(batch.parse_files(
+            self.paths * 3, workers=2, ordered=False, chunksize=2))
+        self.assertEqual(
+            sorted(self.paths * 3), sorted(r.path for r in results))
+
+    def test_parse_files_with_comments(self):
+        results = list(batch.parse_files(
+            self.paths[1:2], workers=1, with_comments=True))
+        self.assertEqual(
+            str(results[0].node), '// comment\nvar b = /b/g;\n')
+
+    def test_parse_files_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(batch.parse_files(
+                self.paths, executor=executor))
+            # executor not shut down.
+            self.assertEqual(executor.submit(len, 'x').result(), 1)
+        self.assertEqual(self.paths, [r.path for r in results])
+
+    def test_parse_files_empty(self):
+        self.assertEqual([], list(batch.parse_files([], workers=1)))
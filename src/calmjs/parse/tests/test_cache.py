@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import unittest
+from functools import partial
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from calmjs.parse.cache import CacheStats
+from calmjs.parse.cache import DiskCache
+from calmjs.parse.cache import MemoryCache
+from calmjs.parse.cache import logger
+from calmjs.parse.exceptions import ECMASyntaxError
+from calmjs.parse.parsers import es5
+from calmjs.parse.testing.util import setup_logger
+from calmjs.parse.utils import generate_tab_names
+
+
+class DiskCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = mkdtemp()
+        self.addCleanup(rmtree, self.tempdir)
+        self.calls = []
+
+        def parse(source, with_comments=False):
+            self.calls.append((source, with_comments))
+            return es5.parse(source, with_comments=with_comments)
+
+        self.parse = parse
+
+    def entries(self, path):
+        return sorted(
+            name for name in os.listdir(path) if name.endswith('.ast'))
+
+    def test_creates_directory(self):
+        path = join(self.tempdir, 'nested', 'cache')
+        DiskCache(path)
+        self.assertTrue(os.path.isdir(path))
+
+    def test_key(self):
+        cache = DiskCache(self.tempdir)
+        self.assertEqual(cache.key(u'var a;'), cache.key(u'var a;'))
+        self.assertNotEqual(cache.key(u'var a;'), cache.key(u'var b;'))
+        self.assertNotEqual(
+            cache.key(u'var a;'), cache.key(u'var a;', with_comments=True))
+        other = DiskCache(self.tempdir, tab_names=(
+            'lextab_es5_other', 'yacctab_es5_other'))
+        self.assertNotEqual(cache.key(u'var a;'), other.key(u'var a;'))
+        # a different version of calmjs.parse will not share the keys.
+        upgraded = DiskCache(self.tempdir)
+        upgraded.version = cache.version + '.post1'
+        self.assertNotEqual(cache.key(u'var a;'), upgraded.key(u'var a;'))
+        # lone surrogates are still keyed.
+        self.assertTrue(cache.key(u'var a = "\ud800";'))
+
+    def test_default_tab_names(self):
+        # the tab names are not derived from the module of the parse
+        # function, which may be anything.
+        cache = DiskCache(self.tempdir, parse=self.parse)
+        self.assertEqual(
+            DiskCache(self.tempdir).key(u'var a;'), cache.key(u'var a;'))
+        self.assertEqual(
+            generate_tab_names(es5.__name__), cache.tab_names)
+
+    def test_partial(self):
+        cache = DiskCache(self.tempdir, parse=partial(
+            self.parse, with_comments=False))
+        self.assertEqual('var a = 1;\n', str(cache(u'var a = 1;')))
+        self.assertEqual('var a = 1;\n', str(cache(u'var a = 1;')))
+        self.assertEqual(1, len(self.calls))
+
+    def test_hit_and_miss(self):
+        cache = DiskCache(self.tempdir, parse=self.parse)
+        source = u'var a = function(x) {\n  return x / 2;\n};\n'
+        first = cache(source)
+        self.assertEqual(1, len(self.calls))
+        self.assertEqual(1, len(self.entries(self.tempdir)))
+        second = cache(source)
+        self.assertEqual(1, len(self.calls))
+        self.assertIsNot(first, second)
+        self.assertEqual(repr(first), repr(second))
+        self.assertEqual(str(first), str(second))
+        self.assertEqual(
+            (first.children()[0].lineno, first.children()[0].colno),
+            (second.children()[0].lineno, second.children()[0].colno))
+
+        # a fresh instance on the same directory shares the entries.
+        third = DiskCache(self.tempdir, parse=self.parse)(source)
+        self.assertEqual(1, len(self.calls))
+        self.assertEqual(repr(first), repr(third))
+
+    def test_with_comments(self):
+        cache = DiskCache(self.tempdir, parse=self.parse)
+        source = u'// comment\nvar a;\n'
+        plain = cache(source)
+        commented = cache(source, with_comments=True)
+        self.assertEqual(2, len(self.calls))
+        self.assertEqual(2, len(self.entries(self.tempdir)))
+        self.assertNotEqual(str(plain), str(commented))
+        self.assertEqual(
+            str(commented), str(cache(source, with_comments=True)))
+        self.assertEqual(2, len(self.calls))
+
+    def test_syntax_error_not_cached(self):
+        cache = DiskCache(self.tempdir, parse=self.parse)
+        with self.assertRaises(ECMASyntaxError):
+            cache(u'var a = {;')
+        with self.assertRaises(ECMASyntaxError):
+            cache(u'var a = {;')
+        self.assertEqual(2, len(self.calls))
+        self.assertEqual([], os.listdir(self.tempdir))
+
+    def test_invalid_type(self):
+        cache = DiskCache(self.tempdir, parse=self.parse)
+        with self.assertRaises(TypeError):
+            cache(b'var a;')
+
+    def test_corrupted_entry(self):
+        cache = DiskCache(self.tempdir, parse=self.parse)
+        source = u'var a = 1;'
+        with open(join(self.tempdir, cache.key(source) + '.ast'), 'wb') as fd:
+            fd.write(b'not a pickle')
+        self.assertEqual('var a = 1;\n', str(cache(source)))
+        self.assertEqual(1, len(self.calls))
+        self.assertEqual('var a = 1;\n', str(cache(source)))
+        self.assertEqual(1, len(self.calls))
+
+    def test_eviction(self):
+        cache = DiskCache(self.tempdir, parse=self.parse)
+        cache(u'var a = 1;')
+        size = cache.size
+        self.assertTrue(size > 0)
+        # evict once the third entry is added.
+        cache.max_size = size * 3 - 1
+        cache(u'var b = 1;')
+        self.assertEqual(2, len(self.entries(self.tempdir)))
+        # age both entries, then use the first one.
+        for source, age in ((u'var a = 1;', 20), (u'var b = 1;', 10)):
+            path = join(self.tempdir, cache.key(source) + '.ast')
+            mtime = os.stat(path).st_mtime - age
+            os.utime(path, (mtime, mtime))
+        cache(u'var a = 1;')
+        self.assertEqual(2, len(self.calls))
+        cache(u'var c = 1;')
+        self.assertEqual(3, len(self.calls))
+        # the least recently used entry was evicted.
+        self.assertEqual(sorted([
+            cache.key(u'var a = 1;') + '.ast',
+            cache.key(u'var c = 1;') + '.ast',
+        ]), self.entries(self.tempdir))
+        self.assertTrue(cache.size <= cache.max_size * 3 // 4)
+
+    def test_clear(self):
+        cache = DiskCache(self.tempdir, parse=self.parse)
+        cache(u'var a = 1;')
+        cache(u'var b = 1;')
+        cache.clear()
+        self.assertEqual([], os.listdir(self.tempdir))
+        self.assertEqual(0, cache.size)
+
+    def test_no_temporary_files(self):
+        cache = DiskCache(self.tempdir, parse=self.parse)
+        cache(u'var a = 1;')
+
+        def fail(*a, **kw):
+            raise ValueError('unpicklable')
+
+        with self.assertRaises(ValueError):
+            cache.store('key', type('Broken', (object,), {
+                '__reduce__': fail})())
+        self.assertEqual(self.entries(self.tempdir), os.listdir(self.tempdir))
+
+    def test_store_failure(self):
+        err = setup_logger(self, logger)
+
+        def fail(*a, **kw):
+            raise ValueError('unpicklable')
+
+        broken = type('Broken', (object,), {'__reduce__': fail})()
+        cache = DiskCache(self.tempdir, parse=lambda source, **kw: broken)
+        self.assertIs(broken, cache(u'var a = 1;'))
+        self.assertIn('failed to store the tree into the cache', (
+            err.getvalue()))
+        self.assertIn('ValueError: unpicklable', err.getvalue())
+        self.assertEqual([], os.listdir(self.tempdir))
+
+        # a directory that cannot be written to.
+        cache = DiskCache(self.tempdir, parse=self.parse)
+        cache.path = join(self.tempdir, 'missing')
+        self.assertEqual('var a = 1;\n', str(cache(u'var a = 1;')))
+        self.assertEqual(1, len(self.calls))
+
+    def test_stale_temporary_files(self):
+        cache = DiskCache(self.tempdir, parse=self.parse)
+        cache(u'var a = 1;')
+        stale = join(self.tempdir, '.stale.tmp')
+        fresh = join(self.tempdir, '.fresh.tmp')
+        for path in (stale, fresh):
+            with open(path, 'wb') as fd:
+                fd.write(b'partial')
+        mtime = time.time() - cache.stale_age - 1
+        os.utime(stale, (mtime, mtime))
+        cache.clear()
+        # only the temporary file that may still be written remains.
+        self.assertEqual(['.fresh.tmp'], os.listdir(self.tempdir))
+
+    def test_shared_directory(self):
+        first = DiskCache(self.tempdir, parse=self.parse)
+        second = DiskCache(self.tempdir, parse=self.parse)
+        first(u'var a = 1;')
+        size = first.size
+        first.max_size = second.max_size = size * 2 + size // 2
+        second(u'var b = 1;')
+        self.assertEqual(2, len(self.entries(self.tempdir)))
+        # the entries written by the other instance are accounted for.
+        first(u'var c = 1;')
+        self.assertEqual(1, len(self.entries(self.tempdir)))
+        self.assertTrue(first.size <= first.max_size * 3 // 4)
+
+
+class MemoryCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+        def parse(source, with_comments=False):
+            self.calls.append((source, with_comments))
+            return es5.parse(source, with_comments=with_comments)
+
+        self.parse = parse
+
+    def test_lru(self):
+        cache = MemoryCache(self.parse, size=2)
+        a = cache(u'var a;')
+        b = cache(u'var b;')
+        self.assertIs(a, cache(u'var a;'))
+        # b is now the least recently used.
+        cache(u'var c;')
+        self.assertEqual(cache.stats(), CacheStats(
+            hits=1, misses=3, evictions=1, entries=2, bytes=12))
+        self.assertIs(a, cache(u'var a;'))
+        self.assertIsNot(b, cache(u'var b;'))
+        self.assertEqual(4, len(self.calls))
+        self.assertEqual(cache.stats(), CacheStats(
+            hits=2, misses=4, evictions=2, entries=2, bytes=12))
+
+    def test_with_comments(self):
+        cache = MemoryCache(self.parse)
+        src = u'// é\nvar a;'
+        self.assertIsNot(cache(src), cache(src, with_comments=True))
+        self.assertEqual(cache.stats(), CacheStats(
+            hits=0, misses=2, evictions=0, entries=2, bytes=24))
+
+    def test_errors(self):
+        cache = MemoryCache(self.parse)
+        with self.assertRaises(ECMASyntaxError):
+            cache(u'var a = {;')
+        with self.assertRaises(TypeError):
+            cache(b'var a;')
+        self.assertEqual(cache.stats(), CacheStats(
+            hits=0, misses=2, evictions=0, entries=0, bytes=0))
@@ -28,13 +28,18 @@ __author__ = 'Ruslan Spivak <ruslan.spivak@gmail.com>'
 import unittest
 import textwrap
 from functools import partial
+from io import StringIO
 
+from calmjs.parse.lexers.es5 import FastLexer
 from calmjs.parse.lexers.es5 import Lexer
+from calmjs.parse.lexers.es5 import tokenize_compact
+from calmjs.parse.lexers.tokens import AutoLexToken
 from calmjs.parse.exceptions import ECMASyntaxError
 
 from calmjs.parse.testing.util import build_equality_testcase
 from calmjs.parse.testing.util import build_exception_testcase
 from calmjs.parse.tests.lexer import (
+    es5_comment_cases,
     run_lexer,
     run_lexer_pos,
     es5_cases,
@@ -99,6 +104,72 @@ class LexerGeneralTestCase(unittest.TestCase):
         token = lexer.backtracked_token(pos=2)
         self.assertEqual(('REGEX', '/a/'), (token.type, token.value))
 
+    def test_reset(self):
+        lexer = Lexer()
+        lexer.input('(\n/b/')
+        self.assertEqual(lexer.next().type, 'LPAREN')
+        self.assertEqual(lexer.next().type, 'REGEX')
+        self.assertEqual(lexer.lineno, 2)
+        self.assertEqual(list(lexer.newline_idx), [0, 2])
+        self.assertEqual(len(lexer.token_stack[-1][1]), 1)
+
+        lexer.reset()
+        self.assertEqual(lexer.lineno, 1)
+        self.assertEqual(lexer.lexpos, 0)
+        self.assertEqual(lexer.lexer.lexdata, '')
+        self.assertEqual(list(lexer.newline_idx), [0])
+        self.assertEqual(lexer.token_stack, [[None, []]])
+        self.assertIsNone(lexer.cur_token)
+        self.assertIsNone(lexer.prev_token)
+        self.assertIsNone(lexer.valid_prev_token)
+        self.assertIsNone(lexer.token())
+
+    def test_input_resets(self):
+        lexer = Lexer()
+        lexer.input('a\n\nb\n(')
+        self.assertEqual(len(list(lexer)), 3)
+        # a new input will not be affected by the previous input.
+        lexer.input('1 / 2')
+        tokens = list(lexer)
+        self.assertEqual(
+            ['NUMBER 1:0:1', 'DIV 1:2:3', 'NUMBER 1:4:5'],
+            ['%s %d:%d:%d' % (t.type, t.lineno, t.lexpos, t.colno)
+             for t in tokens])
+
+    def test_newline_idx_precomputed(self):
+        lexer = Lexer()
+        lexer.input('a\nb\r\nc\rd')
+        self.assertEqual(list(lexer.newline_idx), [0, 2, 5, 7])
+        self.assertEqual(lexer.lineno, 1)
+        self.assertEqual([
+            (token.value, token.lineno, token.colno) for token in lexer
+        ], [('a', 1, 1), ('b', 2, 1), ('c', 3, 1), ('d', 4, 1)])
+        self.assertEqual(lexer.lineno, 4)
+
+    def test_lookup_position(self):
+        lexer = Lexer()
+        lexer.input('var a = 1;\n/* multi\nline */\nb = a;')
+        tokens = list(lexer)
+        self.assertEqual([
+            lexer.lookup_position(token.lexpos) for token in tokens
+        ], [(token.lineno, token.colno) for token in tokens])
+        self.assertEqual(lexer.lookup_position(19), (2, 9))
+        self.assertEqual(lexer.lookup_position(20), (3, 1))
+        self.assertEqual(lexer.lookup_position(0), (1, 1))
+
+    def test_line_separators(self):
+        # the line and paragraph separators outside of tokens are
+        # ignored like whitespaces, but not inside comments.
+        lexer = Lexer(yield_comments=True)
+        lexer.input('a\u2028b /*\u2029*/ c\n// \u2028\nd')
+        self.assertEqual([
+            (token.value, token.lineno, token.colno) for token in lexer
+        ], [
+            ('a', 1, 1), ('b', 1, 3), ('/*\u2029*/', 1, 5), ('c', 2, 4),
+            ('// ', 3, 1), ('d', 4, 1),
+        ])
+        self.assertEqual(list(lexer.newline_idx), [0, 7, 12, 17])
+
 
 class LexerWithCommentsTestCase(unittest.TestCase):
 
@@ -182,3 +253,259 @@ LexerErrorStrDQTestCase = build_exception_testcase(
 LexerPosTestCase = build_equality_testcase(
     'LexerPosTestCase', partial(
         run_lexer_pos, lexer_cls=Lexer), es5_pos_cases)
+
+
+def dump_tokens(tokens):
+    return [(
+        token.type, token.value, token.lineno, token.lexpos, token.colno, [
+            (t.type, t.value, t.lineno, t.lexpos, t.colno)
+            for t in getattr(token, 'hidden_tokens', [])
+        ],
+    ) for token in tokens]
+
+
+class LexerTokenizeStreamTestCase(unittest.TestCase):
+
+    lexer_cls = Lexer
+
+    def tokenize(self, source, chunk_size=None, **kw):
+        lexer = self.lexer_cls(**kw)
+        try:
+            if chunk_size is None:
+                lexer.input(source)
+                return dump_tokens(lexer)
+            return dump_tokens(lexer.tokenize_stream(
+                StringIO(source), chunk_size))
+        except ECMASyntaxError as e:
+            return str(e)
+
+    def assertSameTokens(self, source, chunk_sizes=(1, 2, 3, 7), **kw):
+        expected = self.tokenize(source, **kw)
+        for chunk_size in chunk_sizes:
+            self.assertEqual(
+                expected, self.tokenize(source, chunk_size, **kw),
+                'chunk_size=%d for %r' % (chunk_size, source))
+
+    def test_cases(self):
+        for label, (source, answer) in es5_cases:
+            self.assertSameTokens(source)
+
+    def test_all_cases(self):
+        for label, (source, answer) in es5_all_cases + es5_comment_cases:
+            self.assertSameTokens(source, with_comments=True)
+            self.assertSameTokens(source, yield_comments=True)
+
+    def test_pos_cases(self):
+        for label, source, answer in es5_pos_cases:
+            self.assertSameTokens(textwrap.dedent(source).strip())
+
+    def test_error_cases(self):
+        for label, source, answer in (
+                es5_error_cases_str_sq + es5_error_cases_str_dq):
+            self.assertSameTokens(source)
+
+    def test_tokens_across_chunks(self):
+        source = textwrap.dedent("""
+        var a = 1.5e+3 >>>= 0x1F, /* a block comment that spans
+        multiple chunks */ b = a   /re[/]g.source / 2;\r\n
+        x = {get y() { return 1 }, set y(v) {}};  // a line comment
+        s = "a string that spans \\
+        multiple chunks" +                               /regex/;
+        """)
+        self.assertSameTokens(
+            source, chunk_sizes=(1, 2, 4, 16, 64), with_comments=True)
+
+    def test_bounded_window(self):
+        source = 'var a = 1;\n' * 1000
+        lexer = self.lexer_cls()
+        stream = StringIO(source)
+        sizes = [
+            len(lexer.lexer.lexdata)
+            for token in lexer.tokenize_stream(stream, 16)
+        ]
+        self.assertEqual(len(sizes), 5000)
+        self.assertLessEqual(max(sizes), 48)
+        self.assertEqual(lexer.lineno, 1001)
+        self.assertEqual(len(lexer.newline_idx), 1001)
+        # identical to the final position when lexing the entire input.
+        lexpos = lexer.lexpos
+        lexer.input(source)
+        self.assertEqual(len(list(lexer)), 5000)
+        self.assertEqual(lexpos, lexer.lexpos)
+
+    def test_error_position(self):
+        lexer = self.lexer_cls()
+        stream = StringIO('a = 1;\n' * 100 + 'b = "unterminated;\nc;')
+        with self.assertRaises(ECMASyntaxError) as e:
+            list(lexer.tokenize_stream(stream, 8))
+        self.assertEqual(
+            str(e.exception),
+            "Unterminated string literal '\"unterminated;' at 101:5")
+
+    def test_reset_while_suspended(self):
+        lexer = self.lexer_cls()
+        tokens = lexer.tokenize_stream(StringIO('a = 1; b = 2;'), 4)
+        self.assertEqual(next(tokens).value, 'a')
+        lexer.input('c')
+        self.assertIsNone(lexer.stream)
+        self.assertEqual([token.value for token in lexer], ['c'])
+        # closing the stale generator must not affect the current input
+        lexer.input('d')
+        tokens.close()
+        self.assertEqual([token.value for token in lexer], ['d'])
+
+
+class FastLexerTokenizeStreamTestCase(LexerTokenizeStreamTestCase):
+
+    lexer_cls = FastLexer
+
+
+class TokenizeCompactTestCase(unittest.TestCase):
+
+    def assertSameTokens(self, source, **kw):
+        lexer = Lexer(**kw)
+        lexer.input(source)
+        table = tokenize_compact(source, **kw)
+        expected = [(
+            token.type, token.value, token.lineno, token.lexpos, token.colno,
+        ) for token in lexer]
+        self.assertEqual(expected, [(
+            table.type_name(idx), table.value(idx), table.lineno[idx],
+            table.lexpos[idx], table.colno[idx],
+        ) for idx in range(len(table))])
+        self.assertEqual(expected, [(
+            token.type, token.value, token.lineno, token.lexpos, token.colno,
+        ) for token in table])
+
+    def test_cases(self):
+        for label, (source, answer) in es5_cases:
+            self.assertSameTokens(source)
+
+    def test_all_cases(self):
+        for label, (source, answer) in es5_all_cases + es5_comment_cases:
+            self.assertSameTokens(source, yield_comments=True)
+
+    def test_lines(self):
+        self.assertSameTokens(
+            'a = "multi\\\nline" /* and\r\nmore\u2028lines */;\n'
+            'b\u2028c\r\nd\re\u2029\n  f  // comment\nreturn\ng',
+            yield_comments=True)
+
+    def test_generated_tokens(self):
+        table = tokenize_compact('function f() {\n  return\n  1;\n}')
+        idx = table.indexes('AUTOSEMI')
+        self.assertEqual(idx, [6])
+        self.assertEqual(table.value(6), ';')
+        self.assertEqual(table.colno[6], 0)
+        self.assertTrue(isinstance(table[6], AutoLexToken))
+        self.assertEqual(table.value(-1), '}')
+        self.assertEqual(table[-1].lineno, 4)
+
+    def test_indexes(self):
+        table = tokenize_compact('require("a"); require("b"); c;')
+        self.assertEqual(table.indexes('ID'), [0, 5, 10])
+        self.assertEqual(
+            [table.value(idx + 2) for idx in table.indexes('ID')
+             if table.value(idx) == 'require'], ['"a"', '"b"'])
+        self.assertEqual(table.indexes('REGEX'), [])
+        self.assertEqual(table.indexes('NOT_A_TYPE'), [])
+
+    def test_unknown_type(self):
+        table = tokenize_compact('a;', lexer_cls=Lexer)
+        token = AutoLexToken()
+        token.type, token.value, token.lexpos = 'CUSTOM', '', 2
+        table.append(token)
+        self.assertEqual(table.type_name(2), 'CUSTOM')
+        self.assertEqual(table.types[-1], 'CUSTOM')
+        self.assertEqual(len(table), 3)
+
+
+class FastLexerTokenStreamTestCase(unittest.TestCase):
+
+    def assertSameTokens(self, source, **kw):
+        def tokens(lexer_cls):
+            lexer = lexer_cls(**kw)
+            lexer.input(source)
+            return [(
+                token.type, token.value, token.lineno, token.lexpos,
+                token.colno, [
+                    (t.type, t.value, t.lineno, t.lexpos, t.colno)
+                    for t in getattr(token, 'hidden_tokens', [])
+                ],
+            ) for token in lexer]
+
+        self.assertEqual(tokens(Lexer), tokens(FastLexer))
+
+    def test_same_tokens(self):
+        self.assertSameTokens(textwrap.dedent("""
+        var a = 0x1F + 017 + .5e-3 + 1.e2 + 08 + 6_tail, $b_c = a >>>= 2;
+        a >>= b >> c >>> d; a <<= b << c <= d < e; a !== b != !c;
+        a === b == c; a &&= b || c |= d ^= e & f % g %= h *= i;
+        x = {get y() { return 1 }, set y(v) {}, get: 1, set: 2, getter: 3};
+        label: for (var i in o) { i++; --i; i -= 1; i += ~i ? i : i; }
+        s = 'str' + "str\\
+        continued" + /re[/]g.source / 2 / 1;
+        \u0061; caf\u00e9; café = naïve\u2028 + \u00a0 1;\r\nx\ry
+        // line comment\r
+        /* block
+           comment */ return
+        """), with_comments=True)
+
+    def test_fast_path(self):
+        # only the string, regex, comment and the end of input should be
+        # produced by ply.
+        lexer = FastLexer()
+        lexer.input(
+            'var a = {b: [1, 2.5, 0x3]};\nif (a.b >= 1) a.b++\n'
+            'x = "s" + /r/;  // c\n'
+        )
+        calls = []
+        token = lexer.lexer.token
+
+        def ply_token():
+            result = token()
+            calls.append(result and result.type)
+            return result
+
+        lexer.lexer.token = ply_token
+        self.assertEqual(len(list(lexer)), 33)
+        self.assertEqual(calls, ['STRING', 'REGEX', 'LINE_COMMENT', None])
+
+    def test_same_tokens_yield_comments(self):
+        self.assertSameTokens(
+            '// a\nvar a = 1 /* b */ / 2;\n/* c */', yield_comments=True)
+
+
+FastLexerKeywordTestCase = build_equality_testcase(
+    'FastLexerKeywordTestCase', partial(run_lexer, lexer_cls=FastLexer), (
+        (label, data[0], data[1],) for label, data in [(
+            'keywords_all',
+            (' '.join(kw.lower() for kw in Lexer.keywords),
+             ['%s %s' % (kw, kw.lower()) for kw in Lexer.keywords]
+             ),
+        )]
+    )
+)
+
+FastLexerTestCase = build_equality_testcase(
+    'FastLexerTestCase', partial(run_lexer, lexer_cls=FastLexer), (
+        (label, data[0], data[1],) for label, data in es5_cases))
+
+FastLexerAllTestCase = build_equality_testcase(
+    'FastLexerAllTestCase', partial(run_lexer, lexer_cls=partial(
+        FastLexer, yield_comments=True
+    )), ((label, data[0], data[1],) for label, data in es5_all_cases))
+
+FastLexerErrorTestCase = build_exception_testcase(
+    'FastLexerErrorTestCase', partial(
+        run_lexer, lexer_cls=FastLexer), es5_error_cases_str_sq,
+    ECMASyntaxError)
+
+FastLexerErrorStrDQTestCase = build_exception_testcase(
+    'FastLexerErrorStrDQTestCase', partial(
+        run_lexer, lexer_cls=FastLexer), es5_error_cases_str_dq,
+    ECMASyntaxError)
+
+FastLexerPosTestCase = build_equality_testcase(
+    'FastLexerPosTestCase', partial(
+        run_lexer_pos, lexer_cls=FastLexer), es5_pos_cases)
@@ -3,11 +3,21 @@ from __future__ import unicode_literals
 
 import textwrap
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from io import StringIO
+from threading import Barrier
 
 from calmjs.parse import asttypes
+from calmjs.parse.exceptions import ECMASyntaxError
+from calmjs.parse.lexers.es5 import FastLexer
 from calmjs.parse.parsers.es5 import Parser
+from calmjs.parse.parsers.es5 import ParserPool
 from calmjs.parse.parsers.es5 import parse
+from calmjs.parse.parsers.es5 import parser_pool
+from calmjs.parse.parsers.es5 import asttypes as es5_asttypes
+from calmjs.parse.parsers.es5 import lextab
+from calmjs.parse.parsers.es5 import yacctab
 from calmjs.parse.parsers.es5 import read
 from calmjs.parse.unparsers.es5 import pretty_print
 from calmjs.parse.walkers import walk
@@ -22,6 +32,14 @@ from calmjs.parse.tests.parser import (
 )
 
 
+fast_parser_pool = ParserPool(parser_cls=partial(Parser, lexer_cls=FastLexer))
+
+
+def fast_parse(source, with_comments=False):
+    with fast_parser_pool.checkout(with_comments=with_comments) as parser:
+        return parser.parse(source)
+
+
 class ParserTestCase(unittest.TestCase, ParserCaseMixin):
 
     parse = staticmethod(parse)
@@ -57,6 +75,145 @@ class ParserTestCase(unittest.TestCase, ParserCaseMixin):
         self.assertEqual(node.sourcepath, 'somefile.js')
 
 
+class ParserReuseTestCase(unittest.TestCase):
+
+    def test_parser_reuse(self):
+        parser = Parser()
+        first = parser.parse('(function() {\n  return 1;\n})();')
+        second = parser.parse('var a = /x/;\nvar b = 1 / 2;')
+        self.assertEqual(repr(second), repr(Parser().parse(
+            'var a = /x/;\nvar b = 1 / 2;')))
+        self.assertEqual((second.lineno, second.colno), (1, 1))
+        # the trees are independent.
+        self.assertEqual(
+            str(first), '(function() {\n  return 1;\n})();\n')
+
+    def test_parser_reuse_after_error(self):
+        parser = Parser()
+        with self.assertRaises(ECMASyntaxError):
+            parser.parse('(function() {\n  var ;')
+        self.assertEqual(
+            str(parser.parse('var a;')), 'var a;\n')
+
+    def test_reset(self):
+        parser = Parser()
+        parser.parse('var a = 1;\nvar b;')
+        parser.reset()
+        self.assertEqual(list(parser.lexer.newline_idx), [0])
+        self.assertEqual(parser.lexer.lexer.lexdata, '')
+        self.assertEqual(parser.parser.symstack, [])
+        self.assertEqual(parser.parser.statestack, [])
+
+
+class ParserPoolTestCase(unittest.TestCase):
+
+    def test_acquire_release(self):
+        pool = ParserPool()
+        parser = pool.acquire()
+        self.assertTrue(isinstance(parser, Parser))
+        # not released, so a new one will be constructed
+        other = pool.acquire()
+        self.assertIsNot(parser, other)
+        pool.release(parser)
+        pool.release(other)
+        self.assertIs(pool.acquire(), other)
+        self.assertIs(pool.acquire(), parser)
+
+    def test_keyed(self):
+        pool = ParserPool()
+        parser = pool.acquire()
+        pool.release(parser)
+        commented = pool.acquire(with_comments=True)
+        self.assertIsNot(parser, commented)
+        self.assertTrue(commented.lexer.with_comments)
+        pool.release(commented)
+        self.assertIs(pool.acquire(), parser)
+        self.assertIs(pool.acquire(with_comments=True), commented)
+
+    def test_release_resets(self):
+        pool = ParserPool()
+        parser = pool.acquire()
+        parser.parse('var a;\nvar b;')
+        pool.release(parser)
+        self.assertEqual(list(parser.lexer.newline_idx), [0])
+
+    def test_size(self):
+        pool = ParserPool(size=1)
+        first = pool.acquire()
+        second = pool.acquire()
+        pool.release(first)
+        pool.release(second)
+        self.assertEqual(pool.parsers[
+            (False, es5_asttypes, lextab, yacctab)], [first])
+
+    def test_checkout(self):
+        pool = ParserPool()
+        with pool.checkout(with_comments=True) as parser:
+            self.assertTrue(parser.with_comments)
+            self.assertEqual(
+                str(parser.parse('// hi\nvar a;')), '// hi\nvar a;\n')
+        with self.assertRaises(ECMASyntaxError):
+            with pool.checkout(with_comments=True) as again:
+                self.assertIs(parser, again)
+                again.parse('var ;')
+        with pool.checkout(with_comments=True) as again:
+            self.assertIs(parser, again)
+
+    def test_threaded(self):
+        sources = [
+            'var a = 1;\nvar b = a / 2;',
+            '(function() {\n  return /x\\//g.test(y);\n})();',
+            '// comment\nfunction f(x) {\n  return x ? f(x - 1) : 0;\n}',
+            'for (var i in o) {\n  if (i) continue;\n}',
+            'a = b\nc++\nx = {get y() { return 1 }}',
+        ]
+        expected = [
+            repr(Parser(with_comments=True).parse(source))
+            for source in sources
+        ]
+        pool = ParserPool(size=4)
+        workers = 8
+        barrier = Barrier(workers)
+
+        def work(offset):
+            barrier.wait()
+            results = []
+            for n in range(100):
+                idx = (offset + n) % len(sources)
+                with pool.checkout(with_comments=True) as parser:
+                    results.append((idx, repr(parser.parse(sources[idx]))))
+            return results
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(work, i) for i in range(workers)]
+            results = [r for f in futures for r in f.result()]
+
+        self.assertEqual(len(results), 800)
+        for idx, result in results:
+            self.assertEqual(expected[idx], result)
+        self.assertLessEqual(len(pool.parsers[
+            (True, es5_asttypes, lextab, yacctab)]), 4)
+
+    def test_threaded_parse(self):
+        source = 'var x = function(a, b) {\n  return a / b;\n};'
+        expected = repr(Parser().parse(source))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda i: repr(parse(source)), range(200)))
+        self.assertEqual([expected] * 200, results)
+
+    def test_parse_uses_pool(self):
+        parse('var a;')
+        idle = parser_pool.parsers[(False, es5_asttypes, lextab, yacctab)]
+        count = len(idle)
+        self.assertEqual(str(parse('var b;')), 'var b;\n')
+        self.assertEqual(count, len(idle))
+        with self.assertRaises(ECMASyntaxError):
+            parse('var ;')
+        # parser was still returned to the pool
+        self.assertEqual(count, len(idle))
+
+
 ParsedNodeTypeTestCase = build_node_repr_test_cases(
     'ParsedNodeTypeTestCase', parse, 'ES5Program')
 
@@ -72,3 +229,24 @@ ECMARegexSyntaxErrorsTestCase = build_regex_syntax_error_test_cases(
 
 ParsedNodeTypesWithCommentsTestCase = build_comments_test_cases(
     'ParsedNodeTypeWithCommentsTestCase', parse, 'ES5Program')
+
+# the same set of tests, with the parser using the FastLexer.
+FastLexerParserTestCase = type(
+    'FastLexerParserTestCase', (unittest.TestCase, ParserCaseMixin), {
+        'parse': staticmethod(fast_parse)})
+
+FastLexerParsedNodeTypeTestCase = build_node_repr_test_cases(
+    'FastLexerParsedNodeTypeTestCase', fast_parse, 'ES5Program')
+
+FastLexerParserToECMAASITestCase = build_asi_test_cases(
+    'FastLexerParserToECMAASITestCase', fast_parse, pretty_print)
+
+FastLexerECMASyntaxErrorsTestCase = build_syntax_error_test_cases(
+    'FastLexerECMASyntaxErrorsTestCase', fast_parse)
+
+FastLexerECMARegexSyntaxErrorsTestCase = (
+    build_regex_syntax_error_test_cases(
+        'FastLexerECMARegexSyntaxErrorsTestCase', fast_parse))
+
+FastLexerParsedNodeTypesWithCommentsTestCase = build_comments_test_cases(
+    'FastLexerParsedNodeTypesWithCommentsTestCase', fast_parse, 'ES5Program')
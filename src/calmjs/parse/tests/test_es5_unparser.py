@@ -7,6 +7,7 @@ from functools import partial
 
 from calmjs.parse import asttypes
 from calmjs.parse import es5
+from calmjs.parse import rules as es5_rules
 from calmjs.parse.ruletypes import Declare
 from calmjs.parse.ruletypes import Space
 from calmjs.parse.ruletypes import RequiredSpace
@@ -361,6 +362,31 @@ class OtherUsageTestCase(unittest.TestCase):
     of Nodes within the AST.
     """
 
+    def test_prepared_unparsers(self):
+        sources = [
+            'var foo = function(bar) { if (bar) { return bar.baz; } };',
+            '(function(a, b) { var c = a + b; return c; })(1, 2);',
+            'try { x(); } catch (e) { var y = e; }',
+        ]
+        for rules in [
+                (es5_rules.indent(indent_str='\t'),),
+                (es5_rules.minify(), es5_rules.obfuscate(
+                    obfuscate_globals=True)),
+                (indent(), es5_rules.obfuscate(), es5_rules.indent()),
+                ]:
+            unparser = Unparser(rules=rules)
+            expected = [
+                ''.join(c.text for c in unparser(parse(source)))
+                for source in sources
+            ]
+            unparser.prepare()
+            # repeated, such that the state from the previous calls
+            # must be reset for the results to match.
+            self.assertEqual(expected * 2, [
+                ''.join(c.text for c in unparser(parse(source)))
+                for source in sources * 2
+            ])
+
     def test_manual_element(self):
         # a form of possible manual replacement call.
         ast = asttypes.ES5Program(children=[
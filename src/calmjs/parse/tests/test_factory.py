@@ -1,9 +1,18 @@
 # -*- coding: utf-8 -*-
+import os
+import pickle
+import sys
+from subprocess import check_output
 import unittest
 
 from calmjs.parse import asttypes
 from calmjs.parse.factory import SRFactory
 from calmjs.parse.factory import AstTypesFactory
+from calmjs.parse.factory import resolve
+from calmjs.parse.factory import ParserUnparserFactory
+from calmjs.parse.factory import RawParserUnparserFactory
+from calmjs.parse.cache import CacheStats
+from calmjs.parse.parsers import es5 as es5parser
 
 
 class SRFactoryTestCase(unittest.TestCase):
@@ -58,6 +67,33 @@ class SRFactoryTestCase(unittest.TestCase):
         self.assertEqual(str(custom_node), 'This is a Node')
         self.assertTrue(repr(custom_node).startswith('Node has id'))
 
+    def test_unnamed_not_picklable(self):
+        custom_asttypes = AstTypesFactory(str, repr)
+        with self.assertRaises(TypeError):
+            pickle.dumps(custom_asttypes)
+        with self.assertRaises(pickle.PicklingError):
+            pickle.dumps(custom_asttypes.Node())
+
+    def test_named_picklable(self):
+        factory = es5parser.asttypes
+        self.assertIs(resolve(factory.name), factory)
+        self.assertEqual(
+            factory.ES5Program.__module__, 'calmjs.parse.parsers.es5')
+        self.assertEqual(
+            factory.ES5Program.__qualname__, 'asttypes.ES5Program')
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            self.assertIs(pickle.loads(pickle.dumps(
+                factory, protocol)), factory)
+            self.assertIs(pickle.loads(pickle.dumps(
+                factory.Identifier, protocol)), factory.Identifier)
+
+        tree = es5parser.parse('var a = function(b) { return b / 2; };')
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            result = pickle.loads(pickle.dumps(tree, protocol))
+            self.assertIs(type(result), factory.ES5Program)
+            self.assertEqual(repr(result), repr(tree))
+            self.assertEqual(str(result), str(tree))
+
 
 class ParserUnparserFactoryTestCase(unittest.TestCase):
 
@@ -71,3 +107,89 @@ class ParserUnparserFactoryTestCase(unittest.TestCase):
         self.assertEqual(es5.pretty_print(src).strip(), src)
         self.assertEqual(es5.minify_print(src), src)
         self.assertEqual(es5.minify_print(src, True, True), src)
+
+    def test_cache(self):
+        calls = []
+
+        def parse(source, with_comments=False):
+            calls.append((source, with_comments))
+            return es5parser.parse(source, with_comments=with_comments)
+
+        def first(node):
+            return node
+
+        def second(node, value=None):
+            return node, value
+
+        obj = RawParserUnparserFactory(
+            'test', parse, first, second, cache_size=2)
+        src = u'var a;'
+        node = obj.first(src)
+        self.assertEqual(obj.second(src, value=1), (node, 1))
+        self.assertEqual(1, len(calls))
+        # the parser itself always produces a new tree.
+        self.assertIsNot(obj(src), node)
+        self.assertEqual(2, len(calls))
+        self.assertIsNot(obj.first(src, with_comments=True), node)
+        self.assertEqual([
+            (src, False), (src, False), (src, True)], calls)
+        obj.first(u'var b;')
+        self.assertEqual(obj.cache.stats(), CacheStats(
+            hits=1, misses=3, evictions=1, entries=2, bytes=12))
+        obj.cache.clear()
+        self.assertEqual(obj.cache.stats(), CacheStats(0, 0, 0, 0, 0))
+
+    def test_no_cache(self):
+        from calmjs.parse import es5
+        self.assertIsNone(es5.cache)
+        obj = ParserUnparserFactory('es5', 'minify_print', cache_size=4)
+        self.assertEqual(obj.cache.size, 4)
+        src = u'var a = 1;'
+        self.assertEqual(obj.minify_print(src), obj.minify_print(src))
+        self.assertEqual(obj.cache.stats().hits, 1)
+
+
+class LazyParserUnparserTestCase(unittest.TestCase):
+
+    def run_python(self, code):
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            [p for p in sys.path if p] + [env.get('PYTHONPATH', '')])
+        return check_output(
+            [sys.executable, '-c', code], env=env).decode('utf8').strip()
+
+    def test_import_cold_start(self):
+        # the import of the package, along with the modules that do not
+        # require the parser, must not pull in ply or any of the parser
+        # and unparser modules.
+        result = self.run_python(
+            'import sys\n'
+            'import calmjs.parse\n'
+            'import calmjs.parse.sourcemap, calmjs.parse.vlq\n'
+            'print(sorted(name for name in sys.modules if name in (\n'
+            '    "ply", "calmjs.parse.factory", "calmjs.parse.asttypes",\n'
+            ') or name.startswith((\n'
+            '    "ply.", "calmjs.parse.parsers", "calmjs.parse.unparsers",\n'
+            '))))\n'
+        )
+        self.assertEqual(result, '[]')
+
+    def test_resolve_on_access(self):
+        result = self.run_python(
+            'import sys\n'
+            'from calmjs.parse import es5\n'
+            'print("calmjs.parse.parsers.es5" in sys.modules)\n'
+            'print(es5.minify_print("var a = 1;"))\n'
+            'print("calmjs.parse.parsers.es5" in sys.modules)\n'
+        )
+        self.assertEqual(result.splitlines(), ['False', 'var a=1;', 'True'])
+
+    def test_proxy(self):
+        from calmjs.parse import es5
+        self.assertTrue(isinstance(es5(u'var a;'), asttypes.Node))
+        self.assertEqual(es5.pretty_print, es5._resolve().pretty_print)
+        self.assertIn('minify_print', dir(es5))
+        with self.assertRaises(AttributeError):
+            es5.no_such_unparser
+        with self.assertRaises(AttributeError):
+            es5.__wrapped__
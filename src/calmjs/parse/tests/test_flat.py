@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+import pickle
+import textwrap
+import unittest
+
+from calmjs.parse.asttypes import pack_pos
+from calmjs.parse.flat import FlatNode
+from calmjs.parse.flat import flatten
+from calmjs.parse.parsers.es5 import asttypes
+from calmjs.parse.parsers.es5 import parse
+from calmjs.parse.unparsers.es5 import pretty_print
+from calmjs.parse.walkers import Walker
+from calmjs.parse.walkers import walk
+
+source = textwrap.dedent("""
+var x = [1, , 'two'];
+// comment
+function f(a, b) {
+    return a.b + b[0];
+}
+""").lstrip()
+
+
+def positions(node):
+    return [
+        (type(n), n.lexpos, n.lineno, n.colno,
+            getattr(n, '_token_map', ()))
+        for n in [node] + list(walk(node))
+    ]
+
+
+class FlatTreeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.program = parse(source, with_comments=True)
+        self.tree = flatten(self.program)
+
+    def test_structure(self):
+        nodes = [self.program] + list(walk(self.program))
+        # the comments are only referenced by the attributes, which are
+        # placed after the nodes of the tree.
+        self.assertEqual(
+            [self.tree.node_type(idx) for idx in range(len(nodes))],
+            [type(node) for node in nodes],
+        )
+        self.assertEqual([
+            self.tree.node_type(idx).__name__
+            for idx in range(len(nodes), len(self.tree))
+        ], ['Comments', 'LineComment'])
+        self.assertEqual(self.tree.parent[len(nodes)], -1)
+        self.assertEqual(
+            self.tree.parent[len(nodes) + 1], len(nodes))
+        self.assertEqual(self.tree.parent[0], -1)
+        self.assertEqual(
+            [self.tree.node_type(idx) for idx in self.tree.children(0)],
+            [asttypes.VarStatement, asttypes.FuncDecl],
+        )
+        for idx in self.tree.children(0):
+            self.assertEqual(self.tree.parent[idx], 0)
+
+    def test_walk(self):
+        self.assertEqual(
+            [self.tree.node_type(idx) for idx in self.tree.walk()],
+            [type(node) for node in walk(self.program)],
+        )
+        idx = self.tree.children(0)[1]
+        self.assertEqual(
+            [self.tree.node_type(i) for i in self.tree.walk(idx)],
+            [type(node) for node in walk(self.program.children()[1])],
+        )
+        self.assertEqual(list(flatten(asttypes.Null('null')).walk()), [])
+
+    def test_positions(self):
+        self.assertIsNotNone(self.tree.lines)
+        self.assertIsNone(self.tree.lineno)
+        for idx, node in enumerate([self.program] + list(walk(self.program))):
+            self.assertEqual(
+                self.tree.position(idx),
+                (node.lexpos, node.lineno, node.colno),
+            )
+
+    def test_getpos(self):
+        func = self.program.children()[1]
+        view = self.tree.node(self.tree.children(0)[1])
+        self.assertEqual(
+            view.getpos('function', 0), func.getpos('function', 0))
+        self.assertEqual(view.getpos('{', 0), (50, 3, 18))
+        self.assertEqual(view.getpos('{', 1), (0, 0, 0))
+        self.assertEqual(self.tree.getpos(0, '{', 0), (0, 0, 0))
+
+    def test_to_node(self):
+        node = self.tree.to_node()
+        self.assertIsNot(node, self.program)
+        self.assertEqual(pretty_print(node), pretty_print(self.program))
+        self.assertEqual(positions(node), positions(self.program))
+        var = self.tree.node(self.tree.children(0)[0]).to_node()
+        self.assertEqual(
+            pretty_print(var), pretty_print(self.program.children()[0]))
+
+    def test_inconsistent_positions(self):
+        program = parse(source)
+        name = program.children()[1].identifier
+        name.colno = 1
+        name._token_map = ('f', pack_pos(name.lexpos, 7, 1))
+        tree = flatten(program)
+        self.assertIsNone(tree.lines)
+        self.assertEqual(positions(tree.to_node()), positions(program))
+
+    def test_partial_positions(self):
+        node = asttypes.Identifier('a')
+        node.lineno = 2
+        tree = flatten(node)
+        self.assertIsNone(tree.lines)
+        self.assertEqual(tree.position(0), (None, 2, None))
+        self.assertEqual(positions(tree.to_node()), positions(node))
+
+    def test_shared_node(self):
+        node = asttypes.Identifier('a')
+        with self.assertRaises(ValueError):
+            flatten(asttypes.BinOp('+', node, node))
+
+    def test_pickle(self):
+        tree = pickle.loads(pickle.dumps(self.tree, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(tree.fields, self.tree.fields)
+        self.assertEqual(tree.lines, self.tree.lines)
+        self.assertEqual(positions(tree.to_node()), positions(self.program))
+
+        program = parse(source)
+        program.children()[0].colno = 99
+        tree = pickle.loads(pickle.dumps(flatten(program)))
+        self.assertIsNone(tree.lines)
+        self.assertEqual(positions(tree.to_node()), positions(program))
+
+
+class FlatNodeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = flatten(parse(source))
+        self.root = self.tree.node()
+
+    def test_attributes(self):
+        var, func = self.root
+        self.assertIs(var.node_type, asttypes.VarStatement)
+        self.assertIsNone(self.root.parent)
+        self.assertEqual(var.parent, self.root)
+        self.assertNotEqual(var, func)
+        self.assertEqual(len({var, func, self.tree.node(1)}), 2)
+        self.assertEqual(func.identifier.value, 'f')
+        self.assertEqual(
+            [param.value for param in func.parameters], ['a', 'b'])
+        self.assertEqual((func.lexpos, func.lineno, func.colno), (33, 3, 1))
+        self.assertEqual(repr(func), '<FlatNode FuncDecl #8>')
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            self.root.no_such_attribute
+        # the token map is only available through getpos
+        with self.assertRaises(AttributeError):
+            self.root._token_map
+
+    def test_walker(self):
+        walker = Walker()
+        names = walker.filter(
+            self.root, lambda node: node.node_type is asttypes.Identifier)
+        self.assertTrue(all(isinstance(node, FlatNode) for node in names))
+        self.assertEqual(
+            [node.value for node in walker.filter(
+                self.root,
+                lambda node: node.node_type is asttypes.Identifier)],
+            ['x', 'f', 'a', 'b', 'a', 'b'],
+        )
+        self.assertEqual(
+            len(list(walker.walk(self.root))), len(self.tree) - 1)
+        self.assertEqual(walker.extract(
+            self.root, lambda node: node.node_type is asttypes.Number,
+            skip=1).value, '0')
@@ -12,6 +12,7 @@ from types import ModuleType
 from ply import lex
 from calmjs.parse.parsers import optimize
 from calmjs.parse.parsers import es5
+from calmjs.parse.parsers.tables import CompactTable
 from calmjs.parse.utils import ply_dist
 
 
@@ -20,8 +21,13 @@ class OptimizeTestCase(unittest.TestCase):
     def setUp(self):
         self.purged = []
         optimize.unlink = self.purged.append
+        # ensure the tab modules are used, in case the artifact exists.
+        self.artifacts = dict(optimize._artifacts)
+        optimize._artifacts[(es5.lextab, es5.yacctab)] = None
 
     def tearDown(self):
+        optimize._artifacts.clear()
+        optimize._artifacts.update(self.artifacts)
         optimize.unlink = os.unlink
         optimize.import_module = importlib.import_module
         optimize.ply_dist = ply_dist
@@ -118,6 +124,32 @@ class OptimizeTestCase(unittest.TestCase):
         self.assertIsNot(lex.open, open)
         self.assertNotEqual(len(self.purged), 0)
 
+    def test_reoptimize_artifacts(self):
+        tempdir = mkdtemp()
+        self.addCleanup(rmtree, tempdir)
+        path = os.path.join(tempdir, 'tabs.pickle')
+        with open(path, 'wb') as fd:
+            fd.write(b'stale')
+        optimize.generate_artifact_path = lambda lextab: path
+        self.addCleanup(
+            setattr, optimize, 'generate_artifact_path',
+            ArtifactTestCase.generate_artifact_path)
+        tab_paths, _ = optimize.find_tab_paths(es5)
+        mtimes = [os.path.getmtime(tab_path) for tab_path in tab_paths]
+        optimize.reoptimize_all(artifacts=True)
+        # the tab modules and the stale artifact were recorded as purged,
+        # but the tab modules were not actually removed or regenerated.
+        self.assertEqual(
+            list(optimize.verify_paths(tab_paths)) + [path], self.purged)
+        self.assertEqual(
+            mtimes, [os.path.getmtime(tab_path) for tab_path in tab_paths])
+        # the artifact was written to the temporary directory.
+        self.assertEqual(os.listdir(tempdir), ['tabs.pickle'])
+        lextab, yacctab = optimize.load_artifact(es5.lextab, es5.yacctab)
+        self.assertEqual(lextab.__file__, path)
+        self.assertEqual(lextab.__name__, es5.lextab)
+        self.assertEqual(yacctab.__name__, es5.yacctab)
+
     def test_optimize_build(self):
         called = []
 
@@ -279,3 +311,96 @@ class OptimizeTestCase(unittest.TestCase):
             "WARNING: cannot find distribution for 'ply'; "
             ))
         self.assertNotIn('ERROR', sys.stderr.getvalue())
+
+
+class ArtifactTestCase(unittest.TestCase):
+
+    generate_artifact_path = staticmethod(optimize.generate_artifact_path)
+
+    def setUp(self):
+        self.tempdir = mkdtemp()
+        self.addCleanup(rmtree, self.tempdir)
+        self.path = os.path.join(self.tempdir, 'tabs_es5.pickle')
+        artifacts = dict(optimize._artifacts)
+
+        def cleanup():
+            optimize.generate_artifact_path = self.generate_artifact_path
+            optimize._artifacts.clear()
+            optimize._artifacts.update(artifacts)
+
+        self.addCleanup(cleanup)
+        optimize._artifacts.clear()
+        optimize.generate_artifact_path = lambda lextab: self.path
+
+    def test_generate_artifact_path(self):
+        self.assertEqual(
+            self.generate_artifact_path(es5.lextab),
+            os.path.join(
+                os.path.dirname(es5.__file__),
+                'tabs' + es5.lextab.rsplit('.lextab', 1)[1] + '.pickle',
+            )
+        )
+        with self.assertRaises(ValueError):
+            self.generate_artifact_path(es5.yacctab)
+
+    def test_not_available(self):
+        self.assertIsNone(optimize.load_artifact(es5.lextab, es5.yacctab))
+        self.assertIsNone(optimize.load_artifact(ModuleType('lextab'), 'a'))
+        optimize.generate_artifact_path = self.generate_artifact_path
+        self.assertIsNone(optimize.load_artifact('lextab', 'yacctab'))
+        self.assertIsNone(optimize.load_artifact(
+            'calmjs.parse.parsers.no_lextab', 'yacctab'))
+
+    def test_build_load(self):
+        self.assertEqual(optimize.build_artifact(es5), self.path)
+        tabs = optimize.load_artifact(es5.lextab, es5.yacctab)
+        self.assertIs(tabs, optimize.load_artifact(es5.lextab, es5.yacctab))
+        lextab, yacctab = tabs
+        self.assertEqual(lextab.__name__, es5.lextab)
+        self.assertEqual(yacctab.__name__, es5.yacctab)
+        self.assertEqual(yacctab.__file__, self.path)
+        real_lextab = importlib.import_module(es5.lextab)
+        real_yacctab = importlib.import_module(es5.yacctab)
+        self.assertEqual(lextab._lexstatere, real_lextab._lexstatere)
+        self.assertEqual(yacctab._lr_action, real_yacctab._lr_action)
+        self.assertEqual(yacctab._lr_signature, real_yacctab._lr_signature)
+
+        parser = es5.Parser()
+        self.assertIs(parser.parser.action, yacctab._lr_action)
+        self.assertEqual(parser.lextab, es5.lextab)
+        self.assertEqual(
+            str(parser.parse(u'var a = /x/g;')), 'var a = /x/g;\n')
+        # not used when not optimized.
+        parser = es5.Parser(lex_optimize=False)
+        self.assertIsNot(parser.parser.action, yacctab._lr_action)
+
+    def test_build_load_compact(self):
+        optimize.build_artifact(es5, compact=True)
+        lextab, yacctab = optimize.load_artifact(es5.lextab, es5.yacctab)
+        self.assertTrue(isinstance(yacctab._lr_action, CompactTable))
+        self.assertTrue(isinstance(yacctab._lr_goto, CompactTable))
+        parser = es5.Parser()
+        self.assertIs(parser.parser.action, yacctab._lr_action)
+        self.assertEqual(
+            str(parser.parse(u'var a = /x/g;')), 'var a = /x/g;\n')
+
+    def test_stale(self):
+        optimize.build_artifact(es5)
+        optimize._artifacts.clear()
+        mtime = os.path.getmtime(self.path) + 10
+        tab_path = os.path.join(
+            self.tempdir, es5.yacctab.rsplit('.', 1)[1] + '.py')
+        with open(tab_path, 'w'):
+            pass
+        os.utime(tab_path, (mtime, mtime))
+        self.assertIsNone(optimize.load_artifact(es5.lextab, es5.yacctab))
+
+    def test_mismatch(self):
+        optimize.build_artifact(es5)
+        optimize._artifacts.clear()
+        self.assertIsNone(optimize.load_artifact(es5.lextab, 'yacctab'))
+
+    def test_corrupted(self):
+        with open(self.path, 'wb') as fd:
+            fd.write(b'not a pickle')
+        self.assertIsNone(optimize.load_artifact(es5.lextab, es5.yacctab))
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+import pickle
+import unittest
+
+from calmjs.parse.parsers import es5
+from calmjs.parse.parsers.tables import CompactRow
+from calmjs.parse.parsers.tables import CompactTable
+from calmjs.parse.parsers.tables import compact_tables
+from calmjs.parse.parsers.tables import _array
+
+
+class CompactTableTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.table = {
+            0: {'A': 1, 'B': -2},
+            1: {'B': 3, 'C': 0},
+            3: {'A': 1, 'B': -2},
+            4: {'D': 70000},
+        }
+
+    def test_array(self):
+        self.assertEqual(_array([]).typecode, 'b')
+        self.assertEqual(_array([-128, 127]).typecode, 'b')
+        self.assertEqual(_array([-129, 127]).typecode, 'h')
+        self.assertEqual(_array([0, 32768]).typecode, 'i')
+        self.assertEqual(list(_array([0, 32768])), [0, 32768])
+
+    def test_build(self):
+        compact = CompactTable.build(self.table)
+        self.assertEqual(len(compact), 5)
+        self.assertEqual(compact.symbols, ('A', 'B', 'C', 'D'))
+        for state, row in self.table.items():
+            self.assertTrue(isinstance(compact[state], CompactRow))
+            self.assertEqual(dict(compact[state]), row)
+            self.assertEqual(compact[state], row)
+            self.assertEqual(len(compact[state]), len(row))
+        # identical rows are shared.
+        self.assertIs(compact[0], compact[3])
+        # omitted states are empty.
+        self.assertEqual(dict(compact[2]), {})
+        self.assertEqual(
+            [(state, dict(row)) for state, row in compact.items()], [
+                (0, {'A': 1, 'B': -2}),
+                (1, {'B': 3, 'C': 0}),
+                (2, {}),
+                (3, {'A': 1, 'B': -2}),
+                (4, {'D': 70000}),
+            ])
+
+    def test_build_size(self):
+        self.assertEqual(len(CompactTable.build(self.table, 7)), 7)
+        self.assertEqual(len(CompactTable.build({})), 0)
+
+    def test_row_lookups(self):
+        row = CompactTable.build(self.table)[1]
+        self.assertEqual(row.get('B'), 3)
+        self.assertEqual(row.get('C'), 0)
+        self.assertIsNone(row.get('A'))
+        self.assertIsNone(row.get('Z'))
+        self.assertEqual(row.get('A', 'default'), 'default')
+        self.assertEqual(row['B'], 3)
+        self.assertIn('C', row)
+        self.assertNotIn('D', row)
+        with self.assertRaises(KeyError):
+            row['A']
+        with self.assertRaises(KeyError):
+            row['Z']
+        self.assertEqual(sorted(row.values()), [0, 3])
+        self.assertEqual(repr(row), "<CompactRow {'B': 3, 'C': 0}>")
+
+    def test_pickle(self):
+        compact = CompactTable.build(self.table)
+        result = pickle.loads(pickle.dumps(compact))
+        self.assertEqual(
+            [dict(row) for row in result], [dict(row) for row in compact])
+        self.assertIs(result[0], result[3])
+
+
+class CompactParserTablesTestCase(unittest.TestCase):
+
+    def test_es5(self):
+        parser = es5.Parser()
+        action, goto = parser.parser.action, parser.parser.goto
+        compact_action, compact_goto = compact_tables(action, goto)
+        self.assertEqual(len(compact_action), len(action))
+        self.assertEqual(len(compact_goto), len(action))
+        for state in range(len(action)):
+            self.assertEqual(compact_action[state], action[state])
+            self.assertEqual(compact_goto[state], goto.get(state, {}))
+
+        compact = es5.Parser()
+        compact.parser.action, compact.parser.goto = (
+            compact_action, compact_goto)
+        defaulted_states = compact.parser.defaulted_states
+        compact.parser.set_defaulted_states()
+        self.assertEqual(defaulted_states, compact.parser.defaulted_states)
+
+        source = (
+            'var a = function(x) {\n'
+            '  for (var i = 0; i < x.length; i++) {\n'
+            '    x[i] = {a: i ? /x/g : void 0};\n'
+            '  }\n'
+            '  return x\n'
+            '}\n'
+        )
+        self.assertEqual(
+            repr(parser.parse(source)), repr(compact.parse(source)))
+        with self.assertRaises(es5.ECMASyntaxError) as e:
+            compact.parse('var a = {;')
+        self.assertIn("Unexpected ';'", str(e.exception))
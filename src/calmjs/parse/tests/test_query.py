@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import textwrap
+import unittest
+
+from calmjs.parse import es5
+from calmjs.parse.query import Selector
+from calmjs.parse.query import select
+from calmjs.parse.walkers import Walker
+
+source = textwrap.dedent("""
+var fs = require('fs'), path = require("path");
+var a = function(b) {
+  return fs.readFileSync(path.join(b, 'c'));
+};
+exports.a = a;
+""")
+
+
+def values(nodes):
+    return [getattr(node, 'value', None) for node in nodes]
+
+
+class SelectorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = es5(source)
+
+    def test_type(self):
+        self.assertEqual(
+            Selector('FunctionCall').select(self.tree),
+            list(Walker().filter(self.tree, lambda node: (
+                type(node).__name__ == 'FunctionCall'))),
+        )
+        # base classes are matched too.
+        self.assertEqual(
+            [type(node).__name__ for node in Selector('FuncBase').select(
+                self.tree)], ['FuncExpr'])
+        self.assertEqual(
+            len(Selector('*').select(self.tree)),
+            len(list(Walker().walk(self.tree))) + 1,
+        )
+        self.assertEqual(Selector('NoSuchType').select(self.tree), [])
+
+    def test_attributes(self):
+        self.assertEqual(values(Selector(
+            "FunctionCall[identifier=Identifier[value=require]] "
+            "> Arguments > String"
+        ).select(self.tree)), ["'fs'", '"path"'])
+        self.assertEqual(values(Selector(
+            "String[value=\"'fs'\"]").select(self.tree)), ["'fs'"])
+        self.assertEqual(values(Selector(
+            "String[value='\"path\"']").select(self.tree)), ['"path"'])
+        self.assertEqual(values(Selector(
+            "Identifier[value='b']").select(self.tree)), ['b', 'b'])
+        # bare words are also node types when the attribute is a node
+        self.assertEqual(len(Selector(
+            "FunctionCall[identifier=DotAccessor]").select(self.tree)), 2)
+        # or a list of nodes
+        self.assertEqual(len(Selector(
+            "FuncExpr[parameters=Identifier[value=b]]").select(self.tree)), 1)
+        self.assertEqual(len(Selector(
+            "FuncExpr[parameters=Identifier[value=c]]").select(self.tree)), 0)
+        self.assertEqual(len(Selector(
+            "FuncExpr[identifier]").select(self.tree)), 0)
+        self.assertEqual(len(Selector(
+            "FuncExpr[parameters]").select(self.tree)), 1)
+        self.assertEqual(len(Selector(
+            "[initializer][identifier=Identifier[value=a]]").select(
+                self.tree)), 1)
+
+    def test_combinators(self):
+        # PropIdentifier is a subclass of Identifier
+        self.assertEqual(values(Selector(
+            'FuncExpr Identifier').select(self.tree)), [
+                'b', 'fs', 'readFileSync', 'path', 'join', 'b'])
+        self.assertEqual(values(Selector(
+            'FuncExpr > Identifier').select(self.tree)), ['b'])
+        self.assertEqual(values(Selector(
+            'FuncExpr   >Return  FunctionCall > Arguments > *'
+        ).select(self.tree)), [None, 'b', "'c'"])
+        self.assertEqual(values(Selector(
+            'VarDecl[identifier=Identifier[value=a]] DotAccessor > '
+            'PropIdentifier'
+        ).select(self.tree)), ['readFileSync', 'join'])
+        self.assertEqual(Selector('Return > Identifier').select(self.tree), [])
+
+    def test_match(self):
+        selector = Selector('Arguments > String')
+        self.assertFalse(selector.match(es5("'a';").children()[0].expr))
+        call = es5("f('a');").children()[0].expr
+        self.assertTrue(selector.match(call.args.items[0], [call.args]))
+
+    def test_errors(self):
+        for text in (
+                '', '>', 'A >', 'A[', 'A[]', 'A[b', 'A[b=]', 'A[*]',
+                'A[b="c]', 'A]', 'A B[c=D[e=f]'):
+            with self.assertRaises(ValueError):
+                Selector(text)
+
+        with self.assertRaises(ValueError) as e:
+            Selector('A>[b')
+        self.assertIn('position 4', str(e.exception))
+
+    def test_repr(self):
+        self.assertEqual(repr(Selector('A > B')), "<Selector 'A > B'>")
+
+
+class SelectTestCase(unittest.TestCase):
+
+    def test_not_node(self):
+        with self.assertRaises(TypeError):
+            select('not_a_node', 'Node')
+
+    def test_multiple(self):
+        tree = es5(source)
+        strings, calls, everything, requires = select(
+            tree, 'String', Selector('FunctionCall'), '*',
+            'FunctionCall[identifier=Identifier[value=require]]')
+        self.assertEqual(values(strings), ["'fs'", '"path"', "'c'"])
+        self.assertEqual(len(calls), 4)
+        self.assertIs(everything[0], tree)
+        self.assertEqual(requires, calls[:2])
+        self.assertEqual(select(tree), [])
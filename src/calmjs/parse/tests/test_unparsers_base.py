@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 import unittest
 
 from calmjs.parse.asttypes import Node
+from calmjs.parse.ruletypes import Text
 from calmjs.parse.unparsers.base import logger
 from calmjs.parse.unparsers.base import BaseUnparser
 from calmjs.parse.unparsers.walker import Dispatcher
@@ -26,6 +27,26 @@ class BaseUnparserTestCase(unittest.TestCase):
         unparser = BaseUnparser(definitions)
         self.assertEqual([], list(unparser(Node())))
 
+    def test_render(self):
+        definitions = {'Node': (Text(value='node'),)}
+        unparser = BaseUnparser(definitions)
+        self.assertEqual('node', unparser.render(Node()))
+        parts = []
+        self.assertIsNone(unparser.render(Node(), parts.append))
+        self.assertEqual(['node'], parts)
+
+    def test_render_token_handler(self):
+        def token_handler(token, dispatcher, node, subnode, *a):
+            for chunk in token_handler_str_default(
+                    token, dispatcher, node, subnode, *a):
+                yield chunk._replace(text=chunk.text.upper())
+
+        definitions = {'Node': (Text(value='node'),)}
+        unparser = BaseUnparser(definitions, token_handler=token_handler)
+        # the token handler is not one that render_text can replace.
+        self.assertEqual('NODE', unparser.render(Node()))
+        self.assertEqual('NODE', ''.join(c.text for c in unparser(Node())))
+
     def test_prewalk_hooking(self):
         results = {}
 
@@ -77,6 +98,62 @@ class BaseUnparserTestCase(unittest.TestCase):
         self.assertEqual([], list(unparser(root)))
         self.assertEqual(len(prewalk), 2)
 
+    def test_prepare(self):
+        setups = []
+        resets = []
+        dispatchers = []
+
+        def prewalk(dispatcher, node):
+            dispatchers.append(dispatcher)
+            return node
+
+        def rule():
+            setups.append(True)
+            return {
+                'prewalk_hooks': (prewalk,),
+                'reset_hooks': (lambda: resets.append(True),),
+            }
+
+        root = Node()
+        unparser = BaseUnparser({'Node': ()}, rules=(rule,))
+        self.assertIsNone(unparser.prepared)
+        # the reset hooks are only used for the prepared calls.
+        self.assertEqual([], list(unparser(root)))
+        self.assertEqual((len(setups), len(resets)), (1, 0))
+
+        unparser.prepare()
+        self.assertEqual((len(setups), len(resets)), (2, 0))
+        self.assertEqual([], list(unparser(root)))
+        self.assertEqual([], list(unparser(root)))
+        self.assertEqual((len(setups), len(resets)), (2, 2))
+        self.assertIsNot(dispatchers[0], dispatchers[1])
+        self.assertIs(dispatchers[1], dispatchers[2])
+        self.assertIs(dispatchers[1], unparser.prepared[0])
+
+    def test_setup_overridden(self):
+        setups = []
+
+        def prewalk(dispatcher, node):
+            setups.append(dispatcher)
+            return node
+
+        class Unparser(BaseUnparser):
+            def setup(self):
+                (token_handler, layout_handlers, deferrable_handlers,
+                    prewalk_hooks) = super(Unparser, self).setup()
+                return (token_handler, layout_handlers, deferrable_handlers,
+                        prewalk_hooks + [prewalk])
+
+        root = Node()
+        unparser = Unparser({'Node': ()})
+        self.assertEqual([], list(unparser(root)))
+        self.assertEqual(1, len(setups))
+        unparser.prepare()
+        self.assertEqual([], list(unparser(root)))
+        self.assertEqual([], list(unparser(root)))
+        self.assertEqual(3, len(setups))
+        self.assertIs(setups[1], setups[2])
+
     def test_token_handler_default(self):
         stream = setup_logger(self, logger)
         definitions = {}
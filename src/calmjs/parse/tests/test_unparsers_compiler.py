@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import unittest
+from io import StringIO
+
+from calmjs.parse import rules
+from calmjs.parse.asttypes import Node
+from calmjs.parse.parsers.es5 import parse as es5
+from calmjs.parse.ruletypes import (
+    Token,
+    Attr,
+    JoinAttr,
+    Optional,
+    Text,
+    Space,
+    Newline,
+    Iter,
+)
+from calmjs.parse.unparsers.compiler import CACHE_SIZE
+from calmjs.parse.unparsers.compiler import EmitterCompiler
+from calmjs.parse.unparsers.compiler import _compiled
+from calmjs.parse.unparsers.compiler import _referenced
+from calmjs.parse.unparsers.compiler import compiled_walk
+from calmjs.parse.unparsers.compiler import get_emitters
+from calmjs.parse.unparsers.compiler import render_text
+from calmjs.parse.unparsers.es5 import Unparser
+from calmjs.parse.unparsers.extractor import Unparser as ExtractorUnparser
+from calmjs.parse.unparsers.walker import Dispatcher
+from calmjs.parse.unparsers.walker import walk
+
+from calmjs.parse.tests.test_unparsers_walker import SimpleChunk
+from calmjs.parse.tests.test_unparsers_walker import WalkCaseMixin
+from calmjs.parse.tests.test_unparsers_walker import setup_handlers
+
+
+class Block(Node):
+    pass
+
+
+class Upper(Token):
+    # a custom token, which must be invoked by the compiled code.
+    def __call__(self, walk, dispatcher, node):
+        for chunk in walk(dispatcher, getattr(node, self.attr).upper(),
+                          token=self):
+            yield chunk
+
+
+class CompiledWalkTestCase(unittest.TestCase, WalkCaseMixin):
+
+    walk = staticmethod(compiled_walk)
+
+    def test_extractor(self):
+        # the extractor make use of a custom set of tokens.
+        tree = es5('var a = {b: [1, 2], c: "d"}; var e = f;')
+        unparser = ExtractorUnparser()
+        result = dict(unparser(tree))
+        unparser.walk = compiled_walk
+        self.assertEqual(result, dict(unparser(tree)))
+
+    def test_cached(self):
+        dispatcher = Dispatcher({}, *setup_handlers(self)[:3])
+        self.assertIs(get_emitters(dispatcher), get_emitters(dispatcher))
+        dispatchers = []
+
+        def dispatch(unparser):
+            unparser.prewalk_hooks = [
+                lambda dispatcher, node: dispatchers.append(dispatcher) or node
+            ]
+            list(unparser(es5('a;')))
+            return dispatchers[-1]
+
+        default = dispatch(Unparser(walk=compiled_walk))
+        again = dispatch(Unparser(walk=compiled_walk))
+        self.assertIsNot(default, again)
+        self.assertIs(get_emitters(default), get_emitters(again))
+        # the layouts with handlers are part of the key.
+        minify = dispatch(
+            Unparser(rules=(rules.minify(),), walk=compiled_walk))
+        self.assertIsNot(get_emitters(default), get_emitters(minify))
+
+    def test_cache_bounded(self):
+        token_handler, layout_handlers, deferrable_handlers, declared_vars = (
+            setup_handlers(self))
+        # the definitions constructed for every call, as lists.
+        results = [get_emitters(Dispatcher(
+            {'Node': [Text(value='n')]}, token_handler, layout_handlers,
+            deferrable_handlers,
+        )) for _ in range(CACHE_SIZE + 1)]
+        self.assertEqual(len(_compiled), CACHE_SIZE)
+        self.assertEqual(len(_referenced), CACHE_SIZE)
+        self.assertNotIn(results[0], _compiled.values())
+        self.assertIn(results[-1], _compiled.values())
+
+        dispatcher = Dispatcher(
+            {'Node': [Text(value='n')]}, token_handler, layout_handlers,
+            deferrable_handlers,
+        )
+        self.assertEqual('n', ''.join(
+            c.text for c in compiled_walk(dispatcher, Node([]))))
+        self.assertIs(get_emitters(dispatcher), get_emitters(dispatcher))
+
+    def test_custom_rules(self):
+        token_handler, layout_handlers, deferrable_handlers, declared_vars = (
+            setup_handlers(self))
+        dispatcher = Dispatcher(
+            definitions={
+                'Block': (
+                    Text(value='['),
+                    JoinAttr(Iter(), value=(Text(value=','), Space,)),
+                    Text(value=']'),
+                    Optional('label', (Space, Attr('label'),)),
+                    Newline,
+                ),
+                'Node': (Upper('class'),),
+            },
+            token_handler=token_handler,
+            layout_handlers=layout_handlers,
+            deferrable_handlers=deferrable_handlers,
+        )
+        node = Node([])
+        setattr(node, 'class', 'x')
+        block = Block([node, node])
+        block.label = 'y'
+        self.assertEqual('[X, X] y', ''.join(
+            c.text for c in compiled_walk(dispatcher, block)))
+        self.assertEqual(
+            [c.text for c in walk(dispatcher, block)],
+            [c.text for c in compiled_walk(dispatcher, block)],
+        )
+        # the rules with handlers provided to the tokens are the ones
+        # from the definition, other than the custom tokens.
+        self.assertIs(self.tokens_handled[0][0], dict(dispatcher)['Block'][0])
+
+        # an initial definition is handled by the standard walk.
+        self.assertEqual('X', ''.join(c.text for c in compiled_walk(
+            dispatcher, node, definition=(
+                dispatcher.get_optimized_definition(node)))))
+
+    def test_source(self):
+        compiler = EmitterCompiler({
+            'Block': (Text(value='['), Space, Attr('if'), Text(value=']')),
+        }, frozenset())
+        source = compiler.compile()
+        self.assertIn("getattr(node, 'if')", source)
+        # a Layout without a handler has no code.
+        self.assertNotIn('LayoutChunk', source)
+        self.assertEqual(len(compiler.rules), 3)
+
+
+class RenderTextTestCase(unittest.TestCase, WalkCaseMixin):
+
+    def walk_text(self, dispatcher, node):
+        parts = []
+        render_text(dispatcher, node, parts.append)
+        return ''.join(parts)
+
+    def assertSameOutput(self, tree, *rules):
+        unparser = Unparser(rules=rules)
+        expected = ''.join(c.text for c in unparser(tree))
+        self.assertEqual(expected, unparser.render(tree))
+        buffer = StringIO()
+        self.assertIsNone(unparser.render(tree, buffer.write))
+        self.assertEqual(expected, buffer.getvalue())
+
+    def test_prepared(self):
+        unparser = Unparser(rules=(rules.minify(), rules.obfuscate()))
+        unparser.prepare()
+        source = 'function f(a) { var b = a; return b; }'
+        self.assertEqual(
+            unparser.render(es5(source)), unparser.render(es5(source)))
+        self.assertEqual(
+            'function f(b){var a=b;return a}', unparser.render(es5(source)))
+
+    def test_custom_rules(self):
+        token_handler, layout_handlers, deferrable_handlers, declared_vars = (
+            setup_handlers(self))
+        dispatcher = Dispatcher(
+            definitions={
+                'Block': (
+                    Text(value='['),
+                    JoinAttr(Iter(), value=(Text(value=','), Space,)),
+                    Text(value=']'),
+                    Optional('label', (Space, Attr('label'),)),
+                ),
+                'Node': (Upper('class'), Token()),
+            },
+            token_handler=token_handler,
+            layout_handlers=layout_handlers,
+            deferrable_handlers=deferrable_handlers,
+        )
+        dispatcher.error_handler = lambda e, rule, node: SimpleChunk('!')
+        node = Node([])
+        setattr(node, 'class', 'x')
+        block = Block([node, node])
+        block.label = 'y'
+        parts = []
+        render_text(dispatcher, block, parts.append)
+        self.assertEqual('[X!, X!] y', ''.join(parts))
+        self.assertEqual(''.join(parts), ''.join(
+            c.text for c in walk(dispatcher, block)))
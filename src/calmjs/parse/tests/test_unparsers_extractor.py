@@ -381,6 +381,11 @@ class ExtractorUnparserTestCase(unittest.TestCase):
         ast = parse('')
         self.assertEqual(dict(unparser(ast)), {})
 
+    def test_render_unsupported(self):
+        unparser = Unparser()
+        with self.assertRaises(NotImplementedError):
+            unparser.render(parse('var a = 1;'))
+
     def test_empty_statements(self):
         unparser = Unparser()
         ast = parse(";;;")
@@ -10,6 +10,10 @@ from calmjs.parse.asttypes import VarStatement
 from calmjs.parse.asttypes import VarDecl
 from calmjs.parse.unparsers.walker import Dispatcher
 from calmjs.parse.unparsers.walker import walk
+from calmjs.parse.unparsers.walker import iterative_walk
+from calmjs.parse.unparsers.walker import compile_layout_trie
+from calmjs.parse.unparsers.es5 import Unparser
+from calmjs.parse import rules
 from calmjs.parse.ruletypes import (
     Token,
     Attr,
@@ -18,6 +22,8 @@ from calmjs.parse.ruletypes import (
     Operator,
     Space,
     Newline,
+    Indent,
+    Dedent,
     Iter,
     Declare,
     Resolve,
@@ -211,6 +217,46 @@ class DispatcherWalkTestCase(unittest.TestCase):
         n3 = Block([Node([])] * 3)
         self.assertEqual(' nn', ''.join(c.text for c in walk(dispatcher, n3)))
 
+    def test_long_layout_runs(self):
+        # the layouts are normalized with a single match from the right
+        # for every chunk, so long runs of layouts without any tokens
+        # between them no longer take quadratic time.
+        class Block(Node):
+            pass
+
+        def layout(text):
+            def handler(dispatcher, node, before, after, prev):
+                yield SimpleChunk(text)
+            return handler
+
+        def noop(*a, **kw):
+            return
+            yield  # pragma: no cover
+
+        dispatcher = Dispatcher(
+            definitions={
+                'Node': (Indent, Newline, Dedent, Newline, Newline),
+                'Block': (JoinAttr(Iter(), value=()),),
+            },
+            token_handler=None,
+            layout_handlers={
+                Indent: layout('>'),
+                Dedent: layout('<'),
+                Newline: layout('n'),
+                (Indent, Newline, Dedent): noop,
+                # only matched with the normalized chunks before it.
+                ((Indent, Newline, Dedent), Newline): layout('N'),
+                (Newline, Newline): NotImplemented,
+            },
+            deferrable_handlers={},
+        )
+
+        self.assertEqual('Nn', ''.join(
+            c.text for c in walk(dispatcher, Node([]))))
+        block = Block([Node([])] * 20000)
+        self.assertEqual('Nn' * 20000, ''.join(
+            c.text for c in walk(dispatcher, block)))
+
     def test_dispatcher_error_trap(self):
         class Block(Node):
             pass
@@ -280,6 +326,99 @@ class DispatcherWalkTestCase(unittest.TestCase):
         self.assertEqual(3, len(list(walk(dispatcher, nodes))))
 
 
+class WalkCaseMixin(object):
+    """
+    The tests for the alternatives to the walk function, which must
+    produce the same output; the walk attribute is the alternative.
+    """
+
+    source = (
+        'var a = [1, , 2, , ], b = {c: function(d) { return d.e; }};\n'
+        '/* comment */\n'
+        'if (a) { b(a, [,]); } else if (!a) try { x() } catch (e) {}\n'
+        'for (var i = 0; i < 1; i++) while (true) do ; while (0);\n'
+        'switch (a) { case 1: break; default: a = void 0 }\n'
+    )
+
+    def walk_text(self, dispatcher, node):
+        return ''.join(c.text for c in self.walk(dispatcher, node))
+
+    def assertSameOutput(self, tree, *rules):
+        self.assertEqual(
+            list(Unparser(rules=rules)(tree)),
+            list(Unparser(rules=rules, walk=self.walk)(tree)),
+        )
+
+    def test_same_output(self):
+        tree = es5(self.source, with_comments=True)
+        self.assertSameOutput(tree, rules.default())
+        self.assertSameOutput(tree, rules.minimum())
+        self.assertSameOutput(tree, rules.indent(indent_str='\t'))
+        self.assertSameOutput(tree, rules.minify())
+        self.assertSameOutput(tree, rules.minify(), rules.obfuscate(
+            obfuscate_globals=True, shadow_funcname=True))
+
+    def test_dispatcher_error_trap(self):
+        class Block(Node):
+            pass
+
+        token_handler, layout_handlers, deferrable_handlers, declared_vars = (
+            setup_handlers(self))
+        dispatcher = Dispatcher(
+            definitions={
+                'Block': (
+                    Text(value='['),
+                    JoinAttr(Iter(), value=(Text(value=','),)),
+                    Text(value=']'),
+                ),
+                'Node': (Token(),),  # Token will raise NotImplemented
+            },
+            token_handler=token_handler,
+            layout_handlers={},
+            deferrable_handlers={},
+        )
+
+        nodes = [Node([])] * 4
+        block = Block(Block(nodes))
+        with self.assertRaises(NotImplementedError):
+            self.walk_text(dispatcher, block)
+
+        err_nodes = []
+
+        def ignore_handler(exception, rule, node):
+            err_nodes.append(node)
+            return next(dispatcher.token(rule, node, '', []))
+
+        dispatcher.error_handler = ignore_handler
+        self.assertEqual('[,,,]', self.walk_text(dispatcher, block))
+        self.assertEqual(err_nodes, nodes)
+
+        def reraise_handler(exception, rule, node):
+            # only handle the errors at the outer Block.
+            if not isinstance(node, Block):
+                raise exception
+            return SimpleChunk('!')
+
+        dispatcher.error_handler = reraise_handler
+        self.assertEqual(
+            ''.join(c.text for c in walk(dispatcher, block)),
+            self.walk_text(dispatcher, block),
+        )
+
+
+class IterativeWalkTestCase(unittest.TestCase, WalkCaseMixin):
+
+    walk = staticmethod(iterative_walk)
+
+    def test_deeply_nested(self):
+        tree = es5('f(' * 2000 + ')' * 2000 + ';')
+        unparser = Unparser(rules=(rules.minify(),), walk=iterative_walk)
+        self.assertEqual(
+            'f(' * 2000 + ')' * 2000,
+            ''.join(c.text for c in unparser(tree)),
+        )
+
+
 class DispatcherTestcase(unittest.TestCase):
 
     def test_empty(self):
@@ -290,3 +429,26 @@ class DispatcherTestcase(unittest.TestCase):
         marker = tuple()
         dispatcher = Dispatcher({'Node': marker}, {}, {}, {})
         self.assertEqual(dict(dispatcher), {'Node': marker})
+
+    def test_layout_trie(self):
+        def handler(*a):
+            pass  # pragma: no cover
+
+        trie = compile_layout_trie({
+            Space: handler,
+            (Space, Newline): handler,
+            (Indent, Space, Newline): handler,
+            (Newline, Newline): NotImplemented,
+        })
+        self.assertEqual(trie, {
+            Newline: {
+                Space: {
+                    None: ((Space, Newline), handler),
+                    Indent: {None: ((Indent, Space, Newline), handler)},
+                },
+            },
+        })
+        dispatcher = Dispatcher({}, None, {(Space, Newline): handler}, {})
+        self.assertEqual(dispatcher.layout_trie, {
+            Newline: {Space: {None: ((Space, Newline), handler)}},
+        })
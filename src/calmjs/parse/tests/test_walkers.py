@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import sys
 import textwrap
+import time
 import unittest
 
+import calmjs.parse.asttypes
 from calmjs.parse import walkers
 from calmjs.parse import es5
 from calmjs.parse.parsers.es5 import asttypes
@@ -20,6 +23,305 @@ class WalkerTestCase(unittest.TestCase):
         with self.assertRaises(TypeError):
             list(walker.walk('not_a_node'))
 
+    def test_order(self):
+        tree = es5(textwrap.dedent("""
+        var a = function(b) {
+          return [b, c(d)];
+        };
+        e.f = 1;
+        """))
+
+        def recursive(node):
+            for child in node:
+                yield child
+                for subchild in recursive(child):
+                    yield subchild
+
+        self.assertEqual(list(walker.walk(tree)), list(recursive(tree)))
+        self.assertEqual(
+            [node.value for node in walker.filter(
+                tree, lambda node: isinstance(node, asttypes.Identifier))],
+            ['a', 'b', 'b', 'c', 'd', 'e'],
+        )
+
+    def test_prune(self):
+        tree = es5(textwrap.dedent("""
+        var a = function(b) {
+          return [b, c(d)];
+        };
+        e.f = 1;
+        """))
+
+        def condition(node):
+            if isinstance(node, asttypes.FuncExpr):
+                return walkers.PRUNE
+            return isinstance(node, asttypes.Identifier)
+
+        self.assertEqual(
+            [node.value for node in walker.filter(tree, condition)],
+            ['a', 'e'],
+        )
+        self.assertEqual(
+            [type(node).__name__ for node in walker.walk(tree, condition)], [
+                'VarStatement', 'VarDecl', 'Identifier', 'FuncExpr',
+                'ExprStatement', 'Assign', 'DotAccessor', 'Identifier',
+                'PropIdentifier', 'Number',
+            ]
+        )
+
+    def test_deeply_nested(self):
+        node = asttypes.Identifier('a')
+        for i in range(sys.getrecursionlimit() * 2):
+            node = asttypes.BinOp('+', node, asttypes.Identifier('b'))
+        tree = asttypes.ES5Program([asttypes.ExprStatement(node)])
+        nodes = list(walker.walk(tree))
+        self.assertEqual(len(nodes), sys.getrecursionlimit() * 4 + 2)
+        self.assertEqual(nodes[sys.getrecursionlimit() * 2 + 1].value, 'a')
+        self.assertEqual(len(list(walker.filter(
+            tree, lambda node: isinstance(node, asttypes.Identifier)))),
+            sys.getrecursionlimit() * 2 + 1)
+
+
+class TreeIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = es5(textwrap.dedent("""
+        var a = function(b) {
+          return [b, c(d)];
+        };
+        e.f(1);
+        """))
+        self.index = walkers.TreeIndex(self.tree)
+
+    def test_not_node(self):
+        with self.assertRaises(TypeError):
+            walkers.TreeIndex('not_a_node')
+
+    def test_of_type(self):
+        self.assertEqual(
+            len(self.index), len(list(walker.walk(self.tree))) + 1)
+        self.assertEqual(
+            self.index.of_type(asttypes.FunctionCall),
+            list(walker.filter(
+                self.tree,
+                lambda node: isinstance(node, asttypes.FunctionCall))),
+        )
+        # the base classes will match all subclasses in pre-order.
+        self.assertEqual(
+            [type(node).__name__ for node in self.index.of_type(
+                calmjs.parse.asttypes.Node)],
+            [type(node).__name__ for node in [self.tree] + list(
+                walker.walk(self.tree))],
+        )
+        self.assertEqual(
+            [node.value for node in self.index.of_type('Identifier')],
+            ['a', 'b', 'b', 'c', 'd', 'e', 'f'],
+        )
+        self.assertEqual(
+            [node.value for node in self.index.of_type(
+                calmjs.parse.asttypes.Identifier)],
+            ['a', 'b', 'b', 'c', 'd', 'e', 'f'],
+        )
+        # the names of the base classes also match.
+        self.assertEqual(
+            self.index.of_type('FuncBase'),
+            self.index.of_type(calmjs.parse.asttypes.FuncBase),
+        )
+        self.assertEqual(len(self.index.of_type('FuncBase')), 1)
+        self.assertEqual(
+            len(self.index.of_type('Node')), len(self.index))
+        self.assertEqual(self.index.of_type(asttypes.Regex), [])
+        # the results may be modified without affecting the index.
+        self.index.of_type('Identifier').clear()
+        self.assertEqual(len(self.index.of_type('Identifier')), 7)
+
+    def test_parent_depth_ancestors(self):
+        self.assertIsNone(self.index.parent(self.tree))
+        self.assertEqual(self.index.depth(self.tree), 0)
+        self.assertEqual(self.index.ancestors(self.tree), [])
+
+        d = self.index.of_type('Identifier')[4]
+        self.assertEqual(d.value, 'd')
+        self.assertIsInstance(self.index.parent(d), asttypes.Arguments)
+        self.assertEqual(self.index.depth(d), 8)
+        self.assertEqual([
+            type(node).__name__ for node in self.index.ancestors(d)
+        ], [
+            'Arguments', 'FunctionCall', 'Array', 'Return', 'FuncExpr',
+            'VarDecl', 'VarStatement', 'ES5Program',
+        ])
+
+    def test_enclosing(self):
+        b, d = [
+            node for node in self.index.of_type('Identifier')
+            if node.value in ('b', 'd')][1:]
+        func = self.index.of_type(asttypes.FuncExpr)[0]
+        self.assertIs(
+            self.index.enclosing(b, calmjs.parse.asttypes.FuncBase), func)
+        self.assertIs(self.index.enclosing(d, 'FuncExpr'), func)
+        self.assertIs(self.index.enclosing(d, 'FuncBase'), func)
+        self.assertIs(self.index.enclosing(d, 'Node'), self.index.parent(d))
+        self.assertIs(
+            self.index.enclosing(d, asttypes.VarStatement),
+            self.tree.children()[0],
+        )
+        self.assertIs(
+            self.index.enclosing(d, asttypes.FunctionCall),
+            self.index.parent(self.index.parent(d)),
+        )
+        self.assertIsNone(
+            self.index.enclosing(func, calmjs.parse.asttypes.FuncBase))
+        self.assertIsNone(self.index.enclosing(self.tree, asttypes.Node))
+
+    def test_path_to(self):
+        self.assertEqual(self.index.path_to(self.tree), [self.tree])
+        d = self.index.of_type('Identifier')[4]
+        path = self.index.path_to(d)
+        self.assertIs(path[0], self.tree)
+        self.assertIs(path[-1], d)
+        self.assertEqual(path[:-1], self.index.ancestors(d)[::-1])
+        for parent, child in zip(path, path[1:]):
+            self.assertIn(child, parent.children())
+
+    def test_missing(self):
+        node = asttypes.Identifier('a')
+        self.assertNotIn(node, self.index)
+        self.assertIn(self.tree, self.index)
+        with self.assertRaises(ValueError):
+            self.index.parent(node)
+        with self.assertRaises(ValueError):
+            self.index.depth(node)
+        with self.assertRaises(ValueError):
+            self.index.ancestors(node)
+        with self.assertRaises(ValueError):
+            self.index.enclosing(node, asttypes.Node)
+        with self.assertRaises(ValueError):
+            self.index.path_to(node)
+
+
+class Recorder(object):
+
+    def __init__(self, prune=None):
+        self.events = []
+        self.prune = prune
+
+    def enter_Node(self, node):
+        self.events.append(('enter', type(node).__name__))
+        if type(node).__name__ == self.prune:
+            return walkers.PRUNE
+
+    def leave_Node(self, node):
+        self.events.append(('leave', type(node).__name__))
+
+
+class Counter(object):
+
+    def __init__(self):
+        self.names = []
+        self.functions = 0
+
+    def enter_FuncBase(self, node):
+        self.functions += 1
+
+    def enter_Identifier(self, node):
+        self.names.append(node.value)
+
+    def enter_PropIdentifier(self, node):
+        # the more specific callback is used.
+        pass
+
+
+class MultiVisitorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = es5(textwrap.dedent("""
+        var a = function(b) {
+          return [b, c(d)];
+        };
+        e.f = function() {};
+        """))
+
+    def test_not_node(self):
+        with self.assertRaises(TypeError):
+            walkers.MultiVisitor().visit('not_a_node')
+
+    def test_enter_leave(self):
+        recorder = Recorder()
+        walkers.MultiVisitor([recorder]).visit(self.tree)
+        nodes = [self.tree] + list(walker.walk(self.tree))
+        self.assertEqual(
+            [name for event, name in recorder.events if event == 'enter'],
+            [type(node).__name__ for node in nodes],
+        )
+        self.assertEqual(recorder.events[:3], [
+            ('enter', 'ES5Program'), ('enter', 'VarStatement'),
+            ('enter', 'VarDecl'),
+        ])
+        self.assertEqual(recorder.events[3:6], [
+            ('enter', 'Identifier'), ('leave', 'Identifier'),
+            ('enter', 'FuncExpr'),
+        ])
+        self.assertEqual(recorder.events[-2:], [
+            ('leave', 'ExprStatement'), ('leave', 'ES5Program')])
+        self.assertEqual(len(recorder.events), len(nodes) * 2)
+
+    def test_dispatch(self):
+        counter = Counter()
+        recorder = Recorder()
+        visitor = walkers.MultiVisitor([counter])
+        visitor.register(recorder)
+        visitor.visit(self.tree)
+        self.assertEqual(counter.functions, 2)
+        self.assertEqual(counter.names, ['a', 'b', 'b', 'c', 'd', 'e'])
+        self.assertEqual(len(recorder.events), (
+            len(list(walker.walk(self.tree))) + 1) * 2)
+        self.assertEqual(visitor.timings, [0.0, 0.0])
+
+    def test_prune(self):
+        pruning = Recorder(prune='FuncExpr')
+        recorder = Recorder()
+        visitor = walkers.MultiVisitor([pruning, recorder])
+        visitor.visit(self.tree)
+        self.assertEqual(
+            [name for event, name in pruning.events if event == 'enter'], [
+                'ES5Program', 'VarStatement', 'VarDecl', 'Identifier',
+                'FuncExpr', 'ExprStatement', 'Assign', 'DotAccessor',
+                'Identifier', 'PropIdentifier', 'FuncExpr',
+            ]
+        )
+        self.assertEqual(pruning.events.count(('leave', 'FuncExpr')), 2)
+        self.assertEqual(len(recorder.events), (
+            len(list(walker.walk(self.tree))) + 1) * 2)
+
+    def test_prune_all(self):
+        class Skip(object):
+            def enter_ES5Program(self, node):
+                return walkers.PRUNE
+
+        recorder = Recorder(prune='VarStatement')
+        walkers.MultiVisitor([recorder, Skip()]).visit(self.tree)
+        # the descendants of the VarStatement are skipped, as both the
+        # visitors have pruned them.
+        self.assertEqual(
+            [name for event, name in recorder.events if event == 'enter'], [
+                'ES5Program', 'VarStatement', 'ExprStatement', 'Assign',
+                'DotAccessor', 'Identifier', 'PropIdentifier', 'FuncExpr',
+            ]
+        )
+        self.assertEqual(recorder.events[-1], ('leave', 'ES5Program'))
+
+    def test_timing(self):
+        class Slow(object):
+            def enter_FuncBase(self, node):
+                start = time.time()
+                while time.time() - start < 0.01:
+                    pass
+
+        visitor = walkers.MultiVisitor([Counter(), Slow()], timing=True)
+        visitor.visit(self.tree)
+        self.assertGreater(visitor.timings[1], 0.02)
+        self.assertGreater(visitor.timings[1], visitor.timings[0])
+
 
 class ReprTestCase(unittest.TestCase):
 
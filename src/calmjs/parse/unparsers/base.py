@@ -13,8 +13,10 @@ from calmjs.parse.unparsers.walker import (
     Dispatcher,
     walk,
 )
+from calmjs.parse.unparsers.compiler import render_text
 from calmjs.parse.handlers.core import default_rules
 from calmjs.parse.handlers.core import token_handler_str_default
+from calmjs.parse.handlers.core import token_handler_unobfuscate
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,12 @@ class BaseUnparser(object):
     walk function together to achieve unparsing.
     """
 
+    # the token handlers which produce the same text as render_text.
+    text_token_handlers = (
+        token_handler_str_default,
+        token_handler_unobfuscate,
+    )
+
     def __init__(
             self,
             definitions,
@@ -75,11 +83,15 @@ class BaseUnparser(object):
         self.deferrable_handlers = deferrable_handlers
         self.prewalk_hooks = prewalk_hooks
         self.token_handler = token_handler
+        # the dispatcher and hooks produced by prepare.
+        self.prepared = None
 
     def setup(self):
         layout_handlers = {}
         deferrable_handlers = {}
         prewalk_hooks = []
+        # the reset hooks provided by the rules are recorded for prepare.
+        reset_hooks = self._reset_hooks = []
         token_handler = None
 
         for rule in self.rules:
@@ -101,6 +113,7 @@ class BaseUnparser(object):
             layout_handlers.update(r.get('layout_handlers', {}))
             deferrable_handlers.update(r.get('deferrable_handlers', {}))
             prewalk_hooks.extend(r.get('prewalk_hooks', []))
+            reset_hooks.extend(r.get('reset_hooks', []))
 
         if self.token_handler:
             if token_handler and token_handler is not self.token_handler:
@@ -137,7 +150,10 @@ class BaseUnparser(object):
         return (
             token_handler, layout_handlers, deferrable_handlers, prewalk_hooks)
 
-    def __call__(self, node):
+    def _build(self):
+        # the reset hooks will only be collected if the setup method
+        # was not overridden to bypass the rules.
+        self._reset_hooks = []
         (token_handler, layout_handlers, deferrable_handlers,
             prewalk_hooks) = self.setup()
         dispatcher = self.dispatcher_cls(
@@ -146,9 +162,71 @@ class BaseUnparser(object):
             layout_handlers,
             deferrable_handlers,
         )
+        return dispatcher, prewalk_hooks, self._reset_hooks
+
+    def prepare(self):
+        """
+        Set up the rules and construct the dispatcher once, such that
+        they will be reused by every subsequent call to this instance,
+        rather than being done again for every call.
+
+        As the handlers provided by the rules are then shared by every
+        call, the rules that keep any state must provide the callables
+        that will reset that state through the ``reset_hooks``, which
+        are called without arguments at the start of every call.  Note
+        that the calls must not be interleaved, i.e. the output of the
+        previous call must be consumed before the next call is made.
+        """
+
+        self.prepared = self._build()
+
+    def dispatch(self, node):
+        """
+        Return the dispatcher for a call with the node, along with the
+        node returned by the prewalk hooks.
+        """
+
+        if self.prepared:
+            dispatcher, prewalk_hooks, reset_hooks = self.prepared
+            for reset_hook in reset_hooks:
+                reset_hook()
+        else:
+            dispatcher, prewalk_hooks, _ = self._build()
 
         for prewalk_hook in prewalk_hooks:
             node = prewalk_hook(dispatcher, node)
 
+        return dispatcher, node
+
+    def __call__(self, node):
+        dispatcher, node = self.dispatch(node)
         for chunk in self.walk(dispatcher, node):
             yield chunk
+
+    def render(self, node, write=None):
+        """
+        Render the node as text only, without the production of the
+        chunks and the lookup of their positions, for when they are not
+        needed (e.g. no sourcemaps are to be generated); the strings are
+        passed to the write function, such as the write method of a
+        StringIO instance, or the append method of a list.  If no write
+        function is provided, the text is returned.
+
+        The text is produced through the render_text function if the
+        token handler is one of the text_token_handlers, as that renders
+        the text like those would have, without invoking them; otherwise
+        the text of the chunks produced by the walk function is written.
+        """
+
+        if write is None:
+            parts = []
+            self.render(node, parts.append)
+            return ''.join(parts)
+
+        dispatcher, node = self.dispatch(node)
+        if dispatcher.token_handler in self.text_token_handlers:
+            render_text(dispatcher, node, write)
+            return
+
+        for chunk in self.walk(dispatcher, node):
+            write(chunk.text)
@@ -0,0 +1,490 @@
+# -*- coding: utf-8 -*-
+"""
+Compile the definitions for the unparsers into Python functions.
+
+Rather than having the walk function invoke every rule of a definition
+generically through ``rule(walk, dispatcher, node)``, the definitions of
+a Dispatcher, along with the layout handlers that are active for it, are
+turned into the source code of one emitter function for every type of
+node, where the standard rules are expanded into straight-line code
+that produces the very same chunks as the walk function would.  As the
+handlers are bound at the start of every walk, the compiled code only
+depends on the definitions and on which of the Layout rules have a
+handler, which serves as the key for the cache of the compiled code.
+
+The emitters may also be compiled for the rendering of text only, where
+they write the text directly rather than producing the chunks.
+"""
+
+from __future__ import unicode_literals
+
+import keyword
+from collections import OrderedDict
+
+from calmjs.parse.asttypes import Elision
+from calmjs.parse.asttypes import Node
+from calmjs.parse.ruletypes import Attr
+from calmjs.parse.ruletypes import Deferrable
+from calmjs.parse.ruletypes import Layout
+from calmjs.parse.ruletypes import LayoutChunk
+from calmjs.parse.ruletypes import Operator
+from calmjs.parse.ruletypes import Structure
+from calmjs.parse.ruletypes import Token
+from calmjs.parse.unparsers.walker import ATTR
+from calmjs.parse.unparsers.walker import TextWriter
+from calmjs.parse.unparsers.walker import CALL
+from calmjs.parse.unparsers.walker import ELISION
+from calmjs.parse.unparsers.walker import ELISION_JOIN
+from calmjs.parse.unparsers.walker import JOIN
+from calmjs.parse.unparsers.walker import OPTIONAL
+from calmjs.parse.unparsers.walker import TEXT
+from calmjs.parse.unparsers.walker import compile_definition
+from calmjs.parse.unparsers.walker import _make_walk
+from calmjs.parse.unparsers.walker import process_chunks
+from calmjs.parse.unparsers.walker import walk
+
+# the maximum number of entries for the caches below, as they are keyed
+# by the rules, which may be constructed anew for every call.
+CACHE_SIZE = 64
+# the compiled emitters, keyed by the definitions and the layouts.
+_compiled = OrderedDict()
+# the Layout rules referenced by the definitions.
+_referenced = OrderedDict()
+
+
+def _cached(cache, key, factory):
+    # return the value for the key from the least recently used cache,
+    # producing it through the factory if it was not already cached.
+    try:
+        value = cache[key]
+        cache.move_to_end(key)
+    except KeyError:
+        value = cache[key] = factory()
+        while len(cache) > CACHE_SIZE:
+            try:
+                cache.popitem(last=False)
+            except KeyError:  # pragma: no cover
+                # emptied by another thread.
+                break
+    return value
+
+
+def _layouts(definition):
+    # yield every Layout rule referenced by the definition.
+    for rule in definition:
+        if isinstance(rule, type) and issubclass(rule, Layout):
+            yield rule
+        elif isinstance(rule, Token) and isinstance(rule.value, tuple):
+            for layout in _layouts(rule.value):
+                yield layout
+
+
+def _attr(attr):
+    # the expression for the attribute of the node.
+    if attr.isidentifier() and not keyword.iskeyword(attr) and (
+            not attr.startswith('__')):
+        return 'node.%s' % attr
+    return 'getattr(node, %r)' % (attr,)
+
+
+class EmitterCompiler(object):
+    """
+    Produce the source code for the emitter functions of the provided
+    definitions, where only the Layout rules in the provided layouts
+    have a handler, with the text argument selecting the emitters for
+    the rendering of text only.
+
+    The source code defines a single ``factory`` function, which is to
+    be called with the values that are bound for every walk, i.e. the
+    dispatcher, the list of arguments derived from the rules (see the
+    ``bind`` method), the mapping that will hold the emitters, and the
+    stacks of the nodes and the sourcepaths along with the recursive
+    walk function that shares them, and the TextWriter for the text
+    only emitters; the mapping from the name of every node type to its
+    emitter is returned.
+    """
+
+    def __init__(self, definitions, layouts, text=False):
+        self.definitions = definitions
+        self.layouts = layouts
+        self.text = text
+        # the rules referenced by the code as r{idx}, with their kind,
+        # and the indexes of the ones with an argument bound as a{idx}.
+        self.rules = []
+        self.kinds = []
+        self.args = set()
+        self.lines = []
+        self.counter = 0
+        self.emitters = {
+            ATTR: self.emit_attr,
+            TEXT: self.emit_text,
+            ELISION: self.emit_elision,
+            OPTIONAL: self.emit_optional,
+            JOIN: self.emit_join,
+            ELISION_JOIN: self.emit_elision_join,
+            CALL: self.emit_call,
+        }
+
+    def add_rule(self, rule, kind):
+        self.rules.append(rule)
+        self.kinds.append(kind)
+        return len(self.rules) - 1
+
+    def var(self, prefix):
+        self.counter += 1
+        return '%s%d' % (prefix, self.counter)
+
+    def emit(self, indent, line):
+        self.lines.append('    ' * indent + line)
+
+    # The code that produces the output; the emitters are generators of
+    # the chunks, unless this is for the text only rendering, where the
+    # text and chunks are passed to the methods of the TextWriter.
+
+    def emit_node(self, indent, value):
+        code = 'E[%s.__class__.__name__](%s)' % (value, value)
+        self.emit(indent, code if self.text else 'yield from ' + code)
+
+    def emit_token(self, indent, idx, value):
+        self.emit(indent, 'text(%s)' % value if self.text else (
+            'yield from token(r%d, nodes[-1], %s, sourcepath_stack)' % (
+                idx, value)))
+
+    def emit_chunk(self, indent, chunk):
+        self.emit(indent, 'chunk(%s)' % chunk if self.text else (
+            'yield %s' % chunk))
+
+    def emit_chunks(self, indent, chunks):
+        if self.text:
+            var = self.var('c')
+            self.emit(indent, 'for %s in %s:' % (var, chunks))
+            self.emit(indent + 1, 'chunk(%s)' % var)
+        else:
+            self.emit(indent, 'yield from %s' % chunks)
+
+    def getattr(self, idx):
+        # Return the expression for the _getattr method of the rule.
+        rule = self.rules[idx]
+        getter = type(rule)._getattr
+        if getter is Attr._getattr and isinstance(rule.attr, Deferrable):
+            return 'r%d.attr(dispatcher, node)' % idx
+        if getter is Operator._getattr and not rule.attr:
+            return 'r%d.value' % idx
+        if getter in (Attr._getattr, Operator._getattr) and isinstance(
+                rule.attr, str):
+            return _attr(rule.attr)
+        return 'r%d._getattr(dispatcher, node)' % idx
+
+    def walk_value(self, indent, value, idx):
+        # Emit the code that walks the value of the expression for the
+        # rule at idx.
+        var = self.var('v')
+        self.emit(indent, '%s = %s' % (var, value))
+        self.emit(indent, 'if isinstance(%s, Node):' % var)
+        self.emit_node(indent + 1, var)
+        self.emit(indent, 'else:')
+        self.emit_token(indent + 1, idx, var)
+
+    def emit_block(self, indent, definition):
+        # Emit the code for the walk of the current node with the
+        # definition, which pushes the node to the stacks just like the
+        # walk function.
+        push = self.var('s')
+        self.emit(indent, '%s = node.sourcepath' % push)
+        self.emit(indent, 'if %s:' % push)
+        self.emit(indent + 1, 'sourcepath_stack.append(%s)' % push)
+        self.emit(indent, 'nodes.append(node)')
+        for rule in definition:
+            self.emit_rule(indent, rule)
+        self.emit(indent, 'nodes.pop(-1)')
+        self.emit(indent, 'if %s:' % push)
+        self.emit(indent + 1, 'sourcepath_stack.pop(-1)')
+
+    def emit_rule(self, indent, rule):
+        if isinstance(rule, type):
+            if rule not in self.layouts:
+                return
+            idx = self.add_rule(rule, Layout)
+            self.args.add(idx)
+            if issubclass(rule, Structure):
+                self.emit_guarded(indent, idx, self.emit_structure)
+            else:
+                # nothing can be raised here.
+                self.emit(indent, (
+                    'layout(LayoutChunk(r%d, a%d, node))' if self.text else
+                    'yield LayoutChunk(r%d, a%d, node)') % (idx, idx))
+            return
+
+        instruction = compile_definition((rule,))[0][0]
+        if instruction in (OPTIONAL, ELISION_JOIN) and not isinstance(
+                rule.value, tuple):
+            # the walk would look up the definition for the node again.
+            instruction = CALL
+        idx = self.add_rule(rule, instruction)
+        if instruction == CALL:
+            self.args.add(idx)
+        self.emit_guarded(indent, idx, self.emitters[instruction])
+
+    def emit_guarded(self, indent, idx, emitter):
+        # Emit the code produced by the emitter for the rule, with the
+        # exceptions being passed to the error_handler of the dispatcher
+        # like the walk function.
+        self.emit(indent, 'try:')
+        emitter(indent + 1, idx)
+        self.emit(indent, 'except Exception as e:')
+        self.emit_chunk(indent + 1, 'dispatcher.error_handler(%s)' % (
+            'e, rule=%s%d, node=node' % (
+                'a' if self.kinds[idx] == CALL else 'r', idx)))
+
+    def emit_structure(self, indent, idx):
+        self.emit(indent, 'a%d(dispatcher, node)' % idx)
+
+    def emit_attr(self, indent, idx):
+        rule = self.rules[idx]
+        getter = self.getattr(idx)
+        if getter == 'r%d.value' % idx and isinstance(rule.value, str):
+            self.emit_text(indent, idx)
+            return
+        var = self.var('v')
+        self.emit(indent, '%s = %s' % (var, getter))
+        self.emit(indent, 'if %s not in EMPTY:' % var)
+        self.walk_value(indent + 1, var, idx)
+
+    def emit_text(self, indent, idx):
+        if isinstance(self.rules[idx].value, Node):
+            self.walk_value(indent, 'r%d.value' % idx, idx)
+            return
+        self.emit_token(indent, idx, 'r%d.value' % idx)
+
+    def emit_elision(self, indent, idx):
+        self.walk_value(
+            indent, 'r%d.value * %s' % (idx, self.getattr(idx)), idx)
+
+    def emit_optional(self, indent, idx):
+        rule = self.rules[idx]
+        self.emit(indent, 'if %s not in EMPTY:' % _attr(rule.attr))
+        self.emit_block(indent + 1, rule.value)
+
+    def emit_join(self, indent, idx):
+        rule = self.rules[idx]
+        first = self.var('f')
+        target = self.var('t')
+        self.emit(indent, '%s = True' % first)
+        self.emit(indent, 'for %s in %s:' % (target, self.getattr(idx)))
+        self.emit(indent + 1, 'if %s:' % first)
+        self.emit(indent + 2, '%s = False' % first)
+        self.emit(indent + 1, 'else:')
+        self.emit_block(indent + 2, rule.value if rule.value else ())
+        self.walk_value(indent + 1, target, idx)
+
+    def emit_elision_join(self, indent, idx):
+        rule = self.rules[idx]
+        previous = self.var('p')
+        target = self.var('t')
+        self.emit(indent, '%s = None' % previous)
+        self.emit(indent, 'for %s in %s:' % (target, self.getattr(idx)))
+        self.emit(indent + 1, 'if %s is not None:' % previous)
+        self.emit(indent + 2, 'if not isinstance(%s, Elision):' % previous)
+        self.emit_node(indent + 3, 'r%d.sep' % idx)
+        self.emit(indent + 2, 'if not isinstance(%s, Elision):' % target)
+        self.emit_block(indent + 3, rule.value)
+        self.walk_value(indent + 1, target, idx)
+        self.emit(indent + 1, '%s = %s' % (previous, target))
+
+    def emit_call(self, indent, idx):
+        # the optimized copy from the dispatcher is invoked, like the
+        # walk function.
+        self.emit_chunks(indent, 'a%d(_walk, dispatcher, node)' % idx)
+
+    def compile(self):
+        """
+        Return the source code for the factory function.
+        """
+
+        names = []
+        for name, definition in sorted(self.definitions.items()):
+            function = 'emit_%d' % len(names)
+            names.append((name, function))
+            self.emit(1, 'def %s(node):' % function)
+            self.emit_block(2, definition)
+            if not self.text:
+                # ensure that this is always a generator.
+                self.emit(2, 'return')
+                self.emit(2, 'yield')
+
+        body = self.lines
+        self.lines = [
+            'def factory(dispatcher, args, E, nodes, sourcepath_stack, '
+            '_walk, writer=None):',
+            '    token = dispatcher.token',
+        ]
+        if self.text:
+            self.emit(1, 'text = writer.text')
+            self.emit(1, 'chunk = writer.chunk')
+            self.emit(1, 'layout = writer.layout')
+        for idx in range(len(self.rules)):
+            self.emit(1, 'r%d = rules[%d]' % (idx, idx))
+            if idx in self.args:
+                self.emit(1, 'a%d = args[%d]' % (idx, idx))
+        self.lines.extend(body)
+        for name, function in names:
+            self.emit(1, 'E[%r] = %s' % (name, function))
+        self.emit(1, 'return E')
+        return '\n'.join(self.lines) + '\n'
+
+    def bind(self, dispatcher):
+        """
+        Return the list of arguments for the factory function, which
+        are the handlers for the Layout rules, and the optimized copies
+        from the dispatcher for the rules that are invoked directly.
+        """
+
+        return [
+            dispatcher.layout(rule) if kind is Layout else
+            dispatcher.optimize_definition(type(rule).__name__, (rule,))[0]
+            if kind == CALL else None
+            for rule, kind in zip(self.rules, self.kinds)
+        ]
+
+
+def compile_emitters(definitions, layouts, text=False):
+    """
+    Compile the definitions with the provided Layout rules that have a
+    handler, and return the EmitterCompiler along with the factory.
+    """
+
+    compiler = EmitterCompiler(definitions, layouts, text)
+    source = compiler.compile()
+    namespace = {
+        'rules': compiler.rules,
+        'EMPTY': (None, []),
+        'Elision': Elision,
+        'LayoutChunk': LayoutChunk,
+        'Node': Node,
+    }
+    exec(compile(source, '<compiled definitions>', 'exec'), namespace)
+    return compiler, namespace['factory']
+
+
+def get_emitters(dispatcher, text=False):
+    """
+    Return the EmitterCompiler and the factory for the definitions of
+    the dispatcher, compiling them if they are not already cached; the
+    text argument selects the emitters for the text only rendering.
+    Only the CACHE_SIZE most recently used results are kept.
+    """
+
+    definitions = {
+        name: tuple(definition) for name, definition in dispatcher}
+    key = frozenset(definitions.items())
+    referenced = _cached(_referenced, key, lambda: frozenset(
+        layout for definition in definitions.values()
+        for layout in _layouts(definition)
+    ))
+    # only the handlers which the dispatcher would make use of.
+    layouts = []
+    for layout in referenced:
+        handler = dispatcher.layout(layout)
+        if handler is not NotImplemented and handler:
+            layouts.append(layout)
+    key = (key, frozenset(layouts), text)
+    return _cached(_compiled, key, lambda: compile_emitters(
+        definitions, frozenset(layouts), text))
+
+
+def compiled_walk(dispatcher, node, definition=None):
+    """
+    An alternative to the walk function with the same arguments, which
+    produces identical chunks through the emitter functions compiled
+    from the definitions of the dispatcher.
+
+    The rules that are not from the ruletypes module (or subclasses
+    that override __call__) are invoked with the recursive walk just
+    like the walk function, which will also be used for the walk should
+    an initial definition be provided.
+
+    Note that the rules passed to the token handler and to the
+    error_handler of the dispatcher are the ones from the definitions,
+    rather than the optimized copies made by the dispatcher that the
+    walk function would pass; the copies have the same attributes, so
+    only the handlers that compare the rules by identity are affected.
+
+    Could be used by the unparsers through the walk argument:
+
+    >>> from calmjs.parse import es5
+    >>> from calmjs.parse.unparsers.es5 import Unparser
+    >>> from calmjs.parse.unparsers.compiler import compiled_walk
+    >>> unparser = Unparser(walk=compiled_walk)
+    >>> print(''.join(c.text for c in unparser(es5(u'var a = [1,,2];'))))
+    var a = [1,, 2];
+    <BLANKLINE>
+    """
+
+    if definition is not None:
+        for chunk in walk(dispatcher, node, definition):
+            yield chunk
+        return
+
+    nodes = []
+    sourcepath_stack = [NotImplemented]
+    _walk = _make_walk(nodes, sourcepath_stack)
+    compiler, factory = get_emitters(dispatcher)
+    emitters = factory(
+        dispatcher, compiler.bind(dispatcher), {}, nodes, sourcepath_stack,
+        _walk,
+    )
+
+    def root():
+        if isinstance(node, Node):
+            yield from emitters[node.__class__.__name__](node)
+        else:
+            yield from _walk(dispatcher, node)
+
+    for chunk in process_chunks(dispatcher, root()):
+        yield chunk
+
+
+def render_text(dispatcher, node, write):
+    """
+    Render the node as text through the emitter functions compiled from
+    the definitions of the dispatcher, where every string of the output
+    is passed to the write function (e.g. the write method of a StringIO
+    or the append method of a list) rather than being produced as chunks.
+
+    As the output of the Token rules is written directly, the token
+    handler of the dispatcher is not used; the text will be the value as
+    it would have been for the token handlers that are provided by the
+    handlers.core module, and so no positions are looked up.  Any other
+    rules are invoked with the recursive walk with their chunks written,
+    and an initial definition is not supported.
+
+    >>> from io import StringIO
+    >>> from calmjs.parse import es5
+    >>> from calmjs.parse.unparsers.es5 import Unparser
+    >>> from calmjs.parse.unparsers.compiler import render_text
+    >>> unparser = Unparser()
+    >>> unparser.prepare()
+    >>> buffer = StringIO()
+    >>> render_text(unparser.prepared[0], es5(u'var a = [1,,2];'),
+    ...     buffer.write)
+    >>> print(buffer.getvalue())
+    var a = [1,, 2];
+    <BLANKLINE>
+    """
+
+    nodes = []
+    sourcepath_stack = [NotImplemented]
+    _walk = _make_walk(nodes, sourcepath_stack)
+    writer = TextWriter(dispatcher, write)
+    compiler, factory = get_emitters(dispatcher, text=True)
+    emitters = factory(
+        dispatcher, compiler.bind(dispatcher), {}, nodes, sourcepath_stack,
+        _walk, writer,
+    )
+
+    if isinstance(node, Node):
+        emitters[node.__class__.__name__](node)
+    else:
+        for chunk in _walk(dispatcher, node):
+            writer.chunk(chunk)
+    writer.close()
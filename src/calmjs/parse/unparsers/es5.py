@@ -46,6 +46,7 @@ from calmjs.parse.ruletypes import (
     children_comma,
 )
 from calmjs.parse.unparsers.base import BaseUnparser
+from calmjs.parse.unparsers.walker import walk
 from calmjs.parse import rules
 
 value = (
@@ -371,7 +372,8 @@ class Unparser(BaseUnparser):
             rules=(rules.default(),),
             layout_handlers=None,
             deferrable_handlers=None,
-            prewalk_hooks=()):
+            prewalk_hooks=(),
+            walk=walk):
 
         super(Unparser, self).__init__(
             definitions=definitions,
@@ -380,6 +382,7 @@ class Unparser(BaseUnparser):
             layout_handlers=layout_handlers,
             deferrable_handlers=deferrable_handlers,
             prewalk_hooks=prewalk_hooks,
+            walk=walk,
         )
 
 
@@ -404,7 +407,7 @@ def pretty_print(ast, indent_str='  '):
         The string used for indentations.  Defaults to two spaces.
     """
 
-    return ''.join(chunk.text for chunk in pretty_printer(indent_str)(ast))
+    return pretty_printer(indent_str).render(ast)
 
 
 def minify_printer(
@@ -477,5 +480,5 @@ def minify_print(
         a given block).
     """
 
-    return ''.join(chunk.text for chunk in minify_printer(
-        obfuscate, obfuscate_globals, shadow_funcname, drop_semi)(ast))
+    return minify_printer(
+        obfuscate, obfuscate_globals, shadow_funcname, drop_semi).render(ast)
@@ -1178,6 +1178,13 @@ class Unparser(BaseUnparser):
             dispatcher_cls=dispatcher_cls,
         )
 
+    def render(self, node, write=None):
+        """
+        Not supported, as the extractor does not produce text.
+        """
+
+        raise NotImplementedError('the extractor does not produce text')
+
 
 def extractor(fold_ops=False, ignore_errors=False):
     """
@@ -6,8 +6,16 @@ possible.
 
 from __future__ import unicode_literals
 
+from calmjs.parse.asttypes import Elision
 from calmjs.parse.asttypes import Node
+from calmjs.parse.ruletypes import Attr
+from calmjs.parse.ruletypes import ElisionJoinAttr
+from calmjs.parse.ruletypes import ElisionToken
+from calmjs.parse.ruletypes import JoinAttr
+from calmjs.parse.ruletypes import Optional
+from calmjs.parse.ruletypes import Text
 from calmjs.parse.ruletypes import Token
+from calmjs.parse.ruletypes import is_empty
 from calmjs.parse.ruletypes import Structure
 from calmjs.parse.ruletypes import Layout
 from calmjs.parse.ruletypes import LayoutChunk
@@ -39,6 +47,29 @@ def optimize_layout_handler(rule, handler):
     return runner
 
 
+def compile_layout_trie(layout_handlers):
+    """
+    Compile the handlers for the tuples of Layout rules into a trie
+    for the matching of the suffixes of a sequence of layout rules,
+    such that the rules are followed from the last to the first.
+
+    Every node of the trie is a dict from a rule to the next node,
+    where the node that completes a key will also map None to the
+    tuple of (key, handler).
+    """
+
+    trie = {}
+    for key, handler in layout_handlers.items():
+        # like the lookup, a NotImplemented handler is not a match.
+        if not isinstance(key, tuple) or handler is NotImplemented:
+            continue
+        node = trie
+        for rule in reversed(key):
+            node = node.setdefault(rule, {})
+        node[None] = (key, handler)
+    return trie
+
+
 class Dispatcher(object):
     """
     Provide storage and lookup for the stored definitions and the
@@ -145,6 +176,7 @@ class Dispatcher(object):
         self.__token_handler = token_handler
         self.__layout_handlers = {}
         self.__layout_handlers.update(layout_handlers)
+        self.__layout_trie = compile_layout_trie(self.__layout_handlers)
         self.__deferrable_handlers = {}
         self.__deferrable_handlers.update(deferrable_handlers)
         self.__definitions = {}
@@ -221,6 +253,19 @@ class Dispatcher(object):
 
         return self.__layout_handlers.get(rule, NotImplemented)
 
+    @property
+    def token_handler(self):
+        return self.__token_handler
+
+    @property
+    def layout_trie(self):
+        """
+        The trie compiled from the handlers for the tuples of Layout
+        rules, see compile_layout_trie.
+        """
+
+        return self.__layout_trie
+
     @staticmethod
     def error_handler(exception, rule=None, node=None):
         raise exception
@@ -271,7 +316,211 @@ def walk(dispatcher, node, definition=None):
 
     nodes = []
     sourcepath_stack = [NotImplemented]
-    has_layout = dispatcher.has_layout
+    _walk = _make_walk(nodes, sourcepath_stack)
+
+    for chunk in process_chunks(dispatcher, _walk(
+            dispatcher, node, definition)):
+        yield chunk
+
+
+# The instructions for the iterative walk, which the rules are compiled
+# into based on the implementation of their __call__ method, such that
+# the subclasses which only differ by their _getattr are also included.
+ATTR = 0
+TEXT = 1
+ELISION = 2
+OPTIONAL = 3
+JOIN = 4
+ELISION_JOIN = 5
+# for every other rule, which are invoked with the recursive walk.
+CALL = 6
+
+INSTRUCTIONS = {
+    Attr.__call__: ATTR,
+    Text.__call__: TEXT,
+    ElisionToken.__call__: ELISION,
+    Optional.__call__: OPTIONAL,
+    JoinAttr.__call__: JOIN,
+    ElisionJoinAttr.__call__: ELISION_JOIN,
+}
+
+# the frames of the iterative walk.
+NODE_FRAME = 0
+JOIN_FRAME = 1
+
+
+def compile_definition(definition):
+    """
+    Compile the definition, i.e. the list of rules produced by the
+    optimize_definition method of the Dispatcher, into a list of
+    (instruction, rule) for the iterative_walk function.
+    """
+
+    return [
+        (INSTRUCTIONS.get(getattr(type(rule), '__call__', None), CALL), rule)
+        for rule in definition
+    ]
+
+
+def iterative_walk(dispatcher, node, definition=None):
+    """
+    An alternative to the walk function with the same arguments, which
+    produces identical chunks, including the handling of exceptions by
+    the error_handler of the dispatcher.
+
+    Rather than having every Token rule invoke the walk function which
+    results in a generator for every level of the tree, the standard
+    Token types from the ruletypes module (along with their subclasses
+    that do not override __call__) are compiled into instructions that
+    are executed using an explicit stack of frames, such that the cost
+    of producing every chunk no longer depends on the depth of the node
+    it was produced from, and deeply nested trees will not result in a
+    RecursionError.  Any other rules will be invoked with the standard
+    recursive walk function.
+
+    Could be used by the unparsers through the walk argument:
+
+    >>> from calmjs.parse import es5
+    >>> from calmjs.parse.unparsers.es5 import Unparser
+    >>> from calmjs.parse.unparsers.walker import iterative_walk
+    >>> unparser = Unparser(walk=iterative_walk)
+    >>> print(''.join(c.text for c in unparser(es5(u'var a = [1,,2];'))))
+    var a = [1,, 2];
+    <BLANKLINE>
+    """
+
+    nodes = []
+    sourcepath_stack = [NotImplemented]
+    _walk = _make_walk(nodes, sourcepath_stack)
+
+    for chunk in process_chunks(dispatcher, _iterative_walk(
+            dispatcher, node, definition, nodes, sourcepath_stack, _walk)):
+        yield chunk
+
+
+def _iterative_walk(
+        dispatcher, node, definition, nodes, sourcepath_stack, _walk):
+    compiled = {}
+    stack = []
+    get_optimized_definition = dispatcher.get_optimized_definition
+
+    def start(value, definition, token):
+        # Start the walk of the value, which for a node will push a new
+        # frame, otherwise the chunks for the value are returned.
+        if not isinstance(value, Node):
+            return dispatcher.token(token, nodes[-1], value, sourcepath_stack)
+
+        push = bool(value.sourcepath)
+        if push:
+            sourcepath_stack.append(value.sourcepath)
+        nodes.append(value)
+
+        if definition is None:
+            definition = get_optimized_definition(value)
+        instructions = compiled.get(id(definition))
+        if instructions is None:
+            # the definition is kept such that the id is not reused.
+            instructions = compiled[id(definition)] = (
+                definition, compile_definition(definition))
+        stack.append([NODE_FRAME, value, instructions[1], 0, push])
+
+    chunks = start(node, definition, None)
+    if chunks is not None:
+        for chunk in chunks:
+            yield chunk
+
+    while stack:
+        frame = stack[-1]
+        try:
+            if frame[0] == NODE_FRAME:
+                _, current, instructions, idx, push = frame
+                if idx == len(instructions):
+                    stack.pop()
+                    nodes.pop(-1)
+                    if push:
+                        sourcepath_stack.pop(-1)
+                    continue
+
+                frame[3] = idx + 1
+                instruction, rule = instructions[idx]
+                chunks = None
+                if instruction == ATTR:
+                    value = rule._getattr(dispatcher, current)
+                    if not is_empty(value):
+                        chunks = start(value, None, rule)
+                elif instruction == TEXT:
+                    chunks = start(rule.value, None, rule)
+                elif instruction == ELISION:
+                    chunks = start(
+                        rule.value * rule._getattr(dispatcher, current),
+                        None, rule,
+                    )
+                elif instruction == OPTIONAL:
+                    if not is_empty(getattr(current, rule.attr)):
+                        chunks = start(current, rule.value, None)
+                elif instruction == CALL:
+                    chunks = rule(_walk, dispatcher, current)
+                else:
+                    # the join frames hold the iterator for the nodes,
+                    # the list of pending walks and the previous node.
+                    stack.append([
+                        JOIN_FRAME, current, rule, instruction == JOIN,
+                        iter(rule._getattr(dispatcher, current)), [], None,
+                    ])
+            else:
+                _, current, rule, join, targets, pending, previous = frame
+                if pending:
+                    chunks = start(*pending.pop())
+                else:
+                    try:
+                        target = next(targets)
+                    except StopIteration:
+                        stack.pop()
+                        continue
+                    # the walks are pending in reverse.
+                    pending.append((target, None, rule))
+                    if previous is None:
+                        pass
+                    elif join:
+                        pending.append((
+                            current, rule.value if rule.value else (), None))
+                    else:
+                        if not isinstance(target, Elision):
+                            pending.append((current, rule.value, None))
+                        if not isinstance(previous, Elision):
+                            pending.append((rule.sep, None, None))
+                    frame[6] = target
+                    continue
+
+            if chunks is not None:
+                for chunk in chunks:
+                    yield chunk
+        except Exception as e:
+            # like the recursive walk, the exception is handled for the
+            # rule of the innermost node, and should the error handler
+            # raise, the handling is done by the node above it; the
+            # stacks of the nodes and sourcepaths are not popped for the
+            # frames that are discarded.
+            while True:
+                while stack and stack[-1][0] != NODE_FRAME:
+                    stack.pop()
+                if not stack:
+                    raise e
+                _, current, instructions, idx, push = stack[-1]
+                try:
+                    result = dispatcher.error_handler(
+                        e, rule=instructions[idx - 1][1], node=current)
+                except Exception as exc:
+                    e = exc
+                    stack.pop()
+                    continue
+                break
+            yield result
+
+
+def _make_walk(nodes, sourcepath_stack):
+    # Produce the recursive walk function that is provided to the rules,
+    # with the stacks of the nodes and the sourcepaths being shared.
 
     def _walk(dispatcher, node, definition=None, token=None):
         if not isinstance(node, Node):
@@ -299,88 +548,151 @@ def walk(dispatcher, node, definition=None):
         if push:
             sourcepath_stack.pop(-1)
 
-    # Format layout markers are not handled immediately in the walk -
-    # they will simply be buffered so that a collection of them can be
-    # handled at once.
-    def process_layouts(layout_rule_chunks, last_chunk, chunk):
-        before_text = last_chunk.text if last_chunk else None
-        after_text = chunk.text if chunk else None
-        # the text that was yielded by the previous layout handler
-        prev_text = None
-
-        # While Layout rules in a typical definition are typically
-        # interspersed with Tokens, certain assumptions with how the
-        # Layouts are specified within there will fail when Tokens fail
-        # to generate anything for any reason.  However, the dispatcher
-        # instance will be able to accept and resolve a tuple of Layouts
-        # to some handler function, so that a form of normalization can
-        # be done.  For instance, an (Indent, Newline, Dedent) can
-        # simply be resolved to no operations.  To achieve this, iterate
-        # through the layout_rule_chunks and generate a normalized form
-        # for the final handling to happen.
-
-        # the preliminary stack that will be cleared whenever a
-        # normalized layout rule chunk is generated.
-        lrcs_stack = []
-
-        # first pass: generate both the normalized/finalized lrcs.
-        for lrc in layout_rule_chunks:
-            lrcs_stack.append(lrc)
-
-            # check every single chunk from left to right...
-            for idx in range(len(lrcs_stack)):
-                rule = tuple(lrc.rule for lrc in lrcs_stack[idx:])
-                handler = dispatcher.layout(rule)
-                if handler is not NotImplemented:
-                    # not manipulating lrsc_stack from within the same
-                    # for loop that it is being iterated upon
-                    break
-            else:
-                # which continues back to the top of the outer for loop
-                continue
+    return _walk
+
+
+# Format layout markers are not handled immediately in the walk - they
+# will simply be buffered so that a collection of them can be handled
+# at once.
+def process_layouts(dispatcher, layout_rule_chunks, last_chunk, chunk):
+    return process_layout_texts(
+        dispatcher, layout_rule_chunks,
+        last_chunk.text if last_chunk else None,
+        chunk.text if chunk else None,
+    )
+
+
+def process_layout_texts(
+        dispatcher, layout_rule_chunks, before_text, after_text):
+    # the text that was yielded by the previous layout handler
+    prev_text = None
+
+    # While Layout rules in a typical definition are typically
+    # interspersed with Tokens, certain assumptions with how the Layouts
+    # are specified within there will fail when Tokens fail to generate
+    # anything for any reason.  However, the dispatcher instance will be
+    # able to accept and resolve a tuple of Layouts to some handler
+    # function, so that a form of normalization can be done.  For
+    # instance, an (Indent, Newline, Dedent) can simply be resolved to
+    # no operations.  To achieve this, iterate through the
+    # layout_rule_chunks and generate a normalized form for the final
+    # handling to happen.
+
+    # the preliminary stack that will be cleared whenever a normalized
+    # layout rule chunk is generated.
+    lrcs_stack = []
+    trie = dispatcher.layout_trie
+
+    # first pass: generate both the normalized/finalized lrcs.
+    for lrc in layout_rule_chunks:
+        lrcs_stack.append(lrc)
+
+        # follow the trie from the right for the longest suffix of the
+        # stack with a handler, i.e. the one with the lowest idx.
+        node = trie
+        match = None
+        idx = len(lrcs_stack)
+        while idx:
+            node = node.get(lrcs_stack[idx - 1].rule)
+            if node is None:
+                break
+            idx -= 1
+            if None in node:
+                match = idx, node[None]
+
+        if match is None:
+            continue
+
+        # So a handler is found from inside the rules; extend the chunks
+        # from the stack that didn't get normalized, and generate a new
+        # layout rule chunk.
+        idx, (rule, handler) = match
+        lrcs_stack[idx:] = [LayoutChunk(
+            rule, handler,
+            layout_rule_chunks[idx].node,
+        )]
+
+    # second pass: now the processing can be done.
+    for lr_chunk in lrcs_stack:
+        gen = lr_chunk.handler(
+            dispatcher, lr_chunk.node, before_text, after_text, prev_text)
+        if not gen:
+            continue
+        for chunk_from_layout in gen:
+            yield chunk_from_layout
+            prev_text = chunk_from_layout.text
+
+
+def process_chunks(dispatcher, chunks):
+    """
+    The top level processing of the chunks produced by the inner walk
+    of the walk functions, where the LayoutChunk are buffered and then
+    handled together by process_layouts before the next chunk.
+    """
 
-            # So a handler is found from inside the rules; extend the
-            # chunks from the stack that didn't get normalized, and
-            # generate a new layout rule chunk.
-            lrcs_stack[:] = lrcs_stack[:idx]
-            lrcs_stack.append(LayoutChunk(
-                rule, handler,
-                layout_rule_chunks[idx].node,
-            ))
-
-        # second pass: now the processing can be done.
-        for lr_chunk in lrcs_stack:
-            gen = lr_chunk.handler(
-                dispatcher, lr_chunk.node, before_text, after_text, prev_text)
-            if not gen:
-                continue
-            for chunk_from_layout in gen:
-                yield chunk_from_layout
-                prev_text = chunk_from_layout.text
-
-    # The top level walker implementation
-    def walk():
-        last_chunk = None
-        layout_rule_chunks = []
-
-        for chunk in _walk(dispatcher, node, definition):
-            if isinstance(chunk, LayoutChunk):
-                layout_rule_chunks.append(chunk)
-            else:
-                if has_layout:
-                    # process layout rule chunks that had been cached.
-                    for chunk_from_layout in process_layouts(
-                            layout_rule_chunks, last_chunk, chunk):
-                        yield chunk_from_layout
-                layout_rule_chunks[:] = []
-                yield chunk
-                last_chunk = chunk
-
-        if has_layout:
-            # process the remaining layout rule chunks.
-            for chunk_from_layout in process_layouts(
-                    layout_rule_chunks, last_chunk, None):
-                yield chunk_from_layout
-
-    for chunk in walk():
-        yield chunk
+    has_layout = dispatcher.has_layout
+    last_chunk = None
+    layout_rule_chunks = []
+
+    for chunk in chunks:
+        if isinstance(chunk, LayoutChunk):
+            layout_rule_chunks.append(chunk)
+        else:
+            if has_layout:
+                # process layout rule chunks that had been cached.
+                for chunk_from_layout in process_layouts(
+                        dispatcher, layout_rule_chunks, last_chunk, chunk):
+                    yield chunk_from_layout
+            layout_rule_chunks[:] = []
+            yield chunk
+            last_chunk = chunk
+
+    if has_layout:
+        # process the remaining layout rule chunks.
+        for chunk_from_layout in process_layouts(
+                dispatcher, layout_rule_chunks, last_chunk, None):
+            yield chunk_from_layout
+
+
+class TextWriter(object):
+    """
+    The counterpart of process_chunks for the rendering of text only,
+    where the text of the tokens is provided directly, and the text of
+    every chunk is passed to the write function.
+    """
+
+    def __init__(self, dispatcher, write):
+        self.dispatcher = dispatcher
+        self.write = write
+        self.has_layout = dispatcher.has_layout
+        self.layout_rule_chunks = []
+        self.layout = self.layout_rule_chunks.append
+        self.last_text = None
+
+    def flush(self, text):
+        # process layout rule chunks that had been cached.
+        if self.has_layout:
+            for chunk in process_layout_texts(
+                    self.dispatcher, self.layout_rule_chunks,
+                    self.last_text, text):
+                self.write(chunk.text)
+        self.layout_rule_chunks[:] = []
+
+    def text(self, text):
+        if self.layout_rule_chunks:
+            self.flush(text)
+        self.write(text)
+        self.last_text = text
+
+    def chunk(self, chunk):
+        if isinstance(chunk, LayoutChunk):
+            self.layout(chunk)
+        else:
+            self.text(chunk.text)
+
+    def close(self):
+        """
+        Process the remaining layout rule chunks.
+        """
+
+        self.flush(None)
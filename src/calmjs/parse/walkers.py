@@ -5,9 +5,16 @@ Generic walkers.
 
 from __future__ import unicode_literals
 
+from time import perf_counter
+
 from calmjs.parse.asttypes import Node
+from calmjs.parse.flat import FlatNode
 from calmjs.parse.utils import repr_compat
 
+# the value for the conditions to return to skip the descendants of the
+# node provided.
+PRUNE = object()
+
 
 class Walker(object):
     """
@@ -59,37 +66,77 @@ class Walker(object):
     Traceback (most recent call last):
     ...
     TypeError: no match found
+
+    The condition may also return PRUNE to skip over the descendants of
+    the node provided.
+
+    >>> from calmjs.parse.asttypes import FuncDecl
+    >>> from calmjs.parse.walkers import PRUNE
+    >>> def outside_function(node):
+    ...     return PRUNE if isinstance(node, FuncDecl) else assignment(node)
+    ...
+    >>> len(list(walker.filter(tree, outside_function)))
+    0
     """
 
+    def _children(self, node):
+        # return the children of the node in reverse, for the stacks.
+        if isinstance(node, FlatNode):
+            tree = node.tree
+            return [FlatNode(tree, idx) for idx in reversed(
+                tree.children(node.index))]
+        return [
+            child for child in reversed(node.children()) if child is not None]
+
     def walk(self, node, condition=None):
         """
-        Simply walk through the entire node; condition argument is
-        ignored.
+        Simply walk through the entire node, yielding every descendant
+        in pre-order.  The condition argument is optional; if provided,
+        the descendants of every node that it returns PRUNE for will be
+        skipped.  A FlatNode will be walked through its tree by the node
+        ids, and the nodes yielded will also be FlatNode.
+
+        The walk is done using an explicit stack, so the depth of the
+        tree is not limited by the recursion limit.
         """
 
-        if not isinstance(node, Node):
+        if isinstance(node, FlatNode) and condition is None:
+            for idx in node.tree.walk(node.index):
+                yield FlatNode(node.tree, idx)
+            return
+
+        if not isinstance(node, (Node, FlatNode)):
             raise TypeError('not a node')
 
-        for child in node:
+        children = self._children
+        stack = children(node)
+        while stack:
+            child = stack.pop()
             yield child
-            for subchild in self.walk(child, condition):
-                yield subchild
+            if condition is None or condition(child) is not PRUNE:
+                stack.extend(children(child))
 
     def filter(self, node, condition):
         """
         This method accepts a node and the condition function; a
         generator will be returned to yield the nodes that got matched
-        by the condition.
+        by the condition.  Should the condition return PRUNE for a node,
+        it will not be yielded and its descendants will be skipped.
         """
 
-        if not isinstance(node, Node):
+        if not isinstance(node, (Node, FlatNode)):
             raise TypeError('not a node')
 
-        for child in node:
-            if condition(child):
+        children = self._children
+        stack = children(node)
+        while stack:
+            child = stack.pop()
+            result = condition(child)
+            if result is PRUNE:
+                continue
+            if result:
                 yield child
-            for subchild in self.filter(child, condition):
-                yield subchild
+            stack.extend(children(child))
 
     def extract(self, node, condition, skip=0):
         """
@@ -201,6 +248,297 @@ class ReprWalker(object):
         return self.walk(node, indent=indent, depth=depth, pos=pos)
 
 
+class TreeIndex(object):
+    """
+    An index of every node in a tree, built in a single walk, which
+    records the nodes by their types along with the parent and depth of
+    every node, such that repeated queries against the same tree (e.g.
+    finding the enclosing function of an identifier) will not walk
+    through the entire tree again.  The tree must not be modified while
+    the index is in use.
+
+    Example usage:
+
+    >>> from calmjs.parse.asttypes import FunctionCall
+    >>> from calmjs.parse.asttypes import Identifier
+    >>> from calmjs.parse.parsers.es5 import parse
+    >>> from calmjs.parse.walkers import TreeIndex
+    >>> tree = parse(u'var a = f(g(b));')
+    >>> index = TreeIndex(tree)
+    >>> calls = index.of_type(FunctionCall)
+    >>> [call.identifier.value for call in calls]
+    ['f', 'g']
+    >>> [type(node).__name__ for node in index.ancestors(calls[1])]
+    ['Arguments', 'FunctionCall', 'VarDecl', 'VarStatement', 'ES5Program']
+    >>> index.parent(calls[1]) is calls[0].args
+    True
+    >>> index.depth(calls[1])
+    5
+    >>> index.enclosing(calls[1], FunctionCall) is calls[0]
+    True
+    >>> len(index.path_to(calls[1]))
+    6
+    >>> [node.value for node in index.of_type('Identifier')]
+    ['a', 'f', 'g', 'b']
+
+    The names of the base classes may also be used, such as ``FuncBase``
+    for both the function declarations and expressions.
+
+    >>> tree = parse(u'var x = function() { return a; };')
+    >>> index = TreeIndex(tree)
+    >>> a = index.of_type('Identifier')[-1]
+    >>> print(a.value)
+    a
+    >>> type(index.enclosing(a, 'FuncBase')).__name__
+    'FuncExpr'
+    """
+
+    def __init__(self, node):
+        if not isinstance(node, Node):
+            raise TypeError('not a node')
+
+        self.root = node
+        # the nodes of every type in pre-order.
+        self.types = {}
+        # the (parent, depth, order) for every node, keyed by its id, as
+        # nodes are not necessarily hashable.
+        self.nodes = {}
+        self._of_type = {}
+
+        stack = [(node, None, 0)]
+        while stack:
+            current, parent, depth = stack.pop()
+            self.nodes[id(current)] = (parent, depth, len(self.nodes))
+            self.types.setdefault(type(current), []).append(current)
+            stack.extend(
+                (child, current, depth + 1)
+                for child in reversed(current.children()) if child is not None
+            )
+
+    def _info(self, node):
+        try:
+            return self.nodes[id(node)]
+        except KeyError:
+            raise ValueError('%r is not in the index' % (node,))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, node):
+        return id(node) in self.nodes
+
+    def of_type(self, cls):
+        """
+        Return the list of nodes that are instances of the provided
+        class, or of the classes with the provided name or with a base
+        class of the provided name, in pre-order.
+        """
+
+        if cls not in self._of_type:
+            if isinstance(cls, type):
+                lists = [nodes for key, nodes in self.types.items()
+                         if issubclass(key, cls)]
+            else:
+                lists = [nodes for key, nodes in self.types.items()
+                         if any(base.__name__ == cls for base in key.__mro__)]
+            result = [node for nodes in lists for node in nodes]
+            if len(lists) > 1:
+                result.sort(key=lambda node: self.nodes[id(node)][2])
+            self._of_type[cls] = result
+        return list(self._of_type[cls])
+
+    def parent(self, node):
+        """
+        Return the parent of the node, or None for the root.
+        """
+
+        return self._info(node)[0]
+
+    def depth(self, node):
+        """
+        Return the depth of the node, where the root is at 0.
+        """
+
+        return self._info(node)[1]
+
+    def ancestors(self, node):
+        """
+        Return the list of ancestors for the node, starting from its
+        parent up to the root.
+        """
+
+        result = []
+        parent = self.parent(node)
+        while parent is not None:
+            result.append(parent)
+            parent = self.nodes[id(parent)][0]
+        return result
+
+    def enclosing(self, node, cls):
+        """
+        Return the nearest ancestor of the node that is an instance of
+        the provided class, or of a class with the provided name or with
+        a base class of the provided name, or None if there are no such
+        ancestors.
+        """
+
+        parent = self.parent(node)
+        while parent is not None:
+            if (isinstance(parent, cls) if isinstance(cls, type) else any(
+                    base.__name__ == cls for base in type(parent).__mro__)):
+                return parent
+            parent = self.nodes[id(parent)][0]
+        return None
+
+    def path_to(self, node):
+        """
+        Return the list of nodes from the root down to the node.
+        """
+
+        result = self.ancestors(node)
+        result.reverse()
+        result.append(node)
+        return result
+
+
+class MultiVisitor(object):
+    """
+    Run any number of visitors through a tree in a single walk.
+
+    A visitor may be any object, which provides the callbacks for the
+    types of nodes it is interested in as methods named ``enter_`` or
+    ``leave_`` followed by the name of the class of the node, or of any
+    of its base classes (e.g. ``enter_FuncBase`` will be invoked for
+    both ``FuncDecl`` and ``FuncExpr``, with the most specific method
+    being selected).  The enter callbacks are invoked in pre-order, and
+    the leave callbacks after all the descendants of the node have been
+    visited, with the node as the only argument.  Should an enter
+    callback return PRUNE, the descendants of the node will be skipped
+    for that visitor.
+
+    The callbacks of every visitor are looked up once for each class of
+    nodes by its name, much like how the Dispatcher looks up the
+    definitions for the nodes.  The visitors are invoked in the order
+    they were registered.
+
+    If timing is enabled, the total time spent inside the callbacks of
+    every visitor will be accumulated in the list of timings.
+
+    Example usage:
+
+    >>> from calmjs.parse.parsers.es5 import parse
+    >>> from calmjs.parse.walkers import MultiVisitor
+    >>> class Calls(object):
+    ...     def __init__(self):
+    ...         self.names = []
+    ...     def enter_FunctionCall(self, node):
+    ...         self.names.append(node.identifier.value)
+    ...
+    >>> class Functions(object):
+    ...     count = 0
+    ...     def enter_FuncBase(self, node):
+    ...         self.count += 1
+    ...
+    >>> calls, functions = Calls(), Functions()
+    >>> visitor = MultiVisitor([calls, functions])
+    >>> visitor.visit(parse(u'f(function() { g(); });'))
+    >>> calls.names
+    ['f', 'g']
+    >>> functions.count
+    1
+    """
+
+    def __init__(self, visitors=(), timing=False):
+        self.visitors = []
+        self.timing = timing
+        self.timings = []
+        self._callbacks = {}
+        for visitor in visitors:
+            self.register(visitor)
+
+    def register(self, visitor):
+        """
+        Register a visitor.
+        """
+
+        self.visitors.append(visitor)
+        self.timings.append(0.0)
+        self._callbacks.clear()
+
+    def get_callbacks(self, node):
+        """
+        Return the lists of (visitor index, callback) for the enter and
+        the leave callbacks for the node.
+        """
+
+        key = node.__class__.__name__
+        callbacks = self._callbacks.get(key)
+        if callbacks is None:
+            names = [cls.__name__ for cls in node.__class__.__mro__]
+            callbacks = self._callbacks[key] = ([], [])
+            for idx, visitor in enumerate(self.visitors):
+                for prefix, target in zip(('enter_', 'leave_'), callbacks):
+                    for name in names:
+                        callback = getattr(visitor, prefix + name, None)
+                        if callback is not None:
+                            target.append((idx, callback))
+                            break
+        return callbacks
+
+    def _call(self, idx, callback, node):
+        if not self.timing:
+            return callback(node)
+        start = perf_counter()
+        try:
+            return callback(node)
+        finally:
+            self.timings[idx] += perf_counter() - start
+
+    def visit(self, node):
+        """
+        Visit the tree from the provided node (inclusive) with all the
+        registered visitors.
+        """
+
+        if not isinstance(node, Node):
+            raise TypeError('not a node')
+
+        call = self._call
+        get_callbacks = self.get_callbacks
+        total = len(self.visitors)
+        # the depth of the node each visitor has pruned, if any.
+        pruned = {}
+        stack = [(node, 0, False)]
+        while stack:
+            current, depth, leaving = stack.pop()
+            enter, leave = get_callbacks(current)
+            if leaving:
+                for idx, callback in leave:
+                    if pruned.get(idx, depth) >= depth:
+                        call(idx, callback, current)
+                for idx in [
+                        idx for idx, value in pruned.items()
+                        if value == depth]:
+                    del pruned[idx]
+                continue
+
+            pruning = False
+            for idx, callback in enter:
+                if idx not in pruned and (
+                        call(idx, callback, current) is PRUNE):
+                    pruned[idx] = depth
+                    pruning = True
+            # only revisit the node if there are things to do.
+            if leave or pruning:
+                stack.append((current, depth, True))
+            if len(pruned) < total:
+                stack.extend(
+                    (child, depth + 1, False)
+                    for child in reversed(current.children())
+                    if child is not None
+                )
+
+
 def walk(node):
     """
     Walk through every node and yield the result